@@ -0,0 +1,136 @@
+"""
+A small, self-contained card database for the benchmark suite.
+
+The schema comes from `scripts/create_db.py`; the cards below are a compact stand-in
+for the Base Set monsters used by `main.py` and `core/carddata.py`.
+"""
+import contextlib
+import io
+import os
+import sqlite3
+import sys
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, os.path.join(ROOT_DIR, "scripts"))
+sys.path.insert(0, os.path.join(ROOT_DIR, "src"))
+
+import create_db  # noqa: E402
+
+FIXTURE_SET_CODE = "BS"
+
+# title, stage, health, retreat, type, weakness, resistance, evolves_from, attacks
+# Each attack is (title, damage, costs, effects); effects are
+# (effect_name, target, value, condition).
+FIXTURE_CARDS = [
+    ("Bulbasaur", "BASIC", 40, 1, "GRASS", ("FIRE", "x2"), None, None, [
+        ("Leech Seed", "20", {}, [("HEAL", "SELF", "10", "ONLY_IF_ATTACK_SUCCESSFUL")]),
+    ]),
+    ("Ivysaur", "STAGEONE", 60, 1, "GRASS", ("FIRE", "x2"), None, "Bulbasaur", [
+        ("Vine Whip", "30", {}, []),
+        ("Poisonpowder", "20", {"GRASS": 3}, [("APPLY_STATUS", "DEFENDING_MONSTER", "POISONED", "ALWAYS")]),
+    ]),
+    ("Venusaur", "STAGETWO", 100, 2, "GRASS", ("FIRE", "x2"), None, "Ivysaur", [
+        ("Solarbeam", "60", {"GRASS": 4}, []),
+    ]),
+    ("Charmander", "BASIC", 50, 1, "FIRE", ("WATER", "x2"), None, None, [
+        ("Scratch", "10", {}, []),
+        ("Ember", "30", {"FIRE": 1, "COLORLESS": 1}, []),
+    ]),
+    ("Charmeleon", "STAGEONE", 80, 1, "FIRE", ("WATER", "x2"), None, "Charmander", [
+        ("Slash", "30", {}, []),
+        ("Flamethrower", "50", {"FIRE": 2, "COLORLESS": 1}, []),
+    ]),
+    ("Charizard", "STAGETWO", 120, 3, "FIRE", ("WATER", "x2"), ("FIGHTING", "-30"), "Charmeleon", [
+        ("Fire Spin", "100", {"FIRE": 4}, []),
+    ]),
+    ("Pikachu", "BASIC", 40, 1, "LIGHTNING", ("FIGHTING", "x2"), None, None, [
+        ("Gnaw", "10", {}, []),
+        ("Thunder Jolt", "30", {"LIGHTNING": 1, "COLORLESS": 1}, [("DAMAGE_SELF", "SELF", "10", "ON_COIN_FLIP_TAILS")]),
+    ]),
+    ("Raichu", "STAGEONE", 80, 1, "LIGHTNING", ("FIGHTING", "x2"), None, "Pikachu", [
+        ("Agility", "20", {}, [("SET_IMMUNE", "SELF", None, "ON_COIN_FLIP_HEADS")]),
+    ]),
+    ("Clefairy", "BASIC", 40, 1, "COLORLESS", ("FIGHTING", "x2"), ("PSYCHIC", "-30"), None, [
+        ("Sing", "0", {}, [("APPLY_STATUS", "DEFENDING_MONSTER", "ASLEEP", "ON_COIN_FLIP_HEADS")]),
+        ("Metronome", "0", {"COLORLESS": 3}, [("COPY_ATTACK", "DEFENDING_MONSTER", None, "ALWAYS")]),
+    ]),
+    ("Hitmonchan", "BASIC", 70, 2, "FIGHTING", ("PSYCHIC", "x2"), None, None, [
+        ("Jab", "20", {}, []),
+        ("Special Punch", "40", {"FIGHTING": 2, "COLORLESS": 1}, []),
+    ]),
+    ("Zapdos", "BASIC", 90, 3, "LIGHTNING", None, ("FIGHTING", "-30"), None, [
+        ("Thunder", "60", {}, [("DAMAGE_SELF", "SELF", "30", "ON_COIN_FLIP_TAILS")]),
+    ]),
+]
+
+FIXTURE_TITLES = [card[0] for card in FIXTURE_CARDS]
+
+
+def _insert_card(cursor, card) -> None:
+    """Inserts one fixture card and its related rows."""
+    title, stage, health, retreat, mana_type, weakness, resistance, evolves_from, attacks = card
+    cursor.execute(
+        "INSERT INTO cards (title, card_type, subtype, set_code) VALUES (?, ?, ?, ?)",
+        (title, "MONSTER", "", FIXTURE_SET_CODE),
+    )
+    card_id = cursor.lastrowid
+    cursor.execute(
+        "INSERT INTO monsters (card_id, stage, health, retreat_cost) VALUES (?, ?, ?, ?)",
+        (card_id, stage, health, retreat),
+    )
+    cursor.execute(
+        "INSERT INTO monster_types (card_id, mana_type) VALUES (?, ?)", (card_id, mana_type)
+    )
+    if weakness:
+        cursor.execute(
+            "INSERT INTO monster_weaknesses (card_id, mana_type, modifier) VALUES (?, ?, ?)",
+            (card_id, *weakness),
+        )
+    if resistance:
+        cursor.execute(
+            "INSERT INTO monster_resistances (card_id, mana_type, modifier) VALUES (?, ?, ?)",
+            (card_id, *resistance),
+        )
+    if evolves_from:
+        cursor.execute(
+            "INSERT INTO monster_evolutions (card_id, evolves_from_name) VALUES (?, ?)",
+            (card_id, evolves_from),
+        )
+    for attack_title, damage, costs, effects in attacks:
+        cursor.execute(
+            "INSERT INTO attacks (card_id, title, damage, description) VALUES (?, ?, ?, ?)",
+            (card_id, attack_title, damage, ""),
+        )
+        attack_id = cursor.lastrowid
+        for cost_type, quantity in costs.items():
+            cursor.execute(
+                "INSERT INTO attack_costs (attack_id, mana_type, quantity) VALUES (?, ?, ?)",
+                (attack_id, cost_type, quantity),
+            )
+        for order, (effect_name, target, value, condition) in enumerate(effects, start=1):
+            cursor.execute(
+                """INSERT INTO effects (source_card_id, source_attack_id, effect_name, target, value, condition, execution_order)
+                VALUES (?, ?, ?, ?, ?, ?, ?)""",
+                (card_id, attack_id, effect_name, target, value, condition, order),
+            )
+
+
+def build_fixture_db(db_path: str) -> str:
+    """
+    Creates the fixture card database at `db_path`, replacing any existing file.
+
+    Returns:
+        The path of the created database.
+    """
+    if os.path.exists(db_path):
+        os.remove(db_path)
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    # create_db.py reports each table it creates; keep benchmark output clean.
+    with contextlib.redirect_stdout(io.StringIO()):
+        create_db.create_schema(cursor)
+    for card in FIXTURE_CARDS:
+        _insert_card(cursor, card)
+    conn.commit()
+    conn.close()
+    return db_path
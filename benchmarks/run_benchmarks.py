@@ -0,0 +1,297 @@
+"""
+Benchmark suite for the engine's hot paths.
+
+Usage:
+    python benchmarks/run_benchmarks.py                  # run and compare to the baseline
+    python benchmarks/run_benchmarks.py --save-baseline  # run and store a new baseline
+    python benchmarks/run_benchmarks.py --check          # fail if there is no baseline
+    python benchmarks/run_benchmarks.py --quick --only legal_actions_midgame
+
+Results are written as JSON (`--output`). When a baseline exists, every benchmark whose
+median time per operation exceeds the baseline by more than `--tolerance` is reported as
+a regression and the script exits with status 1. Timings depend on the machine, so no
+baseline is checked in: record one with `--save-baseline` on the machine that runs the
+comparison. Without one, the run warns that nothing was compared, and with `--check` it
+exits with status 2.
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+from fixtures import FIXTURE_TITLES, ROOT_DIR, build_fixture_db
+
+from core.card_factory import generate_deck_from_list
+from core.carddata import BS_FIRE_ENERGY_98, BS_GRASS_ENERGY_99, BS_LIGHTNING_ENERGY_100
+from core.enums import StageType
+from database.card_repository import CardRepository
+from models.mana import ManaCard, ManaTemplate
+from models.player import PlayerUnit
+from simulation.env import BlackstarEnv
+from simulation.headless import create_game, play_game
+from simulation.perft import Perft
+
+DEFAULT_OUTPUT = os.path.join(ROOT_DIR, "bench_results.json")
+DEFAULT_BASELINE = os.path.join(ROOT_DIR, "benchmarks", "baseline.json")
+DEFAULT_TOLERANCE = 0.15
+
+DECK_SIZE = 60
+HEADLESS_MAX_TURNS = 100
+PERFT_DEPTH = 2
+
+
+def sample_deck(rng: random.Random) -> list:
+    """Returns a 60-card list of fixture titles."""
+    return [rng.choice(FIXTURE_TITLES) for _ in range(DECK_SIZE)]
+
+
+def build_midgame_state(card_repo: CardRepository):
+    """
+    Builds a representative mid-game board: both actives set with attached mana, a full
+    bench for the current player, and a hand mixing evolutions, basics and mana cards.
+    """
+    rng = random.Random(7)
+    game_state = create_game(sample_deck(rng), sample_deck(rng), card_repo=card_repo, seed=7)
+    mana_templates = [
+        ManaTemplate(**data)
+        for data in (BS_FIRE_ENERGY_98, BS_GRASS_ENERGY_99, BS_LIGHTNING_ENERGY_100)
+    ]
+
+    for player in (game_state.player1, game_state.player2):
+        # Pull every monster back into the deck so the board is built deterministically.
+        player.return_hand_to_deck()
+        basics = [c for c in player.deck.values() if c.card.stage == StageType.BASIC]
+        player.active_monster = basics[0]
+        for monster in basics[1 : 1 + player.CONST_MAX_BENCH_CARDS]:
+            player.bench[monster.id] = monster
+        for monster in [player.active_monster, *player.bench.values()]:
+            del player.deck[monster.id]
+            for template in mana_templates:
+                mana_card = ManaCard(template)
+                monster.attached_mana[mana_card.id] = mana_card
+        player.draw_from_deck(7)
+        for template in mana_templates:
+            player.add_to_hand(ManaCard(template))
+
+    game_state.turn_count = 3
+    return game_state
+
+
+def measure(func, number: int, repeat: int) -> dict:
+    """Times `func` and returns per-operation statistics in microseconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter() - start) / number * 1e6)
+    return {
+        "median_us": statistics.median(timings),
+        "min_us": min(timings),
+        "mean_us": statistics.fmean(timings),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def define_benchmarks(card_repo: CardRepository) -> dict:
+    """
+    Returns `{name: (setup, number)}`, where `setup()` returns the callable to time.
+    """
+    rng = random.Random(1234)
+    deck_list = sample_deck(rng)
+
+    def deck_construction():
+        def run():
+            generate_deck_from_list(deck_list, PlayerUnit(), card_repo=card_repo)
+        return run
+
+    def legal_actions_opening():
+        game_state = create_game(deck_list, sample_deck(rng), card_repo=card_repo, seed=11)
+        player = game_state.current_player
+        return lambda: game_state.get_legal_actions(player)
+
+    def legal_actions_midgame():
+        game_state = build_midgame_state(card_repo)
+        player = game_state.current_player
+        return lambda: game_state.get_legal_actions(player)
+
+    def attack_execute():
+        game_state = build_midgame_state(card_repo)
+        attacker = game_state.current_player
+        defender = game_state.waiting_player
+        attack = attacker.active_monster.card.attacks[0]
+        target = defender.active_monster
+
+        def run():
+            target.health = target.card.health
+            target.is_immune = False
+            target.special_conditions = {}
+            attack.execute(game_state, attacker, defender, None)
+        return run
+
+    def next_turn():
+        game_state = build_midgame_state(card_repo)
+        return game_state.next_turn
+
+    def shuffle_deck():
+        player = PlayerUnit()
+        generate_deck_from_list(deck_list, player, card_repo=card_repo)
+        player.initialize_deck()
+        return player.shuffle_deck
+
+    def draw_from_deck():
+        player = PlayerUnit()
+        generate_deck_from_list(deck_list, player, card_repo=card_repo)
+        player.initialize_deck()
+
+        # Draw an opening hand and put it back, so the deck never runs dry.
+        def run():
+            player.draw_from_deck(7)
+            player.return_hand_to_deck()
+        return run
+
+    def env_step():
+        env = BlackstarEnv(deck_list, deck_list, card_repo=card_repo, max_turns=HEADLESS_MAX_TURNS)
+        step_rng = random.Random(5)
+        seeds = iter(range(10**9))
+        _, info = env.reset(seed=next(seeds))
+
+        # Random legal actions. Finished episodes are reset in place, so the reset cost
+        # (deck construction) is amortized over the steps of each episode.
+        def run():
+            nonlocal info
+            legal = info["action_mask"].nonzero()[0]
+            _, _, terminated, truncated, info = env.step(legal[step_rng.randrange(len(legal))])
+            if terminated or truncated:
+                _, info = env.reset(seed=next(seeds))
+        return run
+
+    def perft_midgame():
+        # Every action sequence of two plies: move generation, snapshots and commands.
+        game_state = build_midgame_state(card_repo)
+        perft = Perft(seed=3)
+        return lambda: perft.count(game_state, PERFT_DEPTH)
+
+    def headless_game():
+        seeds = iter(range(10**9))
+
+        def run():
+            play_game(
+                deck_list,
+                deck_list,
+                card_repo=card_repo,
+                seed=next(seeds),
+                max_turns=HEADLESS_MAX_TURNS,
+            )
+        return run
+
+    return {
+        "deck_construction": (deck_construction, 5),
+        "legal_actions_opening": (legal_actions_opening, 2000),
+        "legal_actions_midgame": (legal_actions_midgame, 1000),
+        "attack_execute": (attack_execute, 2000),
+        "next_turn": (next_turn, 2000),
+        "shuffle_deck": (shuffle_deck, 2000),
+        "draw_from_deck": (draw_from_deck, 2000),
+        "env_step": (env_step, 500),
+        "perft_midgame": (perft_midgame, 3),
+        "headless_game": (headless_game, 3),
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """
+    Compares results against a baseline.
+
+    Returns:
+        A list of `(name, ratio)` for every benchmark slower than the tolerance allows.
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        ratio = result["median_us"] / base["median_us"]
+        result["baseline_median_us"] = base["median_us"]
+        result["ratio"] = ratio
+        if ratio > 1 + tolerance:
+            regressions.append((name, ratio))
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run the engine benchmark suite.")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Where to write JSON results.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON to compare with.")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the baseline.")
+    parser.add_argument("--check", action="store_true",
+                        help="Exit with status 2 if there is no baseline to compare with.")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed slowdown before flagging a regression (0.15 = 15%%).")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing rounds per benchmark.")
+    parser.add_argument("--quick", action="store_true", help="Run a tenth of the iterations.")
+    parser.add_argument("--only", nargs="*", help="Run only the named benchmarks.")
+    args = parser.parse_args()
+
+    # The engine logs every action; keep logging out of the measurements.
+    logging.disable(logging.CRITICAL)
+    random.seed(1234)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        card_repo = CardRepository(build_fixture_db(os.path.join(tmp_dir, "cards.db")))
+        benchmarks = define_benchmarks(card_repo)
+        selected = args.only or list(benchmarks)
+
+        results = {}
+        for name in selected:
+            setup, number = benchmarks[name]
+            number = max(1, number // 10) if args.quick else number
+            results[name] = measure(setup(), number, args.repeat)
+            print(f"{name:<24} {results[name]['median_us']:>12.2f} us/op")
+        card_repo.conn.close()
+
+    regressions = []
+    missing_baseline = not args.save_baseline and not os.path.exists(args.baseline)
+    if missing_baseline:
+        print(
+            f"WARNING: no baseline at '{args.baseline}'; nothing was compared. "
+            "Record one with --save-baseline.",
+            file=sys.stderr,
+        )
+    elif not args.save_baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f)["results"], args.tolerance)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "quick": args.quick,
+        },
+        "results": results,
+        "regressions": [name for name, _ in regressions],
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to '{args.baseline}'.")
+
+    for name, ratio in regressions:
+        print(f"REGRESSION: {name} is {ratio:.2f}x the baseline median.")
+    if missing_baseline and args.check:
+        return 2
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,460 @@
+import argparse
+import csv
+import json
+import os
+import sqlite3
+import sys
+import time
+from itertools import islice
+
+DB_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "cards.db")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from core.enums import ManaType, StageType  # noqa: E402
+from effects.effect_registry import EffectRegistry  # noqa: E402
+
+CARD_TYPES = ("MONSTER", "UTILITY", "MANA")
+MANA_TYPES = frozenset(mana_type.name for mana_type in ManaType)
+STAGES = frozenset(stage.name for stage in StageType)
+DEFAULT_BATCH_SIZE = 500
+
+# In CSV files, these columns hold JSON text and these hold ';'-separated values.
+CSV_JSON_COLUMNS = ("prints", "pokedex", "weaknesses", "resistances", "abilities", "attacks", "effects")
+CSV_LIST_COLUMNS = ("types", "evolves_from")
+
+# Pragmas applied for the duration of a load, and restored afterwards.
+LOAD_PRAGMAS = {
+    "synchronous": "OFF",
+    "journal_mode": "MEMORY",
+    "temp_store": "MEMORY",
+    "cache_size": "-65536",  # 64 MiB
+}
+
+# Insert statements in foreign-key order. Row tuples follow the column order given here.
+INSERTS = {
+    "cards": "INSERT INTO cards (id, title, card_type, subtype, set_code) VALUES (?, ?, ?, ?, ?)",
+    "card_prints": "INSERT INTO card_prints (card_id, set_code, set_number, illustrator, rarity) VALUES (?, ?, ?, ?, ?)",
+    "pokedex_entries": """INSERT INTO pokedex_entries (card_id, level, dex_number, species, height_ft_in, height_m, weight_lbs, weight_kg, dex_entry)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+    "monsters": "INSERT INTO monsters (card_id, stage, health, retreat_cost) VALUES (?, ?, ?, ?)",
+    "monster_evolutions": "INSERT INTO monster_evolutions (card_id, evolves_from_name) VALUES (?, ?)",
+    "monster_types": "INSERT INTO monster_types (card_id, mana_type) VALUES (?, ?)",
+    "monster_weaknesses": "INSERT INTO monster_weaknesses (card_id, mana_type, modifier) VALUES (?, ?, ?)",
+    "monster_resistances": "INSERT INTO monster_resistances (card_id, mana_type, modifier) VALUES (?, ?, ?)",
+    "monster_abilities": "INSERT INTO monster_abilities (id, card_id, name, type, description) VALUES (?, ?, ?, ?, ?)",
+    "attacks": "INSERT INTO attacks (id, card_id, title, damage, description) VALUES (?, ?, ?, ?, ?)",
+    "attack_costs": "INSERT INTO attack_costs (attack_id, mana_type, quantity) VALUES (?, ?, ?)",
+    "effects": """INSERT INTO effects (source_card_id, source_attack_id, source_ability_id, effect_name, target, value, condition, execution_order)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+    "mana_cards": "INSERT INTO mana_cards (card_id, mana_type) VALUES (?, ?)",
+}
+
+# Tables whose IDs are referenced by other rows, so the importer assigns them up front.
+ID_TABLES = ("cards", "monster_abilities", "attacks")
+
+
+#! READING
+def read_jsonl(path: str):
+    """Yields `(line_number, record)` for every non-blank line of a JSON Lines file."""
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield line_number, json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_number, ValueError(f"invalid JSON: {e.msg}")
+
+
+def read_csv(path: str):
+    """
+    Yields `(line_number, record)` for every row of a CSV file with a header row.
+    Nested columns (see `CSV_JSON_COLUMNS`) hold JSON; list columns hold ';'-separated values.
+    """
+    with open(path, encoding="utf-8", newline="") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            record = {key: value for key, value in row.items() if key and value not in ("", None)}
+            try:
+                for column in CSV_JSON_COLUMNS:
+                    if column in record:
+                        record[column] = json.loads(record[column])
+            except json.JSONDecodeError as e:
+                yield reader.line_num, ValueError(f"invalid JSON in column '{column}': {e.msg}")
+                continue
+            for column in CSV_LIST_COLUMNS:
+                if column in record:
+                    record[column] = [part.strip() for part in record[column].split(";") if part.strip()]
+            for column in ("health", "retreat_cost"):
+                if column in record:
+                    record[column] = _parse_int(record[column])
+            yield reader.line_num, record
+
+
+def read_records(path: str, file_format: str | None = None):
+    """Streams records from a JSON Lines or CSV file, choosing the reader by extension."""
+    file_format = file_format or ("csv" if path.lower().endswith(".csv") else "jsonl")
+    return read_csv(path) if file_format == "csv" else read_jsonl(path)
+
+
+def _parse_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return value
+
+
+#! VALIDATION
+def validate_record(record: dict, effect_names: frozenset) -> tuple[dict, list]:
+    """
+    Checks one card definition and normalizes it for insertion.
+
+    Returns:
+        `(card, errors)`, where `card` is the normalized definition and `errors` is a
+        list of messages (empty when the record is valid).
+    """
+    errors = []
+
+    def text(value, field, required=True):
+        if value is None or value == "":
+            if required:
+                errors.append(f"'{field}' is required")
+            return None
+        if not isinstance(value, (str, int)):
+            errors.append(f"'{field}' must be text")
+            return None
+        return str(value)
+
+    def integer(value, field, minimum=0, required=True):
+        if value is None or value == "":
+            if required:
+                errors.append(f"'{field}' is required")
+            return None
+        if isinstance(value, bool) or not isinstance(value, int) or value < minimum:
+            errors.append(f"'{field}' must be an integer of at least {minimum}")
+            return None
+        return value
+
+    def mana_type(value, field):
+        name = str(value or "").upper()
+        if name not in MANA_TYPES:
+            errors.append(f"unknown mana type {value!r} in '{field}'")
+        return name
+
+    def items(value, field):
+        if value is None:
+            return []
+        if not isinstance(value, list):
+            errors.append(f"'{field}' must be a list")
+            return []
+        return value
+
+    def effects(value, field):
+        normalized = []
+        for order, effect in enumerate(items(value, field), start=1):
+            if not isinstance(effect, dict):
+                errors.append(f"'{field}' entries must be objects")
+                continue
+            name = text(effect.get("effect_name"), f"{field}.effect_name")
+            if name is not None and name not in effect_names:
+                errors.append(f"unknown effect {name!r} in '{field}'")
+            normalized.append((
+                name,
+                text(effect.get("target"), f"{field}.target"),
+                text(effect.get("value"), f"{field}.value", required=False),
+                text(effect.get("condition"), f"{field}.condition", required=False) or "ALWAYS",
+                effect.get("execution_order") or order,
+            ))
+        return normalized
+
+    if not isinstance(record, dict):
+        return {}, ["record must be a JSON object"]
+
+    card_type = str(record.get("card_type", "")).upper()
+    if card_type not in CARD_TYPES:
+        errors.append(f"'card_type' must be one of {', '.join(CARD_TYPES)}")
+    card = {
+        "title": text(record.get("title"), "title"),
+        "card_type": card_type,
+        "subtype": str(record.get("subtype") or "").upper(),
+        "set_code": (text(record.get("set_code"), "set_code") or "").upper(),
+        "prints": [],
+        "pokedex": None,
+        "effects": effects(record.get("effects"), "effects"),
+    }
+
+    for index, card_print in enumerate(items(record.get("prints"), "prints")):
+        if not isinstance(card_print, dict):
+            errors.append("'prints' entries must be objects")
+            continue
+        card["prints"].append((
+            (text(card_print.get("set_code"), f"prints[{index}].set_code", required=False)
+             or card["set_code"]).upper(),
+            text(card_print.get("set_number"), f"prints[{index}].set_number", required=False),
+            card_print.get("illustrator"),
+            str(card_print.get("rarity") or "").upper() or None,
+        ))
+
+    if card_type == "MONSTER":
+        stage = str(record.get("stage", "")).upper()
+        if stage not in STAGES:
+            errors.append(f"'stage' must be one of {', '.join(sorted(STAGES))}")
+        card["stage"] = stage
+        card["health"] = integer(record.get("health"), "health", minimum=1)
+        card["retreat_cost"] = integer(record.get("retreat_cost", 0), "retreat_cost")
+        card["evolves_from"] = [
+            text(name, "evolves_from") for name in items(record.get("evolves_from"), "evolves_from")
+        ]
+        if stage and stage != "BASIC" and not card["evolves_from"]:
+            errors.append(f"a {stage} monster needs 'evolves_from'")
+        # Monsters without a type default to COLORLESS, as in card_insert.py.
+        card["types"] = [
+            mana_type(name, "types") for name in items(record.get("types"), "types")
+        ] or ["COLORLESS"]
+        for field in ("weaknesses", "resistances"):
+            card[field] = []
+            for entry in items(record.get(field), field):
+                if not isinstance(entry, dict):
+                    errors.append(f"'{field}' entries must be objects")
+                    continue
+                card[field].append((
+                    mana_type(entry.get("mana_type"), field),
+                    text(entry.get("modifier"), f"{field}.modifier"),
+                ))
+
+        pokedex = record.get("pokedex")
+        if pokedex is not None:
+            if not isinstance(pokedex, dict):
+                errors.append("'pokedex' must be an object")
+            else:
+                card["pokedex"] = (
+                    pokedex.get("level"),
+                    pokedex.get("dex_number"),
+                    text(pokedex.get("species"), "pokedex.species"),
+                    pokedex.get("height_ft_in"),
+                    pokedex.get("height_m"),
+                    pokedex.get("weight_lbs"),
+                    pokedex.get("weight_kg"),
+                    pokedex.get("dex_entry"),
+                )
+
+        card["abilities"] = []
+        for index, ability in enumerate(items(record.get("abilities"), "abilities")):
+            if not isinstance(ability, dict):
+                errors.append("'abilities' entries must be objects")
+                continue
+            field = f"abilities[{index}]"
+            card["abilities"].append((
+                text(ability.get("name"), f"{field}.name"),
+                text(ability.get("type"), f"{field}.type"),
+                ability.get("description"),
+                effects(ability.get("effects"), f"{field}.effects"),
+            ))
+
+        card["attacks"] = []
+        for index, attack in enumerate(items(record.get("attacks"), "attacks")):
+            if not isinstance(attack, dict):
+                errors.append("'attacks' entries must be objects")
+                continue
+            field = f"attacks[{index}]"
+            costs = attack.get("costs") or {}
+            if not isinstance(costs, dict):
+                errors.append(f"'{field}.costs' must map mana types to quantities")
+                costs = {}
+            card["attacks"].append((
+                text(attack.get("title"), f"{field}.title"),
+                text(attack.get("damage"), f"{field}.damage", required=False) or "",
+                attack.get("description") or "",
+                [
+                    (mana_type(name, f"{field}.costs"), integer(quantity, f"{field}.costs.{name}", minimum=1))
+                    for name, quantity in costs.items()
+                ],
+                effects(attack.get("effects"), f"{field}.effects"),
+            ))
+    elif card_type == "MANA":
+        card["mana_type"] = mana_type(record.get("mana_type"), "mana_type")
+
+    return card, errors
+
+
+def validate_file(path: str, cursor, errors: list, file_format: str | None = None):
+    """
+    Streams the normalized cards of a card file, validating each record as it is read.
+    Invalid records are skipped and their located error messages appended to `errors`,
+    so the file is checked in full even when it is only consumed for validation.
+
+    Yields:
+        Each valid card, normalized for insertion.
+    """
+    effect_names = EffectRegistry.get_effect_names()
+    cursor.execute("SELECT title, set_code FROM cards")
+    seen = {(title, set_code): "the database" for title, set_code in cursor.fetchall()}
+
+    for line_number, record in read_records(path, file_format):
+        if isinstance(record, Exception):
+            errors.append(f"line {line_number}: {record}")
+            continue
+        card, card_errors = validate_record(record, effect_names)
+        key = (card.get("title"), card.get("set_code"))
+        if key in seen:
+            card_errors.append(f"duplicate of {key[0]} ({key[1]}) from {seen[key]}")
+        seen[key] = f"line {line_number}"
+        for message in card_errors:
+            errors.append(f"line {line_number} ({card.get('title') or '?'}): {message}")
+        if not card_errors:
+            yield card
+
+
+#! WRITING
+def next_ids(cursor) -> dict:
+    """Returns the next free ID of every table in `ID_TABLES`, honoring AUTOINCREMENT history."""
+    ids = {}
+    for table in ID_TABLES:
+        cursor.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}")
+        highest = cursor.fetchone()[0]
+        cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = ?", (table,))
+        sequence = cursor.fetchone()
+        ids[table] = max(highest, sequence[0] if sequence else 0) + 1
+    return ids
+
+
+def build_rows(cards: list, ids: dict) -> dict:
+    """
+    Flattens normalized cards into row tuples per table. IDs are assigned here, from
+    `ids` (which is advanced), so child rows can reference their parents without a
+    round trip for `lastrowid`.
+    """
+    rows = {table: [] for table in INSERTS}
+    for card in cards:
+        card_id = ids["cards"]
+        ids["cards"] += 1
+        rows["cards"].append((card_id, card["title"], card["card_type"], card["subtype"], card["set_code"]))
+        rows["card_prints"].extend((card_id, *card_print) for card_print in card["prints"])
+        rows["effects"].extend((card_id, None, None, *effect) for effect in card["effects"])
+
+        if card["card_type"] == "MANA":
+            rows["mana_cards"].append((card_id, card["mana_type"]))
+        if card["card_type"] != "MONSTER":
+            continue
+
+        if card["pokedex"] is not None:
+            rows["pokedex_entries"].append((card_id, *card["pokedex"]))
+        rows["monsters"].append((card_id, card["stage"], card["health"], card["retreat_cost"]))
+        rows["monster_evolutions"].extend((card_id, name) for name in card["evolves_from"])
+        rows["monster_types"].extend((card_id, name) for name in card["types"])
+        rows["monster_weaknesses"].extend((card_id, *entry) for entry in card["weaknesses"])
+        rows["monster_resistances"].extend((card_id, *entry) for entry in card["resistances"])
+        for name, ability_type, description, ability_effects in card["abilities"]:
+            ability_id = ids["monster_abilities"]
+            ids["monster_abilities"] += 1
+            rows["monster_abilities"].append((ability_id, card_id, name, ability_type, description))
+            rows["effects"].extend((card_id, None, ability_id, *effect) for effect in ability_effects)
+        for title, damage, description, costs, attack_effects in card["attacks"]:
+            attack_id = ids["attacks"]
+            ids["attacks"] += 1
+            rows["attacks"].append((attack_id, card_id, title, damage, description))
+            rows["attack_costs"].extend((attack_id, *cost) for cost in costs)
+            rows["effects"].extend((card_id, attack_id, None, *effect) for effect in attack_effects)
+    return rows
+
+
+def import_cards(conn: sqlite3.Connection, cards, errors: list, batch_size: int = DEFAULT_BATCH_SIZE) -> dict:
+    """
+    Writes cards in batches of `batch_size` with one `executemany` per table, as they
+    are read from `cards` (any iterable, e.g. `validate_file`). All batches share a
+    single transaction, which is rolled back if `errors` is not empty once `cards` is
+    exhausted, or if a write fails, so a failed load leaves the database as it was.
+    The load pragmas in `LOAD_PRAGMAS` are applied for the duration.
+
+    Returns:
+        The number of rows written per table.
+    """
+    cursor = conn.cursor()
+    cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    tables = {row[0] for row in cursor.fetchall()}
+
+    previous = {name: cursor.execute(f"PRAGMA {name}").fetchone()[0] for name in LOAD_PRAGMAS}
+    for name, value in LOAD_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {name} = {value}")
+
+    counts = dict.fromkeys(INSERTS, 0)
+    skipped = set()
+    cards = iter(cards)
+    isolation_level = conn.isolation_level
+    conn.isolation_level = None  # Manage the transaction explicitly.
+    try:
+        cursor.execute("BEGIN")
+        ids = next_ids(cursor)
+        while batch := list(islice(cards, batch_size)):
+            if errors:
+                continue  # The load will be rolled back; keep reading to report every error.
+            for table, table_rows in build_rows(batch, ids).items():
+                if not table_rows:
+                    continue
+                if table not in tables:
+                    skipped.add(table)
+                    continue
+                cursor.executemany(INSERTS[table], table_rows)
+                counts[table] += len(table_rows)
+        if errors:
+            cursor.execute("ROLLBACK")
+            return dict.fromkeys(INSERTS, 0)
+        cursor.execute("COMMIT")
+    except BaseException:
+        cursor.execute("ROLLBACK")
+        raise
+    finally:
+        conn.isolation_level = isolation_level
+        for name, value in previous.items():
+            cursor.execute(f"PRAGMA {name} = {value}")
+    if "mana_cards" in skipped:
+        print("Warning: no 'mana_cards' table; mana types of MANA cards are not stored.")
+    return counts
+
+
+def main():
+    """Validates and imports a card file into the card database in one transaction."""
+    parser = argparse.ArgumentParser(
+        description="Bulk-import card definitions from a JSON Lines or CSV file."
+    )
+    parser.add_argument("path", help="The card file (.jsonl or .csv).")
+    parser.add_argument("--db", default=DB_PATH, help="The card database to import into.")
+    parser.add_argument("--format", choices=("jsonl", "csv"), help="Override the format implied by the extension.")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Cards per executemany batch.")
+    parser.add_argument("--dry-run", action="store_true", help="Validate only; write nothing.")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        print(f"Error: Database file not found at '{args.db}'.")
+        print("Please run 'create_db.py' first to create the database.")
+        return 1
+
+    start = time.perf_counter()
+    conn = sqlite3.connect(args.db)
+    try:
+        errors = []
+        cards = validate_file(args.path, conn.cursor(), errors, args.format)
+        if args.dry_run:
+            valid = sum(1 for _ in cards)
+        else:
+            counts = import_cards(conn, cards, errors, args.batch_size)
+        if errors:
+            for message in errors:
+                print(f"Error: {message}")
+            print(f"\n{len(errors)} error(s) found; nothing was imported.")
+            return 1
+        if args.dry_run:
+            print(f"{valid} card(s) are valid.")
+            return 0
+    finally:
+        conn.close()
+
+    print(f"Imported {counts['cards']} card(s) in {time.perf_counter() - start:.2f}s:")
+    for table, count in counts.items():
+        if count and table != "cards":
+            print(f"  {table}: {count} row(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -181,6 +181,21 @@ def create_effects_table(cursor) -> None:
     """)
     print("Table 'effects' created successfully.")
 
+def create_schema(cursor) -> None:
+    """Create every table of the card database."""
+    create_cards_table(cursor)
+    create_card_prints_table(cursor)
+    create_pokedex_entries_table(cursor)
+    create_monsters_table(cursor)
+    create_monster_evolutions_table(cursor)
+    create_monster_types_table(cursor)
+    create_monster_weaknesses_table(cursor)
+    create_monster_resistances_table(cursor)
+    create_monster_abilities_table(cursor)
+    create_attacks_table(cursor)
+    create_attack_costs_table(cursor)
+    create_effects_table(cursor)
+
 def main():
     """Main script function."""
     # Safeguard against accidentally overwriting an existing database.
@@ -195,18 +210,7 @@ def main():
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
 
-    create_cards_table(cursor)
-    create_card_prints_table(cursor)
-    create_pokedex_entries_table(cursor)
-    create_monsters_table(cursor)
-    create_monster_evolutions_table(cursor)
-    create_monster_types_table(cursor)
-    create_monster_weaknesses_table(cursor)
-    create_monster_resistances_table(cursor)
-    create_monster_abilities_table(cursor)
-    create_attacks_table(cursor)
-    create_attack_costs_table(cursor)
-    create_effects_table(cursor)
+    create_schema(cursor)
 
     conn.commit()
     conn.close()
@@ -1,5 +1,7 @@
 import logging
-from typing import Optional
+from collections import OrderedDict
+from functools import partial
+from typing import Callable, Iterable, Optional
 
 from .commands.activate_command import ActivateCommand
 from .commands.attack_command import AttackCommand
@@ -16,14 +18,62 @@ from .commands.use_command import UseCommand
 logger = logging.getLogger(__name__)
 
 
+def _integer(text: str) -> Optional[int]:
+    """Converts an argument to an `int`, or returns `None` if it is not a whole number."""
+    digits = text[1:] if text[:1] in "+-" else text
+    return int(text) if digits.isdecimal() else None
+
+
+def _word(text: str) -> str:
+    return text
+
+
+# The command grammar: command word -> {argument count: (Command subclass, the keyword
+# and converter of each argument, in order)}. An argument count of `None` accepts any
+# number of arguments and ignores them.
+GRAMMAR: dict[str, dict[Optional[int], tuple[type[Command], tuple[tuple[str, Callable], ...]]]] = {
+    "pass": {None: (PassCommand, ())},
+    "activate": {1: (ActivateCommand, (("card_id", _integer),))},
+    "bench": {1: (BenchCommand, (("card_id", _integer),))},
+    "use": {1: (UseCommand, (("card_id", _integer),))},
+    "retreat": {1: (RetreatCommand, (("promoted_card_id", _integer),))},
+    "inspect": {1: (InspectCommand, (("card_id", _integer),))},
+    "attack": {1: (AttackCommand, (("attack_index", _integer),))},
+    "attach": {2: (AttachCommand, (("mana_card_id", _integer), ("target_id", _integer)))},
+    "evolve": {2: (EvolveCommand, (("evo_card_id", _integer), ("base_card_id", _integer)))},
+    "mana": {
+        # mana <type> <qty> (target is defaulted to active monster)
+        2: (ManaCommand, (("mana_type", _word), ("quantity", _integer))),
+        # mana <target_id> <type> <qty>
+        3: (ManaCommand, (("target_id", _integer), ("mana_type", _word), ("quantity", _integer))),
+    },
+}
+
+DEFAULT_CACHE_SIZE = 1024
+
+
 class CommandParser:
     """
     Parses raw string input from the user and converts it into a Command object.
+
+    Command words, their argument counts and the constructor each maps to are listed in
+    `GRAMMAR`. Commands record undo state as they execute, so they cannot be shared; what
+    is cached is how a string parses (the class and its arguments), and every call builds
+    a fresh command from that. Clients that send the same strings over and over, such as
+    bots, skip tokenizing and validation on repeats.
     """
 
-    def __init__(self):
-        """Initializes the CommandParser."""
-        pass
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Initializes the CommandParser.
+
+        Args:
+            cache_size: How many distinct command strings to remember the parse of,
+                least recently used first out. 0 disables the cache.
+        """
+        self.cache_size = cache_size
+        # command string -> a constructor with its arguments bound.
+        self._cache: OrderedDict[str, Callable[[], Command]] = OrderedDict()
 
     def parse(self, command_string: str) -> Optional[Command]:
         """
@@ -35,6 +85,34 @@ class CommandParser:
         Returns:
             A Command object if parsing is successful, otherwise `None`.
         """
+        cache = self._cache
+        build = cache.get(command_string)
+        if build is not None:
+            cache.move_to_end(command_string)
+            return build()
+
+        build = self._compile(command_string)
+        if build is None:
+            # Failures are not cached, so that each one is logged.
+            return None
+        if self.cache_size > 0:
+            cache[command_string] = build
+            if len(cache) > self.cache_size:
+                cache.popitem(last=False)
+        return build()
+
+    def parse_many(self, command_strings: Iterable[str]) -> list[Optional[Command]]:
+        """
+        Parses a batch of command strings, e.g. the lines of one network read.
+
+        Returns:
+            One entry per string, in order: its Command object, or `None` if it did not parse.
+        """
+        parse = self.parse
+        return [parse(command_string) for command_string in command_strings]
+
+    def _compile(self, command_string: str) -> Optional[Callable[[], Command]]:
+        """Validates a command string against `GRAMMAR` and binds its arguments."""
         parts = command_string.strip().lower().split()
         if not parts:
             return None
@@ -42,77 +120,26 @@ class CommandParser:
         command_word = parts[0]
         args = parts[1:]
 
-        try:
-            # Zero-argument commands
-            if command_word == "pass":
-                return PassCommand()
-
-            # One-argument commands
-            elif command_word in [
-                "activate",
-                "bench",
-                "use",
-                "retreat",
-                "inspect",
-                "attack",
-            ]:
-                if len(args) != 1:
-                    logger.warning(
-                        f"'{command_word}' expects 1 argument, got {len(args)}."
-                    )
-                    return None
-                card_id = int(args[0])
-                if command_word == "activate":
-                    return ActivateCommand(card_id=card_id)
-                elif command_word == "bench":
-                    return BenchCommand(card_id=card_id)
-                elif command_word == "use":
-                    return UseCommand(card_id=card_id)
-                elif command_word == "retreat":
-                    return RetreatCommand(promoted_card_id=card_id)
-                elif command_word == "inspect":
-                    return InspectCommand(card_id=card_id)
-                elif command_word == "attack":
-                    return AttackCommand(attack_index=card_id)
-
-            # Two-command arguments
-            elif command_word in ["attach", "evolve"]:
-                if len(args) != 2:
-                    logger.warning(
-                        f"'{command_word}' expects 2 arguments, got {len(args)}."
-                    )
-                    return None
-                arg1 = int(args[0])
-                arg2 = int(args[1])
-                if command_word == "attach":
-                    return AttachCommand(mana_card_id=arg1, target_id=arg2)
-                elif command_word == "evolve":
-                    return EvolveCommand(evo_card_id=arg1, base_card_id=arg2)
-
-            # Three-argument commands
-            elif command_word == "mana":  # Can take 2 or 3 arguments
-                if len(args) not in [2, 3]:
-                    logger.warning(f"'mana' expects 2 or 3 arguments, got {len(args)}.")
-                    return None
-
-                if len(args) == 3:
-                    # mana <target_id> <type> <qty>
-                    target_id = int(args[0])
-                    mana_type = args[1]
-                    quantity = int(args[2])
-                    return ManaCommand(
-                        mana_type=mana_type, quantity=quantity, target_id=target_id
-                    )
-                else:  # len(args) == 2
-                    # mana <type> <qty> (target is defaulted to active monster)
-                    mana_type = args[0]
-                    quantity = int(args[1])
-                    return ManaCommand(mana_type=mana_type, quantity=quantity)
-
-            else:
-                logger.warning(f"Unknown command: '{command_word}'")
-                return None
+        forms = GRAMMAR.get(command_word)
+        if forms is None:
+            logger.warning(f"Unknown command: '{command_word}'")
+            return None
 
-        except (ValueError, IndexError) as e:
-            logger.error(f"Error parsing command '{command_string}': {e}")
+        form = forms.get(len(args)) or forms.get(None)
+        if form is None:
+            counts = " or ".join(str(count) for count in sorted(forms))
+            plural = "s" if max(forms) > 1 else ""
+            logger.warning(
+                f"'{command_word}' expects {counts} argument{plural}, got {len(args)}."
+            )
             return None
+
+        command_cls, parameters = form
+        kwargs = {}
+        for (keyword, convert), text in zip(parameters, args):
+            value = convert(text)
+            if value is None:
+                logger.error(f"Error parsing command '{command_string}': '{text}' is not a number.")
+                return None
+            kwargs[keyword] = value
+        return partial(command_cls, **kwargs)
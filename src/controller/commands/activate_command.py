@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING
 
 from .base_command import Command
+from .undo import position_of, reinsert
 
 if TYPE_CHECKING:
     from core.game import GameState, GameController
@@ -19,6 +20,7 @@ class ActivateCommand(Command):
             card_id (int): The unique ID of the monster card to activate.
         """
         self.card_id = card_id
+        self._undo = None
 
     def execute(self, game_state: "GameState", controller: "GameController") -> tuple[bool, bool]:
         """
@@ -32,5 +34,17 @@ class ActivateCommand(Command):
             view needs to be redrawn.
         """
         player = game_state.current_player
-        player.set_active_monster(self.card_id)
+        hand_position = position_of(player.hand, self.card_id)
+        if player.set_active_monster(self.card_id):
+            self._undo = (player, hand_position)
         return (False, True)
+
+    def undo(self, game_state: "GameState") -> None:
+        """Returns the active monster to its place in the hand."""
+        if self._undo is None:
+            return
+        player, hand_position = self._undo
+        self._undo = None
+        monster = player.active_monster
+        player.active_monster = None
+        reinsert(player.hand, hand_position, monster.id, monster)
@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING
 
 from .base_command import Command
+from .undo import position_of, reinsert
 
 if TYPE_CHECKING:
     from core.game import GameState, GameController
@@ -21,6 +22,7 @@ class AttachCommand(Command):
         """
         self.mana_card_id = mana_card_id
         self.target_id = target_id
+        self._undo = None
 
     def execute(self, game_state: "GameState", controller: "GameController") -> tuple[bool, bool]:
         """
@@ -35,5 +37,21 @@ class AttachCommand(Command):
             the view needs to be redrawn.
         """
         player = game_state.current_player
-        player.attach_mana(self.mana_card_id, self.target_id)
+        hand_position = position_of(player.hand, self.mana_card_id)
+        target = player.active_monster
+        if target is None or target.id != self.target_id:
+            target = player.bench.get(self.target_id)
+        had_attached = target.has_attached if target is not None else False
+        if player.attach_mana(self.mana_card_id, self.target_id):
+            self._undo = (player, hand_position, target, had_attached)
         return (False, True)
+
+    def undo(self, game_state: "GameState") -> None:
+        """Detaches the mana card, returns it to the hand and restores the attach flag."""
+        if self._undo is None:
+            return
+        player, hand_position, target, had_attached = self._undo
+        self._undo = None
+        mana_card = target.detach_mana_attachment(self.mana_card_id)
+        target.has_attached = had_attached
+        reinsert(player.hand, hand_position, mana_card.id, mana_card)
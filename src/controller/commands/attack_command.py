@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING
 
 from .base_command import Command
+from .undo import StateMemento
 
 if TYPE_CHECKING:
     from core.game import GameState
@@ -20,6 +21,7 @@ class AttackCommand(Command):
             attack_index: The index of the attack from the monster's list.
         """
         self.attack_index = attack_index
+        self._memento = None
 
     def execute(self, game_state: "GameState", controller: "GameController") -> tuple[bool, bool]:
         """
@@ -35,6 +37,8 @@ class AttackCommand(Command):
         """
         attacker = game_state.current_player
         defender = game_state.waiting_player
+        # Effects and knockouts can touch almost anything, so snapshot the whole board.
+        self._memento = StateMemento(game_state)
 
         # The use_attack method on the monster handles the core logic.
         # We pass both players to give the attack's effects full context.
@@ -51,3 +55,10 @@ class AttackCommand(Command):
 
         # Attacking always ends the turn.
         return (True, True)
+
+    def undo(self, game_state: "GameState") -> None:
+        """Restores the board captured before the attack, knockouts and prizes included."""
+        if self._memento is None:
+            return
+        self._memento.restore(game_state)
+        self._memento = None
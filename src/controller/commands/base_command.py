@@ -27,6 +27,21 @@ class Command(ABC):
         """
         raise NotImplementedError
 
+    def undo(self, game_state: "GameState") -> None:
+        """
+        Reverts the changes made by the last `execute`, using the inverse delta that
+        `execute` recorded on the command. It must be called on the state `execute`
+        left behind, before any other change (including `next_turn()`), and at most
+        once per `execute`.
+
+        Args:
+            game_state (GameState): The state the command was executed on.
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} cannot be undone.")
+
     def __repr__(self) -> str:
-        attrs = ", ".join(f"{key}={value!r}" for key, value in self.__dict__.items())
+        # Underscored attributes hold undo deltas, not command arguments.
+        attrs = ", ".join(
+            f"{key}={value!r}" for key, value in self.__dict__.items() if not key.startswith("_")
+        )
         return f"{self.__class__.__name__}({attrs})"
@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING
 
 from .base_command import Command
+from .undo import position_of, reinsert
 
 if TYPE_CHECKING:
     from core.game import GameState, GameController
@@ -19,6 +20,7 @@ class BenchCommand(Command):
             card_id: The unique ID of the monster card in the hand to bench.
         """
         self.card_id = card_id
+        self._undo = None
 
     def execute(self, game_state: "GameState", controller: "GameController") -> tuple[bool, bool]:
         """
@@ -32,5 +34,16 @@ class BenchCommand(Command):
             the view needs to be redrawn.
         """
         player = game_state.current_player
-        player.add_to_bench(self.card_id)
+        hand_position = position_of(player.hand, self.card_id)
+        if player.add_to_bench(self.card_id):
+            self._undo = (player, hand_position)
         return (False, True)
+
+    def undo(self, game_state: "GameState") -> None:
+        """Returns the benched monster to its place in the hand."""
+        if self._undo is None:
+            return
+        player, hand_position = self._undo
+        self._undo = None
+        monster = player.bench.pop(self.card_id)
+        reinsert(player.hand, hand_position, monster.id, monster)
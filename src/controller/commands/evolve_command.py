@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING
 
 from .base_command import Command
+from .undo import position_of, reinsert
 
 if TYPE_CHECKING:
     from core.game import GameState, GameController
@@ -21,6 +22,7 @@ class EvolveCommand(Command):
         """
         self.evo_card_id = evo_card_id
         self.base_card_id = base_card_id
+        self._undo = None
 
     def execute(self, game_state: "GameState", controller: "GameController") -> tuple[bool, bool]:
         """
@@ -34,5 +36,35 @@ class EvolveCommand(Command):
             the view needs to be redrawn.
         """
         player = game_state.current_player
-        player.evolve_monster(self.evo_card_id, self.base_card_id)
+        evo_card = player.hand.get(self.evo_card_id)
+        hand_position = position_of(player.hand, self.evo_card_id)
+        # -1 marks the active spot; otherwise the base card's position on the bench.
+        if player.active_monster and player.active_monster.id == self.base_card_id:
+            base_card, bench_position = player.active_monster, -1
+        else:
+            base_card = player.bench.get(self.base_card_id)
+            bench_position = position_of(player.bench, self.base_card_id)
+        if player.evolve_monster(self.evo_card_id, self.base_card_id):
+            # A benched evolution is placed at the end of the bench.
+            if bench_position < 0:
+                evolved = player.active_monster
+            else:
+                evolved = next(reversed(player.bench.values()))
+            self._undo = (player, evo_card, hand_position, base_card, bench_position, evolved)
         return (False, True)
+
+    def undo(self, game_state: "GameState") -> None:
+        """
+        Puts the base monster back where it was and the evolution card back in the hand.
+        The base monster's own state is untouched by evolving, so nothing else changes.
+        """
+        if self._undo is None:
+            return
+        player, evo_card, hand_position, base_card, bench_position, evolved = self._undo
+        self._undo = None
+        if bench_position < 0:
+            player.active_monster = base_card
+        else:
+            del player.bench[evolved.id]
+            reinsert(player.bench, bench_position, base_card.id, base_card)
+        reinsert(player.hand, hand_position, evo_card.id, evo_card)
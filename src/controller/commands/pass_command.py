@@ -27,3 +27,6 @@ class PassCommand(Command):
             the view should be redrawn for the next player.
         """
         return (True, True)
+
+    def undo(self, game_state: "GameState") -> None:
+        """PASS changes nothing, so there is nothing to revert."""
@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING
 
 from .base_command import Command
+from .undo import position_of, reinsert
 
 if TYPE_CHECKING:
     from core.game import GameState, GameController
@@ -19,6 +20,7 @@ class RetreatCommand(Command):
             promoted_card_id: The unique ID of the benched monster to promote to the active spot.
         """
         self.promoted_card_id = promoted_card_id
+        self._undo = None
 
     def execute(self, game_state: "GameState", controller: "GameController") -> tuple[bool, bool]:
         """
@@ -32,5 +34,35 @@ class RetreatCommand(Command):
             needs to be redrawn.
         """
         player = game_state.current_player
-        player.retreat_active_monster(self.promoted_card_id)
+        retreated = player.active_monster
+        if retreated is not None:
+            delta = (
+                player,
+                retreated,
+                position_of(player.bench, self.promoted_card_id),
+                retreated.special_conditions,
+                retreated.attached_mana.copy(),
+            )
+            if player.retreat_active_monster(self.promoted_card_id):
+                self._undo = delta
         return (True, True)
+
+    def undo(self, game_state: "GameState") -> None:
+        """
+        Swaps the monsters back, returns the paid mana from the discard pile to the
+        retreated monster and restores its special conditions.
+        """
+        if self._undo is None:
+            return
+        player, retreated, bench_position, conditions, attached = self._undo
+        self._undo = None
+        promoted = player.active_monster
+        del player.bench[retreated.id]
+        reinsert(player.bench, bench_position, promoted.id, promoted)
+        player.active_monster = retreated
+        retreated.special_conditions = conditions
+        for card_id in attached.keys() - retreated.attached_mana.keys():
+            player.discard.pop(card_id, None)
+        # Restore in place: an evolution shares this dictionary with its prior stages.
+        retreated.attached_mana.clear()
+        retreated.attached_mana.update(attached)
@@ -0,0 +1,98 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from core.game import GameState
+    from models.player import PlayerUnit
+
+
+def position_of(mapping: dict, key) -> int:
+    """Returns the insertion position of `key` in `mapping`, or -1 if it is absent."""
+    for position, existing_key in enumerate(mapping):
+        if existing_key == key:
+            return position
+    return -1
+
+
+def reinsert(mapping: dict, position: int, key, value) -> None:
+    """
+    Puts `key` back into `mapping` at its former insertion position, so that iteration
+    order (and with it the order of legal actions) is exactly as it was.
+    """
+    if position < 0 or position >= len(mapping):
+        mapping[key] = value
+        return
+    items = list(mapping.items())
+    items.insert(position, (key, value))
+    mapping.clear()
+    mapping.update(items)
+
+
+class StateMemento:
+    """
+    A snapshot of everything an attack or a utility card can change: both players'
+    zones, the per-turn state of every monster in play, and the winner.
+
+    Used by commands whose effects are open-ended (effects, knockouts, prize taking),
+    where recording a precise inverse would mean threading undo through every effect.
+    Zone containers are copied shallowly and card objects are not copied at all, so
+    capturing costs a few small dictionary copies rather than a `GameState.clone()`.
+    Events already published on the game's `EventBus` are not retracted.
+    """
+
+    __slots__ = ("winner", "players", "monsters")
+
+    def __init__(self, game_state: "GameState") -> None:
+        self.winner = game_state.winner
+        self.players = [
+            (player, self._capture_player(player))
+            for player in (game_state.player1, game_state.player2)
+        ]
+        self.monsters = [
+            (
+                monster,
+                monster.health,
+                monster.special_conditions.copy(),
+                monster.attached_mana.copy(),
+                monster.is_immune,
+                monster.has_attacked,
+                monster.has_attached,
+                monster.has_evolved,
+            )
+            for player in (game_state.player1, game_state.player2)
+            for monster in ([player.active_monster] if player.active_monster else [])
+            + list(player.bench.values())
+        ]
+
+    @staticmethod
+    def _capture_player(player: "PlayerUnit") -> tuple:
+        return (
+            player.active_monster,
+            player.bench.copy(),
+            player.hand.copy(),
+            player.discard.copy(),
+            player.prize.copy(),
+            player.deck.copy(),
+        )
+
+    def restore(self, game_state: "GameState") -> None:
+        """Returns the game to the captured state. A memento is restored at most once."""
+        game_state.winner = self.winner
+        for player, (active, bench, hand, discard, prize, deck) in self.players:
+            player.active_monster = active
+            player.bench = bench
+            player.hand = hand
+            player.discard = discard
+            player.prize = prize
+            player.deck = deck
+        for (
+            monster, health, conditions, attached, immune, attacked, attached_flag, evolved
+        ) in self.monsters:
+            monster.health = health
+            monster.special_conditions = conditions
+            # Restore in place: an evolution shares this dictionary with its prior stages.
+            monster.attached_mana.clear()
+            monster.attached_mana.update(attached)
+            monster.is_immune = immune
+            monster.has_attacked = attacked
+            monster.has_attached = attached_flag
+            monster.has_evolved = evolved
@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING
 
 from .base_command import Command
+from .undo import StateMemento
 
 if TYPE_CHECKING:
     from core.game import GameState, GameController
@@ -19,6 +20,7 @@ class UseCommand(Command):
             card_id: The unique ID of the utility card in the hand to use.
         """
         self.card_id = card_id
+        self._memento = None
 
     def execute(self, game_state: "GameState", controller: "GameController") -> tuple[bool, bool]:
         """
@@ -32,5 +34,14 @@ class UseCommand(Command):
             the view needs to be redrawn.
         """
         player = game_state.current_player
+        # Utility effects (e.g. drawing) can touch any zone, so snapshot the whole board.
+        self._memento = StateMemento(game_state)
         player.use_utility_card(self.card_id, game_state, controller)
         return (False, True)
+
+    def undo(self, game_state: "GameState") -> None:
+        """Restores the board captured before the card was used."""
+        if self._memento is None:
+            return
+        self._memento.restore(game_state)
+        self._memento = None
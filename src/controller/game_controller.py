@@ -1,10 +1,12 @@
 import logging
 
+from core.actions import Action
 from core.rules import RulesEngine
 from controller.command_parser import CommandParser
 from controller.commands.inspect_command import InspectCommand
 from controller.commands.mana_command import ManaCommand
 from controller.commands.base_command import Command
+from core.profiling import PROFILER
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +16,8 @@ class GameController:
         self.game_state = game_state
         self.view = view
         self.command_parser = CommandParser()
+        # Gameplay commands executed this turn, most recent last; see `undo()`.
+        self.undo_stack: list[Command] = []
 
     def get_attack_choice(self, attacks: list) -> int:
         """
@@ -28,31 +32,54 @@ class GameController:
         # This method acts as a bridge, so effects don't need to know about the view.
         return self.view.prompt_for_attack_choice(attacks)
 
+    def execute_command(self, command: Command) -> tuple[bool, bool]:
+        """
+        Executes a gameplay command against the current game state, recording its
+        duration per `Command` subclass when profiling is enabled. The command is pushed
+        onto the undo stack, so it can be reverted until the turn ends.
+
+        Returns:
+            The command's `(turn_ended, needs_redraw)` tuple.
+        """
+        if PROFILER.enabled:
+            result = PROFILER.call(
+                f"command.{command.__class__.__name__}", command.execute, self.game_state, self
+            )
+        else:
+            result = command.execute(self.game_state, self)
+        self.undo_stack.append(command)
+        return result
+
+    def undo(self) -> bool:
+        """
+        Reverts the most recent command of the current turn in place, using the inverse
+        delta the command recorded. Search can walk a line of play with `execute_command`
+        and `undo` instead of cloning the game for every move.
+
+        Returns:
+            `False` if there is nothing to undo.
+        """
+        if not self.undo_stack:
+            return False
+        self.undo_stack.pop().undo(self.game_state)
+        return True
+
+    def end_turn(self) -> None:
+        """
+        Passes the turn. Start-of-turn processing cannot be reverted, so this also
+        forgets the turn's commands.
+        """
+        self.undo_stack.clear()
+        self.game_state.next_turn()
+
     def _is_command_legal(self, command: Command) -> bool:
         """
         Checks if a parsed command object corresponds to a legal action.
 
-        This method compares the parsed command against the list of pre-calculated legal 
-        actions from the RulesEngine.
+        The command is described as an `Action` and looked up among the pre-calculated
+        legal actions from the RulesEngine.
         """
-        command_type = command.__class__.__name__.replace("Command", "").upper()
-
-        for legal_action in self.game_state.legal_actions:
-            if legal_action["type"] == command_type:
-                # Get the payload from the legal action, defaulting to an empty dict.
-                legal_payload = legal_action.get("payload", {})
-
-                # Check if the command object's attributes are a superset of the
-                # legal action's payload. This works for both empty and non-empty payloads.
-                is_match = all(
-                    # For each attribute on the command object...
-                    # ...check if its value matches the value in the legal payload.
-                    legal_payload.get(key) == value
-                    for key, value in command.__dict__.items()
-                )
-                if is_match:
-                    return True
-        return False
+        return Action.from_command(command) in self.game_state.legal_actions
 
     def run(self) -> None:
         """
@@ -70,6 +97,10 @@ class GameController:
             if command_string.strip().lower() == "exit":
                 logger.info("Exiting Blackstar...")
                 break
+            if command_string.strip().lower() == "undo":
+                if not self.undo():
+                    logger.warning("Nothing to undo this turn.")
+                continue
 
             command_obj = self.command_parser.parse(command_string)
 
@@ -83,9 +114,9 @@ class GameController:
                     # Loop again to redraw the screen after the meta command.
                     continue
             elif self._is_command_legal(command_obj):
-                turn_ended, _ = command_obj.execute(self.game_state, self)
+                turn_ended, _ = self.execute_command(command_obj)
                 if turn_ended:
-                    self.game_state.next_turn()
+                    self.end_turn()
             else:
                 # If the command is illegal, ask the RulesEngine for the specific reason.
                 reason = RulesEngine.get_illegality_reason(self.game_state, command_obj)
@@ -0,0 +1,335 @@
+import logging
+import random
+import sys
+import time
+from typing import Callable, Iterable
+
+from controller.command_parser import CommandParser
+from controller.commands.inspect_command import InspectCommand
+from controller.commands.mana_command import ManaCommand
+from controller.game_controller import GameController
+from core.game import GameState
+from core.rules import RulesEngine
+from models.card import CardTemplate
+from models.player import PlayerUnit
+
+logger = logging.getLogger(__name__)
+
+# Player selectors usable in `expect` checkpoints.
+PLAYERS: dict[str, Callable[[GameState], PlayerUnit]] = {
+    "current": lambda game_state: game_state.current_player,
+    "waiting": lambda game_state: game_state.waiting_player,
+    "player1": lambda game_state: game_state.player1,
+    "player2": lambda game_state: game_state.player2,
+}
+
+# Per-player fields usable in `expect` checkpoints, as `<player>.<field>`.
+PLAYER_FIELDS: dict[str, Callable[[PlayerUnit], object]] = {
+    "deck": lambda player: len(player.deck),
+    "hand": lambda player: len(player.hand),
+    "discard": lambda player: len(player.discard),
+    "bench": lambda player: len(player.bench),
+    "prize": lambda player: len(player.prize),
+    "active": lambda player: player.active_monster.title if player.active_monster else None,
+    "health": lambda player: player.active_monster.health if player.active_monster else None,
+}
+
+# Game-wide fields usable in `expect` checkpoints.
+GAME_FIELDS: dict[str, Callable[[GameState], object]] = {
+    "turn": lambda game_state: game_state.turn_count,
+    "current": lambda game_state: game_state.current_player.title,
+    "winner": lambda game_state: game_state.winner.title if game_state.winner else None,
+}
+
+
+class ScriptError(ValueError):
+    """Raised when a command script contains a malformed directive."""
+
+
+class ScriptStep:
+    """
+    One line of a command script.
+
+    Attributes:
+        line_number (int): The 1-based line in the script, for reporting.
+        kind (str): `"command"`, `"undo"` or `"expect"`.
+        text (str): The command string, or the checkpoint as written.
+        check (Callable): For checkpoints, reads the checked value from a game state.
+        expected (str): For checkpoints, the expected value, lower-cased.
+    """
+
+    __slots__ = ("line_number", "kind", "text", "check", "expected")
+
+    def __init__(self, line_number: int, kind: str, text: str, check=None, expected=None) -> None:
+        self.line_number = line_number
+        self.kind = kind
+        self.text = text
+        self.check = check
+        self.expected = expected
+
+
+class Script:
+    """
+    A command script: the commands a player would type, one per line, plus directives.
+
+    * Blank lines and everything after a `#` are ignored.
+    * `seed <n>` sets the seed the game is created with; it must come before the first
+      command.
+    * `undo` reverts the last command of the turn, as in the terminal.
+    * `expect <field> <value>` is a checkpoint on the game state at that point. Fields
+      are `turn`, `current` (the current player's title), `winner` (a title, or `none`)
+      and `<player>.<field>`, where the player is `current`, `waiting`, `player1` or
+      `player2` and the field is `deck`, `hand`, `discard`, `bench` or `prize` (zone
+      sizes), `active` (the active monster's title) or `health` (its HP).
+
+    Every other line is handed to `CommandParser.parse`.
+    """
+
+    def __init__(self, steps: list[ScriptStep], seed: int | None = None) -> None:
+        self.steps = steps
+        self.seed = seed
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> "Script":
+        """
+        Builds a script from its lines.
+
+        Raises:
+            ScriptError: If a directive is malformed or names an unknown field.
+        """
+        steps = []
+        seed = None
+        for line_number, raw_line in enumerate(lines, start=1):
+            line = raw_line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            word, _, rest = line.partition(" ")
+            word = word.lower()
+            if word == "seed":
+                if steps:
+                    raise ScriptError(f"line {line_number}: 'seed' must come before the first command.")
+                try:
+                    seed = int(rest)
+                except ValueError:
+                    raise ScriptError(f"line {line_number}: 'seed' expects an integer.") from None
+            elif word == "undo":
+                steps.append(ScriptStep(line_number, "undo", line))
+            elif word == "expect":
+                check, expected = cls._parse_checkpoint(line_number, rest)
+                steps.append(ScriptStep(line_number, "expect", rest.strip(), check, expected))
+            else:
+                steps.append(ScriptStep(line_number, "command", line))
+        return cls(steps, seed)
+
+    @classmethod
+    def from_file(cls, path: str) -> "Script":
+        """Reads a script from `path`, or from standard input if `path` is `-`."""
+        if path == "-":
+            return cls.from_lines(sys.stdin)
+        with open(path, encoding="utf-8") as script_file:
+            return cls.from_lines(script_file)
+
+    @staticmethod
+    def _parse_checkpoint(line_number: int, checkpoint: str) -> tuple[Callable, str]:
+        parts = checkpoint.split(maxsplit=1)
+        if len(parts) != 2:
+            raise ScriptError(f"line {line_number}: 'expect' takes a field and a value.")
+        field, expected = parts[0].lower(), parts[1].strip().lower()
+
+        if field in GAME_FIELDS:
+            return GAME_FIELDS[field], expected
+        player_name, _, player_field = field.partition(".")
+        if player_name in PLAYERS and player_field in PLAYER_FIELDS:
+            select, read = PLAYERS[player_name], PLAYER_FIELDS[player_field]
+            return (lambda game_state: read(select(game_state))), expected
+        raise ScriptError(f"line {line_number}: unknown checkpoint field '{parts[0]}'.")
+
+
+class ScriptResult:
+    """
+    The totals of one or more scripted games.
+
+    Attributes:
+        games (int): The number of games played.
+        commands (int): The number of commands executed, undos included.
+        checkpoints (int): The number of checkpoints that passed.
+        failures (list): One message per rejected command or failed checkpoint.
+        seconds (float): The wall-clock time of the games, setup included.
+        winner (str): The winner of the last game, if any.
+        turns (int): The turn the last game stopped on.
+    """
+
+    def __init__(self) -> None:
+        self.games = 0
+        self.commands = 0
+        self.checkpoints = 0
+        self.failures: list[str] = []
+        self.seconds = 0.0
+        self.winner: str | None = None
+        self.turns = 0
+
+    @property
+    def ok(self) -> bool:
+        return not self.failures
+
+    @property
+    def commands_per_second(self) -> float:
+        return self.commands / self.seconds if self.seconds else 0.0
+
+    def format_summary(self) -> str:
+        """
+        Returns a short report. Replays of one script fail the same way every game, so
+        repeated failures are listed once, with a count.
+        """
+        lines = [
+            f"{self.games} game(s), {self.commands} command(s), {self.checkpoints} checkpoint(s) passed, "
+            f"{len(self.failures)} failure(s) in {self.seconds:.3f}s "
+            f"({self.commands_per_second:,.0f} commands/s)",
+            f"last game: turn {self.turns}, winner: {self.winner or 'none'}",
+        ]
+        counts: dict[str, int] = {}
+        for failure in self.failures:
+            counts[failure] = counts.get(failure, 0) + 1
+        for failure, count in list(counts.items())[:10]:
+            lines.append(f"  {failure}" + (f" (x{count})" if count > 1 else ""))
+        if len(counts) > 10:
+            lines.append(f"  ... and {len(counts) - 10} more")
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return (
+            f"ScriptResult(games={self.games}, commands={self.commands}, "
+            f"checkpoints={self.checkpoints}, failures={len(self.failures)})"
+        )
+
+
+class ScriptController(GameController):
+    """
+    A `GameController` without a view, for scripts. Effects that prompt the player
+    for an attack get a choice from a seeded RNG, so a script replays identically.
+    """
+
+    def __init__(self, game_state: GameState, rng: random.Random) -> None:
+        super().__init__(game_state, view=None)
+        self.rng = rng
+
+    def get_attack_choice(self, attacks: list) -> int:
+        return self.rng.randrange(len(attacks))
+
+
+class ScriptRunner:
+    """
+    Plays command scripts against fresh games, without rendering or input.
+
+    Each command goes through the same steps as `GameController.run`: it is parsed,
+    checked against the legal actions, executed, and the turn is passed when it ends.
+    A command that does not parse or is not legal is recorded as a failure, as is a
+    checkpoint that does not hold.
+
+    Every game starts with card IDs numbered from 0 (see `CardTemplate.reset_ids`) and
+    the global RNG seeded, so the IDs a script names are the ones a terminal game
+    started with the same seed shows. The opening position of each seed is built once;
+    later games start from a `GameState.clone()` of it, with the global RNG and the card
+    ID counter put back to where they were after setup, so cards created during play
+    (evolutions) get the same IDs and the game replays exactly as a fresh build would.
+    """
+
+    def __init__(
+        self,
+        game_factory: Callable[[int], GameState],
+        seed: int = 0,
+        strict: bool = False,
+    ) -> None:
+        """
+        Args:
+            game_factory: Builds a ready-to-play game from a seed, e.g. with
+                `simulation.headless.create_game`.
+            seed: The seed for scripts that do not set one.
+            strict: Stop a game at its first failure instead of playing on.
+        """
+        self.game_factory = game_factory
+        self.seed = seed
+        self.strict = strict
+        self.command_parser = CommandParser()
+        # seed -> (pristine opening position, global RNG state and next card ID after setup).
+        self._openings: dict[int, tuple[GameState, tuple, int]] = {}
+
+    def run(self, script: Script, games: int = 1) -> ScriptResult:
+        """
+        Plays `script` from the start `games` times, e.g. many times over to measure
+        command throughput.
+        """
+        result = ScriptResult()
+        start = time.perf_counter()
+        for _ in range(games):
+            self._play(script, result)
+        result.seconds = time.perf_counter() - start
+        return result
+
+    def _play(self, script: Script, result: ScriptResult) -> None:
+        seed = self.seed if script.seed is None else script.seed
+        game_state = self._new_game(seed)
+        controller = ScriptController(game_state, random.Random(seed))
+        failures_before = len(result.failures)
+
+        for step in script.steps:
+            if self.strict and len(result.failures) > failures_before:
+                break
+            if step.kind == "expect":
+                actual = step.check(game_state)
+                if str(actual).lower() == step.expected:
+                    result.checkpoints += 1
+                else:
+                    result.failures.append(
+                        f"line {step.line_number}: expected {step.text}, got {actual}"
+                    )
+            elif step.kind == "undo":
+                if controller.undo():
+                    result.commands += 1
+                else:
+                    result.failures.append(f"line {step.line_number}: nothing to undo")
+            elif self._execute(controller, step, result):
+                result.commands += 1
+
+        result.games += 1
+        result.winner = game_state.winner.title if game_state.winner else None
+        result.turns = game_state.turn_count
+
+    def _new_game(self, seed: int) -> GameState:
+        """Returns a fresh copy of the opening position for `seed`."""
+        opening = self._openings.get(seed)
+        if opening is None:
+            CardTemplate.reset_ids()
+            game_state = self.game_factory(seed)
+            opening = self._openings[seed] = (game_state, random.getstate(), CardTemplate._next_id)
+        game_state, rng_state, next_id = opening
+        random.setstate(rng_state)
+        CardTemplate._next_id = next_id
+        return game_state.clone()
+
+    def _execute(self, controller: ScriptController, step: ScriptStep, result: ScriptResult) -> bool:
+        """Plays one command line. Returns whether a command was executed."""
+        game_state = controller.game_state
+        if game_state.winner:
+            result.failures.append(f"line {step.line_number}: '{step.text}' after the game ended")
+            return False
+        command = self.command_parser.parse(step.text)
+        if not command:
+            result.failures.append(f"line {step.line_number}: cannot parse '{step.text}'")
+            return False
+
+        # Meta/debug commands skip the legality check, as they do in the terminal.
+        if isinstance(command, (InspectCommand, ManaCommand)):
+            command.execute(game_state)
+            return True
+
+        game_state.legal_actions = game_state.get_legal_actions(game_state.current_player)
+        if not controller._is_command_legal(command):
+            reason = RulesEngine.get_illegality_reason(game_state, command)
+            result.failures.append(f"line {step.line_number}: illegal '{step.text}': {reason}")
+            return False
+        turn_ended, _ = controller.execute_command(command)
+        if turn_ended:
+            controller.end_turn()
+        game_state.check_knockouts()
+        return True
@@ -0,0 +1,82 @@
+from typing import NamedTuple
+
+from controller.commands.activate_command import ActivateCommand
+from controller.commands.attach_command import AttachCommand
+from controller.commands.attack_command import AttackCommand
+from controller.commands.base_command import Command
+from controller.commands.bench_command import BenchCommand
+from controller.commands.evolve_command import EvolveCommand
+from controller.commands.pass_command import PassCommand
+from controller.commands.retreat_command import RetreatCommand
+from controller.commands.use_command import UseCommand
+from core.enums import ActionType
+
+# ActionType -> (Command subclass, the command attributes filled by `subject` and `target`).
+# The attributes are listed in the order the command's constructor takes them.
+ACTION_COMMANDS: dict[ActionType, tuple[type[Command], tuple[str, ...]]] = {
+    ActionType.PASS: (PassCommand, ()),
+    ActionType.ATTACK: (AttackCommand, ("attack_index",)),
+    ActionType.ACTIVATE: (ActivateCommand, ("card_id",)),
+    ActionType.ATTACH: (AttachCommand, ("mana_card_id", "target_id")),
+    ActionType.BENCH: (BenchCommand, ("card_id",)),
+    ActionType.EVOLVE: (EvolveCommand, ("evo_card_id", "base_card_id")),
+    ActionType.RETREAT: (RetreatCommand, ("promoted_card_id",)),
+    ActionType.USE: (UseCommand, ("card_id",)),
+}
+
+# The reverse lookup: Command subclass -> (ActionType, command attributes).
+_COMMAND_ACTIONS = {
+    command_cls: (action_type, fields)
+    for action_type, (command_cls, fields) in ACTION_COMMANDS.items()
+}
+
+
+class Action(NamedTuple):
+    """
+    An immutable, hashable description of one legal move, as produced by the `RulesEngine`.
+
+    Actions map one-to-one onto gameplay `Command`s: `subject` and `target` hold the
+    command's arguments in constructor order, e.g. `Action(ActionType.ATTACH, mana_card_id,
+    target_id)` or `Action(ActionType.ATTACK, attack_index)`. Equal moves compare equal, so
+    actions can be tested for membership and used as dictionary keys.
+
+    Attributes:
+        type (ActionType): The kind of action.
+        subject (int): The first command argument (a card ID or attack index), if any.
+        target (int): The second command argument (the card acted upon), if any.
+    """
+
+    type: ActionType
+    subject: int | None = None
+    target: int | None = None
+
+    def __repr__(self) -> str:
+        return f"Action({', '.join([self.type.name, *map(repr, self.args)])})"
+
+    @property
+    def args(self) -> tuple:
+        """The command arguments this action carries, in constructor order."""
+        return self[1 : 1 + len(ACTION_COMMANDS[self.type][1])]
+
+    def to_command(self) -> Command:
+        """Builds the `Command` that performs this action."""
+        command_cls, fields = ACTION_COMMANDS[self.type]
+        return command_cls(*self[1 : 1 + len(fields)])
+
+    @classmethod
+    def from_command(cls, command: Command) -> "Action | None":
+        """
+        Describes a gameplay command as an action.
+
+        Returns:
+            The matching `Action`, or `None` for commands outside of gameplay (e.g. INSPECT).
+        """
+        entry = _COMMAND_ACTIONS.get(type(command))
+        if entry is None:
+            return None
+        action_type, fields = entry
+        return cls(action_type, *(getattr(command, field) for field in fields))
+
+
+# PASS carries no arguments, so one shared instance serves every turn.
+PASS_ACTION = Action(ActionType.PASS)
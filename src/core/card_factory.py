@@ -1,7 +1,12 @@
-from models.monster import MonsterTemplate
+import logging
+
+from models.monster import MonsterCard, MonsterTemplate
 from core.enums import CardType, ManaType, StageType
+from core.profiling import PROFILER
 from database.card_repository import CardRepository
 
+logger = logging.getLogger(__name__)
+
 
 class CardFactory:
     """
@@ -55,14 +60,59 @@ class CardFactory:
         """
 
         # Assuming the repository will return a dict ...
-        card_data = card_repo.get_card_data_as_kwargs(title=title, set_code=set_code)
+        if PROFILER.enabled:
+            card_data = PROFILER.call(
+                "db.load_card", card_repo.get_card_data_as_kwargs, title=title, set_code=set_code
+            )
+        else:
+            card_data = card_repo.get_card_data_as_kwargs(title=title, set_code=set_code)
         if not card_data:
             return None
 
         card_type = CardType(card_data.get("type").lower())
         if card_type == CardType.MONSTER:
+            if PROFILER.enabled:
+                return PROFILER.call("db.build_template", cls.create_monster_template, **card_data)
             return cls.create_monster_template(**card_data)
         elif card_type == CardType.UTILITY:
             pass
         elif card_type == CardType.MANA:
             pass
+
+
+def generate_deck_from_list(
+    deck_list,
+    player_unit,
+    card_repo: CardRepository | None = None,
+    template_cache: dict | None = None,
+):
+    """
+    Populates a player's card field from a list of card titles.
+
+    Args:
+        deck_list: A list of card titles to fetch from the database.
+        player_unit: The player whose field receives the cards.
+        card_repo: Optional repository to load from. A new one is opened if omitted.
+        template_cache: Optional `(title, set_code) -> template` dictionary. Templates
+            are immutable, so cards with the same title can share one; titles found in
+            the cache skip the database, and newly loaded templates are added to it.
+    """
+    card_repo = card_repo or CardRepository()
+    for card_data in deck_list:
+        title = card_data
+        set_code = "BS"  # Default set_code for test data
+        if template_cache is None:
+            template = CardFactory.create_card_from_db(card_repo, title, set_code)
+        else:
+            template = template_cache.get((title, set_code))
+            if template is None:
+                template = CardFactory.create_card_from_db(card_repo, title, set_code)
+                template_cache[(title, set_code)] = template
+
+        if not template:
+            logger.warning(f"Could not create card for {title} ({set_code})")
+            continue
+
+        if isinstance(template, MonsterTemplate):
+            player_unit.add_to_field(MonsterCard(template))
+        # Add cases for UTILITY and MANA here if needed.
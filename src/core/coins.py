@@ -1,4 +1,9 @@
 import random
+from contextlib import contextmanager
+from typing import Callable, Iterable, Iterator
+
+# When set, `coin()` asks this callable for every flip instead of the global RNG.
+_coin_source: Callable[[], bool] | None = None
 
 
 def coin() -> bool:
@@ -6,4 +11,51 @@ def coin() -> bool:
     Performs a coin flip: `True` for *heads*, and `False` for *tails*.
     The obligation to indicate and display the result of the flip is on the caller.
     """
+    if _coin_source is not None:
+        return _coin_source()
     return bool(random.getrandbits(1))
+
+
+@contextmanager
+def coin_source(source: Callable[[], bool]) -> Iterator[Callable[[], bool]]:
+    """
+    Routes every `coin()` flip made inside the `with` block to `source`, restoring the
+    previous source on exit.
+
+    Args:
+        source: A callable returning `True` for heads and `False` for tails.
+    """
+    global _coin_source
+    previous = _coin_source
+    _coin_source = source
+    try:
+        yield source
+    finally:
+        _coin_source = previous
+
+
+class CoinScriptExhausted(Exception):
+    """Raised when a `ScriptedCoins` source is asked for more flips than it holds."""
+
+
+class ScriptedCoins:
+    """
+    A coin source that replays a fixed sequence of flips. Asking for a flip past the
+    end raises `CoinScriptExhausted`, which tells the caller that another chance event
+    occurred.
+    """
+
+    def __init__(self, flips: Iterable[bool] = ()) -> None:
+        """
+        Args:
+            flips: The results to return, in order: `True` for heads, `False` for tails.
+        """
+        self.flips = tuple(flips)
+        self.position = 0
+
+    def __call__(self) -> bool:
+        if self.position >= len(self.flips):
+            raise CoinScriptExhausted(f"Coin script of {len(self.flips)} flips exhausted.")
+        result = self.flips[self.position]
+        self.position += 1
+        return result
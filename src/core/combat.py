@@ -1,6 +1,8 @@
 import logging
 from effects.effect_registry import EffectRegistry
 from core.conditions import CONDITION_DISPATCHER
+from core.events import AttackResolved, DamageApplied
+from core.profiling import PROFILER
 
 logger = logging.getLogger(__name__)
 
@@ -73,8 +75,13 @@ class Attack:
 
         # If damage is 0 or less, it's not successful in that regard.
         damage_was_dealt = False
+        defending_monster = target.active_monster
         if final_damage > 0:
-            damage_was_dealt = target.active_monster.take_damage(final_damage)
+            damage_was_dealt = defending_monster.take_damage(final_damage)
+            if damage_was_dealt and DamageApplied in game_state.events:
+                game_state.events.emit(
+                    DamageApplied(defending_monster, final_damage, self.title)
+                )
 
         logger.info(f"{self.title} dealt {final_damage} damage! {data_str}")
 
@@ -100,7 +107,22 @@ class Attack:
                     # By unpacking the context dictionary, we pass its key-value pairs
                     # as keyword arguments to the execute method. This is cleaner and
                     # more flexible than passing arguments individually.
-                    effect.execute(**context)
+                    if PROFILER.enabled:
+                        PROFILER.call(f"effect.{effect.effect_name}", effect.execute, **context)
+                    else:
+                        effect.execute(**context)
 
         # 3. Mark attacker flag
         attacker.active_monster.has_attacked = True
+
+        if AttackResolved in game_state.events:
+            game_state.events.emit(
+                AttackResolved(
+                    attacker,
+                    attacker.active_monster,
+                    defending_monster,
+                    self.title,
+                    final_damage,
+                    damage_was_dealt,
+                )
+            )
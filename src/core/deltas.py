@@ -0,0 +1,308 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from core.game import GameState
+    from models.player import PlayerUnit
+
+DEFAULT_KEYFRAME_INTERVAL = 64
+
+# Monster flags, packed into one integer per monster.
+FLAG_ATTACKED = 1
+FLAG_ATTACHED = 2
+FLAG_EVOLVED = 4
+FLAG_IMMUNE = 8
+
+
+def monster_flags(monster) -> int:
+    """Packs a monster's per-turn flags into an integer of `FLAG_*` bits."""
+    return (
+        (FLAG_ATTACKED if monster.has_attacked else 0)
+        | (FLAG_ATTACHED if monster.has_attached else 0)
+        | (FLAG_EVOLVED if monster.has_evolved else 0)
+        | (FLAG_IMMUNE if monster.is_immune else 0)
+    )
+
+
+class Snapshot:
+    """
+    The observable state of a game, flattened for comparison: the IDs of the cards in
+    play, in hand and in the discard piles, the sizes of the hidden zones (decks and
+    prizes), the live fields of every monster in play, and whose turn it is.
+
+    Zone names are `p1.<zone>` and `p2.<zone>`. Cards attached to a monster (mana, and
+    the prior stages of an evolution) are listed in the zone `@<monster id>`.
+    """
+
+    __slots__ = ("turn", "current", "winner", "zones", "counts", "monsters", "titles")
+
+    def __init__(self, game_state: "GameState") -> None:
+        self.turn = game_state.turn_count
+        self.current = _player_name(game_state, game_state.current_player)
+        self.winner = _player_name(game_state, game_state.winner) if game_state.winner else None
+        self.zones: dict[str, tuple] = {}
+        self.counts: dict[str, int] = {}
+        # monster ID -> (health, conditions, flags)
+        self.monsters: dict[int, tuple] = {}
+        # card ID -> title, for every card in a listed zone
+        self.titles: dict[int, str] = {}
+        for name, player in (("p1", game_state.player1), ("p2", game_state.player2)):
+            self._add_player(name, player)
+
+    def _add_player(self, name: str, player: "PlayerUnit") -> None:
+        in_play = ([player.active_monster] if player.active_monster else []) + list(player.bench.values())
+        self.zones[f"{name}.active"] = (player.active_monster.id,) if player.active_monster else ()
+        self.zones[f"{name}.bench"] = tuple(player.bench)
+        self.zones[f"{name}.hand"] = tuple(player.hand)
+        self.zones[f"{name}.discard"] = tuple(player.discard)
+        self.counts[f"{name}.deck"] = len(player.deck)
+        self.counts[f"{name}.prize"] = len(player.prize)
+
+        titles = self.titles
+        for zone in (player.hand, player.discard):
+            for card_id, card in zone.items():
+                titles[card_id] = card.card.title
+        for monster in in_play:
+            titles[monster.id] = monster.card.title
+            self.monsters[monster.id] = (
+                monster.health,
+                tuple(monster.special_conditions),
+                monster_flags(monster),
+            )
+            under = list(monster.attached_mana.values()) + monster.prior_evos
+            if under:
+                self.zones[f"@{monster.id}"] = tuple(card.id for card in under)
+                for card in under:
+                    titles[card.id] = card.card.title
+
+    def locations(self) -> dict[int, str]:
+        """Returns the zone of every listed card, by ID."""
+        return {card_id: zone for zone, ids in self.zones.items() for card_id in ids}
+
+
+def _player_name(game_state: "GameState", player) -> str:
+    return "p1" if player is game_state.player1 else "p2"
+
+
+class StateDelta:
+    """
+    One versioned state update. Applied in version order, deltas take a client from the
+    previous version to this one; a keyframe replaces the client's state outright.
+
+    `ops` is a list of short lists, applied in order:
+
+    * `["card", id, title]` introduces a card the client has not seen yet.
+    * `["move", id, zone]` takes a card out of wherever it is and appends it to `zone`;
+      a zone of `None` means the card went out of sight (into a deck or the prizes).
+    * `["zone", zone, [ids]]` lists a zone whose order the moves do not reproduce.
+    * `["hp", id, health]`, `["cond", id, [conditions]]` and `["flags", id, bits]`
+      update a monster in play; see the `FLAG_*` constants.
+    * `["count", zone, size]` is the new size of a deck or prize zone.
+    * `["turn", n]`, `["current", player]` and `["winner", player]` update the game.
+
+    Attributes:
+        version (int): The version of the state after this delta.
+        keyframe (bool): Whether this is a full state rather than a change.
+        ops (list): The operations.
+    """
+
+    __slots__ = ("version", "keyframe", "ops")
+
+    def __init__(self, version: int, keyframe: bool, ops: list) -> None:
+        self.version = version
+        self.keyframe = keyframe
+        self.ops = ops
+
+    def to_dict(self) -> dict:
+        """Returns the delta as a JSON-ready dictionary."""
+        return {"v": self.version, "key": self.keyframe, "ops": self.ops}
+
+    def __repr__(self) -> str:
+        return f"StateDelta(version={self.version}, keyframe={self.keyframe}, ops={len(self.ops)})"
+
+
+class DeltaTracker:
+    """
+    Produces compact, versioned state updates for one game, for views that are not in
+    the same process as the engine.
+
+    Call `update()` after every command (or any other change). It takes a `Snapshot` of
+    the game, compares it with the previous one and returns the difference as a
+    `StateDelta`: the cards that moved between zones, the monsters whose health,
+    conditions or flags changed, and any change in zone sizes or turn. Diffing snapshots,
+    rather than having every command and effect report what it did, catches every
+    change however it was made, at the cost of one walk over the visible cards.
+
+    Every `keyframe_interval` versions the update is a full keyframe instead, so a client
+    that missed an update, or joins late, can resynchronize; `keyframe()` makes one on
+    demand.
+    """
+
+    def __init__(self, game_state: "GameState", keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL) -> None:
+        """
+        Args:
+            game_state: The game to track.
+            keyframe_interval: Send a keyframe instead of a delta once every this many versions.
+        """
+        self.game_state = game_state
+        self.keyframe_interval = keyframe_interval
+        self.version = 0
+        self._snapshot = Snapshot(game_state)
+
+    def update(self) -> StateDelta | None:
+        """
+        Returns the changes since the last update as the next version, or `None` if
+        nothing observable changed (the version is then not advanced).
+        """
+        snapshot = Snapshot(self.game_state)
+        ops = diff_snapshots(self._snapshot, snapshot)
+        if not ops:
+            return None
+        self._snapshot = snapshot
+        self.version += 1
+        if self.version % self.keyframe_interval == 0:
+            return StateDelta(self.version, True, keyframe_ops(snapshot))
+        return StateDelta(self.version, False, ops)
+
+    def keyframe(self) -> StateDelta:
+        """
+        Returns the full state, e.g. for a client joining late. Changes not yet sent in
+        an update are folded into the keyframe as a new version, so clients following
+        deltas see a gap and ask for a keyframe too.
+        """
+        snapshot = Snapshot(self.game_state)
+        if diff_snapshots(self._snapshot, snapshot):
+            self.version += 1
+        self._snapshot = snapshot
+        return StateDelta(self.version, True, keyframe_ops(snapshot))
+
+
+def keyframe_ops(snapshot: Snapshot) -> list:
+    """Returns the operations that build `snapshot` from an empty state."""
+    ops = [["card", card_id, title] for card_id, title in snapshot.titles.items()]
+    ops += [["zone", zone, list(ids)] for zone, ids in snapshot.zones.items()]
+    ops += [["count", zone, size] for zone, size in snapshot.counts.items()]
+    for monster_id, (health, conditions, flags) in snapshot.monsters.items():
+        ops.append(["hp", monster_id, health])
+        if conditions:
+            ops.append(["cond", monster_id, list(conditions)])
+        if flags:
+            ops.append(["flags", monster_id, flags])
+    ops += [["turn", snapshot.turn], ["current", snapshot.current], ["winner", snapshot.winner]]
+    return ops
+
+
+def diff_snapshots(old: Snapshot, new: Snapshot) -> list:
+    """Returns the operations that turn `old` into `new`; see `StateDelta`."""
+    ops = []
+    old_locations, new_locations = old.locations(), new.locations()
+
+    for card_id, title in new.titles.items():
+        if card_id not in old.titles:
+            ops.append(["card", card_id, title])
+
+    # Moves, applied to a copy of the old zones the way a client applies them.
+    zones = {zone: list(ids) for zone, ids in old.zones.items()}
+    for card_id, zone in new_locations.items():
+        previous = old_locations.get(card_id)
+        if previous != zone:
+            ops.append(["move", card_id, zone])
+            if previous is not None:
+                zones[previous].remove(card_id)
+            zones.setdefault(zone, []).append(card_id)
+    for card_id, zone in old_locations.items():
+        if card_id not in new_locations:
+            ops.append(["move", card_id, None])
+            zones[zone].remove(card_id)
+    for zone, ids in new.zones.items():
+        if zones.get(zone, []) != list(ids):
+            ops.append(["zone", zone, list(ids)])
+
+    for monster_id, (health, conditions, flags) in new.monsters.items():
+        before = old.monsters.get(monster_id)
+        if before is None or before[0] != health:
+            ops.append(["hp", monster_id, health])
+        if (before is None and conditions) or (before is not None and before[1] != conditions):
+            ops.append(["cond", monster_id, list(conditions)])
+        if (before is None and flags) or (before is not None and before[2] != flags):
+            ops.append(["flags", monster_id, flags])
+
+    for zone, size in new.counts.items():
+        if old.counts.get(zone) != size:
+            ops.append(["count", zone, size])
+    if old.turn != new.turn:
+        ops.append(["turn", new.turn])
+    if old.current != new.current:
+        ops.append(["current", new.current])
+    if old.winner != new.winner:
+        ops.append(["winner", new.winner])
+    return ops
+
+
+class DeltaView:
+    """
+    A client-side copy of the state, kept current by applying `StateDelta`s (or their
+    `to_dict()` form) in order.
+
+    Attributes:
+        version (int): The version of the last delta applied.
+        zones (dict): Zone name -> list of card IDs.
+        counts (dict): Hidden zone name -> size.
+        monsters (dict): Monster ID -> `{"hp", "cond", "flags"}`.
+        titles (dict): Card ID -> title.
+    """
+
+    def __init__(self) -> None:
+        self.version = 0
+        self.turn = 0
+        self.current = None
+        self.winner = None
+        self.zones: dict[str, list] = {}
+        self.counts: dict[str, int] = {}
+        self.monsters: dict[int, dict] = {}
+        self.titles: dict[int, str] = {}
+
+    def apply(self, delta) -> None:
+        """
+        Applies one delta.
+
+        Raises:
+            ValueError: If the delta is not a keyframe and does not follow this view's
+                version; the client should ask for a keyframe.
+        """
+        if isinstance(delta, StateDelta):
+            delta = delta.to_dict()
+        if delta["key"]:
+            self.__init__()
+        elif delta["v"] != self.version + 1:
+            raise ValueError(f"Delta {delta['v']} does not follow version {self.version}.")
+        self.version = delta["v"]
+
+        locations = {card_id: zone for zone, ids in self.zones.items() for card_id in ids}
+        for op in delta["ops"]:
+            kind = op[0]
+            if kind == "card":
+                self.titles[op[1]] = op[2]
+            elif kind == "move":
+                card_id, zone = op[1], op[2]
+                previous = locations.pop(card_id, None)
+                if previous is not None:
+                    self.zones[previous].remove(card_id)
+                if zone is not None:
+                    self.zones.setdefault(zone, []).append(card_id)
+                    locations[card_id] = zone
+            elif kind == "zone":
+                self.zones[op[1]] = list(op[2])
+                locations.update((card_id, op[1]) for card_id in op[2])
+            elif kind in ("hp", "cond", "flags"):
+                self.monsters.setdefault(op[1], {"hp": None, "cond": [], "flags": 0})[kind] = op[2]
+            elif kind == "count":
+                self.counts[op[1]] = op[2]
+            else:
+                setattr(self, kind, op[1])
+
+        # Drop what is no longer in sight.
+        self.zones = {zone: ids for zone, ids in self.zones.items() if ids or not zone.startswith("@")}
+        in_play = {card_id for zone, ids in self.zones.items() if zone.endswith(("active", "bench")) for card_id in ids}
+        self.monsters = {card_id: fields for card_id, fields in self.monsters.items() if card_id in in_play}
+        in_sight = {card_id for ids in self.zones.values() for card_id in ids}
+        self.titles = {card_id: title for card_id, title in self.titles.items() if card_id in in_sight}
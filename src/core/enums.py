@@ -1,4 +1,4 @@
-from enum import Enum
+from enum import Enum, IntEnum
 
 class CardType(Enum):
     """
@@ -51,4 +51,18 @@ class RarityType(Enum):
     SPECIAL_ILL     = 'special_ill'
     HYPER_RARE      = 'hyper_rare'
     MEGA_HYPER_RARE = 'mega_hyper_rare'
-    PROMO           = 'promo'
\ No newline at end of file
+    PROMO           = 'promo'
+
+class ActionType(IntEnum):
+    """
+    'ActionType' lists the kinds of gameplay action a player can take on their turn.
+    Each maps to exactly one `Command` subclass (see `core.actions`).
+    """
+    PASS        = 0
+    ATTACK      = 1
+    ACTIVATE    = 2
+    ATTACH      = 3
+    BENCH       = 4
+    EVOLVE      = 5
+    RETREAT     = 6
+    USE         = 7
@@ -0,0 +1,207 @@
+import logging
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from models.monster import MonsterCard
+    from models.player import PlayerUnit
+
+logger = logging.getLogger(__name__)
+
+
+class GameEvent:
+    """
+    Base class for all structured events emitted on a `GameState`'s `EventBus`.
+    Events are small slotted records; they are only constructed when at least one
+    subscriber is listening for their type.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{self.__class__.__name__}({fields})"
+
+
+class AttackResolved(GameEvent):
+    """
+    An attack has finished resolving, including all of its effects.
+
+    Attributes:
+        player (PlayerUnit): The attacking player.
+        attacker (MonsterCard): The monster that used the attack.
+        defender (MonsterCard): The monster that received the attack.
+        attack_title (str): The title of the attack.
+        damage (int): The damage after weakness and resistance.
+        damage_was_dealt (bool): Whether the damage was actually applied.
+    """
+
+    __slots__ = ("player", "attacker", "defender", "attack_title", "damage", "damage_was_dealt")
+
+    def __init__(self, player, attacker, defender, attack_title, damage, damage_was_dealt):
+        self.player: "PlayerUnit" = player
+        self.attacker: "MonsterCard" = attacker
+        self.defender: "MonsterCard" = defender
+        self.attack_title: str = attack_title
+        self.damage: int = damage
+        self.damage_was_dealt: bool = damage_was_dealt
+
+
+class DamageApplied(GameEvent):
+    """
+    A monster has lost health.
+
+    Attributes:
+        target (MonsterCard): The monster that took the damage.
+        amount (int): The amount of damage applied.
+        source (str): What caused the damage (an attack title, an effect name or a status).
+    """
+
+    __slots__ = ("target", "amount", "source")
+
+    def __init__(self, target, amount, source):
+        self.target: "MonsterCard" = target
+        self.amount: int = amount
+        self.source: str = source
+
+
+class Knockout(GameEvent):
+    """
+    A player's active monster has been knocked out.
+
+    Attributes:
+        player (PlayerUnit): The player who owned the knocked out monster.
+        monster (MonsterCard): The knocked out monster.
+    """
+
+    __slots__ = ("player", "monster")
+
+    def __init__(self, player, monster):
+        self.player: "PlayerUnit" = player
+        self.monster: "MonsterCard" = monster
+
+
+class PrizeTaken(GameEvent):
+    """
+    A player has taken a prize card.
+
+    Attributes:
+        player (PlayerUnit): The player taking the prize.
+        prize_slot (int): The 1-based prize slot that was taken.
+        prizes_left (int): The number of prize cards remaining for the player.
+    """
+
+    __slots__ = ("player", "prize_slot", "prizes_left")
+
+    def __init__(self, player, prize_slot, prizes_left):
+        self.player: "PlayerUnit" = player
+        self.prize_slot: int = prize_slot
+        self.prizes_left: int = prizes_left
+
+
+class StatusTick(GameEvent):
+    """
+    A special condition was processed at the start of a turn.
+
+    Attributes:
+        monster (MonsterCard): The affected monster.
+        status (str): The special condition (e.g., "POISONED", "ASLEEP").
+        damage (int): Damage dealt by the tick (0 for conditions that deal none).
+        recovered (bool): Whether the condition was removed by the tick.
+    """
+
+    __slots__ = ("monster", "status", "damage", "recovered")
+
+    def __init__(self, monster, status, damage, recovered):
+        self.monster: "MonsterCard" = monster
+        self.status: str = status
+        self.damage: int = damage
+        self.recovered: bool = recovered
+
+
+# Every concrete event type. Subscribing to a base class expands to its members here.
+EVENT_TYPES: tuple[type[GameEvent], ...] = (
+    AttackResolved,
+    DamageApplied,
+    Knockout,
+    PrizeTaken,
+    StatusTick,
+)
+
+EventCallback = Callable[[GameEvent], None]
+
+
+class EventBus:
+    """
+    Delivers `GameEvent`s to subscribers, filtered by event type.
+
+    Emitters are expected to guard event construction with a membership test so
+    that an unobserved game pays only for a dictionary lookup:
+
+        if DamageApplied in game_state.events:
+            game_state.events.emit(DamageApplied(monster, 20, "BURNED"))
+    """
+
+    __slots__ = ("_subscribers",)
+
+    def __init__(self) -> None:
+        self._subscribers: dict[type, list[EventCallback]] = {}
+
+    def __contains__(self, event_type: type) -> bool:
+        """Returns `True` if anyone is subscribed to the given event type."""
+        return event_type in self._subscribers
+
+    def __bool__(self) -> bool:
+        """Returns `True` if the bus has any subscribers at all."""
+        return bool(self._subscribers)
+
+    def subscribe(self, callback: EventCallback, *event_types: type) -> EventCallback:
+        """
+        Registers a callback for one or more event types. With no types given, the
+        callback receives every event. Subscribing to a base class subscribes to all
+        of its concrete subclasses.
+
+        Args:
+            callback: A callable that receives the event object.
+            *event_types: The `GameEvent` subclasses to listen for.
+
+        Returns:
+            The callback, for convenience.
+        """
+        for event_type in self._expand(event_types or (GameEvent,)):
+            self._subscribers.setdefault(event_type, []).append(callback)
+        return callback
+
+    def unsubscribe(self, callback: EventCallback, *event_types: type) -> None:
+        """
+        Removes a callback from the given event types (or from all types if none are given).
+        """
+        for event_type in self._expand(event_types or (GameEvent,)):
+            callbacks = self._subscribers.get(event_type)
+            if not callbacks or callback not in callbacks:
+                continue
+            callbacks.remove(callback)
+            # Drop empty lists so that `in` checks stay accurate for emitters.
+            if not callbacks:
+                del self._subscribers[event_type]
+
+    def emit(self, event: GameEvent) -> None:
+        """
+        Delivers an event to every subscriber of its type. A failing subscriber is
+        logged and skipped so that observers can never break a game in progress.
+        """
+        # Iterate over a copy so subscribers may unsubscribe while handling an event.
+        for callback in tuple(self._subscribers.get(type(event), ())):
+            try:
+                callback(event)
+            except Exception:
+                logger.exception(f"Event subscriber {callback!r} failed on {event!r}.")
+
+    @staticmethod
+    def _expand(event_types) -> list[type]:
+        """Expands base classes into the concrete event types they cover."""
+        expanded = []
+        for event_type in event_types:
+            if not (isinstance(event_type, type) and issubclass(event_type, GameEvent)):
+                raise TypeError(f"{event_type!r} is not a GameEvent type.")
+            expanded.extend(t for t in EVENT_TYPES if issubclass(t, event_type))
+        return expanded
@@ -1,6 +1,9 @@
+import copy
 import logging
 
 from core.rules import RulesEngine
+from core.events import DamageApplied, EventBus, Knockout, PrizeTaken, StatusTick
+from core.profiling import PROFILER
 from models.player import PlayerUnit
 from core.coins import coin
 
@@ -17,6 +20,18 @@ class GameState:
         self.legal_actions = []
         self.legal_action_types = set()
         self.winner = None
+        # Structured observation of the game; see core/events.py.
+        self.events = EventBus()
+
+    def clone(self) -> "GameState":
+        """
+        Returns an independent copy of the game for search and analysis. Cards, zones and
+        flags are copied; card templates and ability effects are shared (they are never
+        mutated), and the copy starts with an empty `EventBus` so subscribers of this game
+        are not notified.
+        """
+        memo = {id(self.events): EventBus()}
+        return copy.deepcopy(self, memo)
 
     @property
     def waiting_player(self) -> PlayerUnit:
@@ -39,7 +54,10 @@ class GameState:
         """        
         self.active_player = self.waiting_player
         self.turn_count += 1
-        self._start_new_turn_for_player()
+        if PROFILER.enabled:
+            PROFILER.call("turn.start", self._start_new_turn_for_player)
+        else:
+            self._start_new_turn_for_player()
 
     def _start_new_turn_for_player(self):
         """Handles all logic that occurs at the very beginning of a player's turn."""
@@ -50,17 +68,19 @@ class GameState:
                 logger.info(
                     f"Adding 10 damage for POISONED {self.active_player.active_monster}"
                 )
-                self.active_player.active_monster.take_damage(10)
+                dealt = self._apply_status_damage("POISONED", 10)
+                self._emit_status_tick("POISONED", dealt, False)
             if "POISONED_20" in self.active_player.active_monster.special_conditions:
                 logger.info(
                     f"Adding 20 damage for badly POISONED {self.active_player.active_monster}"
                 )
-                self.active_player.active_monster.take_damage(20)
+                dealt = self._apply_status_damage("POISONED_20", 20)
+                self._emit_status_tick("POISONED_20", dealt, False)
             if "BURNED" in self.active_player.active_monster.special_conditions:
                 logger.info(
                     f"Adding 20 damage for BURNED {self.active_player.active_monster}"
                 )
-                self.active_player.active_monster.take_damage(20)
+                dealt = self._apply_status_damage("BURNED", 20)
                 logger.info(
                     f"Flipping a coin for BURNED {self.active_player.active_monster}"
                 )
@@ -69,10 +89,12 @@ class GameState:
                         f"HEADS {self.active_player.active_monster} has recovered from BURNED."
                     )
                     del self.active_player.active_monster.special_conditions["BURNED"]
+                    self._emit_status_tick("BURNED", dealt, True)
                 else:
                     logger.info(
                         f"TAILS: {self.active_player.active_monster} remains BURNED."
                     )
+                    self._emit_status_tick("BURNED", dealt, False)
             if "ASLEEP" in self.active_player.active_monster.special_conditions:
                 logger.info(
                     f"Flipping a coin for ASLEEP {self.active_player.active_monster}"
@@ -82,13 +104,16 @@ class GameState:
                         f"HEADS: {self.active_player.active_monster} has recovered from ASLEEP."
                     )
                     del self.active_player.active_monster.special_conditions["ASLEEP"]
+                    self._emit_status_tick("ASLEEP", 0, True)
                 else:
                     logger.info(
                         f"TAILS: {self.active_player.active_monster} remains ASLEEP."
                     )
+                    self._emit_status_tick("ASLEEP", 0, False)
             if "PARALYZED" in self.active_player.active_monster.special_conditions:
                 logger.info(f"Removing PARALYZED from {self.active_player.active_monster}")
                 del self.active_player.active_monster.special_conditions["PARALYZED"]
+                self._emit_status_tick("PARALYZED", 0, True)
 
         # Reset monster card flags for the new active player.
         if self.active_player.active_monster:
@@ -103,6 +128,27 @@ class GameState:
             monster.has_evolved = False
             monster.is_immune = False
 
+    def _apply_status_damage(self, status: str, damage: int) -> int:
+        """
+        Deals status damage to the active player's active monster.
+
+        Returns:
+            The damage dealt: `damage`, or 0 if the monster was immune.
+        """
+        monster = self.active_player.active_monster
+        if not monster.take_damage(damage):
+            return 0
+        if DamageApplied in self.events:
+            self.events.emit(DamageApplied(monster, damage, status))
+        return damage
+
+    def _emit_status_tick(self, status: str, damage: int, recovered: bool) -> None:
+        """Publishes a `StatusTick` for the active player's active monster, if anyone listens."""
+        if StatusTick in self.events:
+            self.events.emit(
+                StatusTick(self.active_player.active_monster, status, damage, recovered)
+            )
+
     def _handle_knockout(self, knocked_out_player: PlayerUnit):
         """
         Handles the entire sequence of a monster being knocked out.
@@ -110,6 +156,8 @@ class GameState:
         # 1. Announce the knockout.
         fainted_monster = knocked_out_player.active_monster
         logger.info(f"{fainted_monster.title} for {knocked_out_player.title} has been knocked out!")
+        if Knockout in self.events:
+            self.events.emit(Knockout(knocked_out_player, fainted_monster))
 
         # 2. Move the fainted monster and all its attachments to the discard pile.
         # Discard attached mana.
@@ -134,6 +182,10 @@ class GameState:
         if prize_taker.prize:
             first_prize_slot = next(iter(prize_taker.prize))
             prize_taker.take_prize_card(first_prize_slot)
+            if PrizeTaken in self.events:
+                self.events.emit(
+                    PrizeTaken(prize_taker, first_prize_slot, len(prize_taker.prize))
+                )
 
         # 5. Check for win condition (no more prize cards).
         if not prize_taker.prize:
@@ -151,9 +203,11 @@ class GameState:
 
     def check_knockouts(self):
         """Checks both players for knocked out monsters."""
-        if self.player1.active_monster and self.player1.active_monster.health <= 0:
-            self._handle_knockout(self.player1)
-        if self.player2.active_monster and self.player2.active_monster.health <= 0:
-            self._handle_knockout(self.player2)
+        for player in (self.player1, self.player2):
+            if player.active_monster and player.active_monster.health <= 0:
+                if PROFILER.enabled:
+                    PROFILER.call("knockout", self._handle_knockout, player)
+                else:
+                    self._handle_knockout(player)
 
     
\ No newline at end of file
@@ -0,0 +1,82 @@
+import time
+from typing import Any, Callable
+
+
+class Profiler:
+    """
+    Opt-in call counters and cumulative timers for engine phases.
+
+    Instrumented call sites check `PROFILER.enabled` once and route through `call()`
+    only when profiling is on, so a disabled profiler costs a single attribute branch.
+    Phase keys are dotted names such as `legal_actions.ATTACK`, `command.BenchCommand`,
+    `effect.HEAL`, `knockout` and `db.load_card`.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        # key -> [call count, cumulative seconds]
+        self._stats: dict[str, list] = {}
+
+    def enable(self) -> None:
+        """Starts recording."""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stops recording; collected statistics are kept until `reset()`."""
+        self.enabled = False
+
+    def reset(self) -> None:
+        """Discards all collected statistics."""
+        self._stats.clear()
+
+    def call(self, key: str, func: Callable, *args, **kwargs) -> Any:
+        """
+        Calls `func` and records its duration under `key`.
+
+        Returns:
+            Whatever `func` returns.
+        """
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.record(key, time.perf_counter() - start)
+
+    def record(self, key: str, elapsed: float) -> None:
+        """Adds one call of `elapsed` seconds to the statistics for `key`."""
+        stats = self._stats.get(key)
+        if stats is None:
+            self._stats[key] = [1, elapsed]
+        else:
+            stats[0] += 1
+            stats[1] += elapsed
+
+    def snapshot(self) -> dict:
+        """
+        Returns the collected statistics as a plain dictionary:
+        `{key: {"calls": int, "total_ms": float, "mean_us": float}}`.
+        """
+        return {
+            key: {
+                "calls": calls,
+                "total_ms": total * 1e3,
+                "mean_us": total / calls * 1e6,
+            }
+            for key, (calls, total) in sorted(self._stats.items())
+        }
+
+    def format_report(self) -> str:
+        """Formats the snapshot as a table sorted by cumulative time."""
+        rows = sorted(self.snapshot().items(), key=lambda item: -item[1]["total_ms"])
+        if not rows:
+            return "No profiling data recorded."
+        lines = [f"{'phase':<32} {'calls':>8} {'total ms':>12} {'mean us':>12}"]
+        for key, stats in rows:
+            lines.append(
+                f"{key:<32} {stats['calls']:>8} {stats['total_ms']:>12.3f} {stats['mean_us']:>12.2f}"
+            )
+        return "\n".join(lines)
+
+
+# The process-wide profiler used by all instrumented call sites.
+PROFILER = Profiler()
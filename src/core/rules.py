@@ -1,14 +1,24 @@
 import logging
 
 from typing import TYPE_CHECKING
-from core.enums import CardType, StageType, ManaType
+from core.actions import PASS_ACTION, Action
+from core.enums import ActionType, CardType, StageType
 from controller.commands.base_command import Command
+from core.profiling import PROFILER
 
 if TYPE_CHECKING:
     from core.game import GameState
 
 logger = logging.getLogger(__name__)
 
+# The version of the game rules as the engine implements them. Bump it with any change to
+# rules, combat, effects or card data that can change how a game plays out: simulation results
+# cached under the old version (see `simulation/matchups.py`) are then recomputed.
+RULES_VERSION = 1
+
+# Stages a card in hand must have to evolve a monster in play.
+EVOLUTION_STAGES = (StageType.STAGEONE, StageType.STAGETWO)
+
 
 class RulesEngine:
     """
@@ -17,6 +27,9 @@ class RulesEngine:
     * **Get-action methods** return a list of all possible actions of a certain type and their potential targets.
     """
 
+    # (profiler key, get-action method) pairs, filled in below the class body.
+    ACTION_GENERATORS: tuple = ()
+
     @staticmethod
     def get_illegality_reason(game_state: "GameState", command: Command) -> str:
         """
@@ -34,56 +47,44 @@ class RulesEngine:
             A string explaining why the command is illegal.
         """
         player = game_state.current_player
-        command_type = command.__class__.__name__.replace("Command", "").upper()
+        action = Action.from_command(command)
+        if action is None:
+            return f"Unknown action type '{command.__class__.__name__}'."
 
-        # Dynamically find the private validation method corresponding to the command.
-        # e.g., for "ActivateCommand", it looks for "_validate_activate_action".
-        validator_method_name = f"_validate_{command_type.lower()}_action"
+        # Find the private validation method corresponding to the action type.
+        # e.g., for ActionType.ACTIVATE, it looks for "_validate_activate_action".
+        validator_method_name = f"_validate_{action.type.name.lower()}_action"
         validator = getattr(RulesEngine, validator_method_name, None)
 
         if not validator:
-            return f"Unknown action type '{command_type}'."
+            return f"Unknown action type '{action.type.name}'."
 
-        # Call the specific validator with the command's attributes.
-        # The validator returns (is_legal, reason). We only care about the reason.
-        _, reason = validator(game_state, player, **command.__dict__)
+        # Call the specific validator with the action's arguments, which follow the
+        # validator's parameter order. We only care about the reason.
+        _, reason = validator(game_state, player, *action.args)
 
         return reason or "An unknown rule prevented this action."
 
     @staticmethod
-    def get_legal_actions(game_state, player) -> list:
+    def get_legal_actions(game_state, player) -> list[Action]:
         """
         Constructs a list of all permissible actions allowed to be taken by a player
         throughout the course of their turn. This list is assembled from the get-action
         methods, who perform validation checks on actions to be performed by the player
-        and return a list of legal actions with plausible targets.
+        and return a list of legal `Action`s with plausible targets.
         """
-        legal_actions = []
-
         # The player can pass at any time.
-        legal_actions.append({"type": "PASS"})
+        legal_actions = [PASS_ACTION]
         logger.debug(f"Legal action approved: PASS for {player.title}")
 
-        attack_actions = RulesEngine._get_attack_actions(game_state, player)
-        legal_actions.extend(attack_actions)
-
-        activate_actions = RulesEngine._get_activate_actions(game_state, player)
-        legal_actions.extend(activate_actions)
-
-        attach_actions = RulesEngine._get_attach_actions(game_state, player)
-        legal_actions.extend(attach_actions)
-
-        bench_actions = RulesEngine._get_bench_actions(game_state, player)
-        legal_actions.extend(bench_actions)
-
-        evolve_actions = RulesEngine._get_evolve_actions(game_state, player)
-        legal_actions.extend(evolve_actions)
-
-        retreat_actions = RulesEngine._get_retreat_actions(game_state, player)
-        legal_actions.extend(retreat_actions)
-
-        use_actions = RulesEngine._get_use_actions(game_state, player)
-        legal_actions.extend(use_actions)
+        if PROFILER.enabled:
+            for profile_key, get_actions in RulesEngine.ACTION_GENERATORS:
+                legal_actions.extend(
+                    PROFILER.call(profile_key, get_actions, game_state, player)
+                )
+        else:
+            for _, get_actions in RulesEngine.ACTION_GENERATORS:
+                legal_actions.extend(get_actions(game_state, player))
 
         return legal_actions
 
@@ -125,7 +126,7 @@ class RulesEngine:
         return (True, None)
 
     @staticmethod
-    def _get_activate_actions(game_state, player) -> list:
+    def _get_activate_actions(game_state, player) -> list[Action]:
         """
         Generates a list of legal ACTIVATE actions.
         """
@@ -137,12 +138,7 @@ class RulesEngine:
                 game_state, player, card.id
             )
             if is_legal:
-                actions.append(
-                    {
-                        "type": "ACTIVATE",
-                        "payload": {"card_id": card.id, "card_title": card.title},
-                    }
-                )
+                actions.append(Action(ActionType.ACTIVATE, card.id))
                 logger.debug(
                     f"Legal action approved: ACTIVATE for {card.title} ({card.id})"
                 )
@@ -186,7 +182,7 @@ class RulesEngine:
         return (True, None)
 
     @staticmethod
-    def _get_attach_actions(game_state, player) -> list:
+    def _get_attach_actions(game_state, player) -> list[Action]:
         """
         Generates a list of legal ATTACH actions.
         """
@@ -209,13 +205,7 @@ class RulesEngine:
                 )
                 if is_legal:
                     actions.append(
-                        {
-                            "type": "ATTACH",
-                            "payload": {
-                                "mana_card_id": mana_card.id,
-                                "target_monster_id": target_monster.id,
-                            },
-                        }
+                        Action(ActionType.ATTACH, mana_card.id, target_monster.id)
                     )
         return actions
 
@@ -269,14 +259,14 @@ class RulesEngine:
 
         # Check for sufficient mana for the chosen attack.
         attack = attacker.card.attacks[attack_index]
-        if not attacker.has_mana(attack.cost):
+        if not attacker.can_afford_attack(attack_index):
             return (False, f"Not enough mana for {attack.title}")
 
         # All checks pass! The action is legal.
         return (True, None)
 
     @staticmethod
-    def _get_attack_actions(game_state, player) -> list:
+    def _get_attack_actions(game_state, player) -> list[Action]:
         actions = []
         attacker = player.active_monster
         if not attacker:
@@ -287,19 +277,16 @@ class RulesEngine:
         if not target_monster:
             return actions  # No targets, so no attack actions.
 
-        # Iterate through each attack of the active monster.
+        # One lookup answers which attacks the attached mana can pay for.
+        affordable_mask = attacker.get_affordable_mask()
+
+        # Iterate through each affordable attack of the active monster.
         for i, attack in enumerate(attacker.card.attacks):
+            if not affordable_mask >> i & 1:
+                continue
             is_legal, _ = RulesEngine._validate_attack_action(game_state, player, i)
             if is_legal:
-                actions.append(
-                    {
-                        "type": "ATTACK",
-                        "payload": {
-                            "attack_name": attack.title,
-                            "attack_index": i,
-                        },
-                    }
-                )
+                actions.append(Action(ActionType.ATTACK, i))
                 logger.debug(
                     f"Legal action approved: ATTACK '{attack.title}' (index {i}) on target {target_monster.title} (ID: {target_monster.id}) for {player.title}"
                 )
@@ -343,7 +330,7 @@ class RulesEngine:
         return (True, None)
 
     @staticmethod
-    def _get_bench_actions(game_state, player) -> list:
+    def _get_bench_actions(game_state, player) -> list[Action]:
         """
         Generates a list of legal BENCH actions.
         """
@@ -354,12 +341,7 @@ class RulesEngine:
                 game_state, player, card.id
             )
             if is_legal:
-                actions.append(
-                    {
-                        "type": "BENCH",
-                        "payload": {"card_id": card.id, "card_title": card.title},
-                    }
-                )
+                actions.append(Action(ActionType.BENCH, card.id))
                 logger.debug(
                     f"Legal action approved: BENCH for {card.title} ({card.id})"
                 )
@@ -379,10 +361,7 @@ class RulesEngine:
                 False,
                 f"Evolution card with ID {evo_card_id} not found in your hand.",
             )
-        if evo_card.card.type != CardType.MONSTER or evo_card.card.stage not in [
-            StageType.STAGEONE,
-            StageType.STAGETWO,
-        ]:
+        if evo_card.card.type != CardType.MONSTER or evo_card.card.stage not in EVOLUTION_STAGES:
             return (False, f"Card '{evo_card.title}' is not a valid evolution card.")
 
         # 2. Validate the base monster on the field.
@@ -416,43 +395,34 @@ class RulesEngine:
         return (True, None)
 
     @staticmethod
-    def _get_evolve_actions(game_state, player) -> list:
+    def _get_evolve_actions(game_state, player) -> list[Action]:
         """
         Generates a list of legal EVOLVE actions.
         An EVOLVE action is possible if a player has a monster in their hand
         that can evolve from a monster they have on their field.
+
+        Rather than validating every hand card against every monster in play, this
+        joins each evolution card's `evolve_from` title against the player's field
+        monsters indexed by title.
         """
         actions = []
 
-        # Find all potential evolution cards in hand (Stage 1 or 2).
-        evo_cards_in_hand = [
-            card
-            for card in player.hand.values()
-            if card.card.type == CardType.MONSTER
-            and card.card.stage in [StageType.STAGEONE, StageType.STAGETWO]
-        ]
+        # Index the monsters in play by title.
+        field_by_title = player.get_field_monsters_by_title()
 
-        # Find all potential base monsters on the field.
-        monsters_on_field = (
-            [player.active_monster] if player.active_monster else []
-        ) + list(player.bench.values())
+        if not field_by_title:
+            return actions
 
-        # For each combination, check if the evolution is valid.
-        for evo_card in evo_cards_in_hand:
-            for base_monster in monsters_on_field:
-                is_legal, _ = RulesEngine._validate_evolve_action( # This call was already correct
-                    game_state, player, evo_card.id, base_monster.id
-                )
-                if is_legal:
-                    actions.append(
-                        {
-                            "type": "EVOLVE",
-                            "payload": {
-                                "evo_card_id": evo_card.id,
-                                "base_card_id": base_monster.id,
-                            },
-                        }
-                    )
+        # Join each evolution card in hand (Stage 1 or 2) with its base monsters in play.
+        for evo_card in player.hand.values():
+            template = evo_card.card
+            if template.type != CardType.MONSTER or template.stage not in EVOLUTION_STAGES:
+                continue
+            for base_monster in field_by_title.get(template.evolve_from, ()):
+                # A monster may only evolve once per turn.
+                if base_monster.has_evolved:
+                    continue
+                actions.append(Action(ActionType.EVOLVE, evo_card.id, base_monster.id))
         return actions
 
     @staticmethod
@@ -476,8 +446,7 @@ class RulesEngine:
             return (False, f"Monster with ID {new_active_id} not found on your bench.")
 
         # 4. Check if the active monster can pay the retreat cost.
-        retreat_cost = player.active_monster.card.retreat_val
-        if not player.active_monster.has_mana({ManaType.COLORLESS: retreat_cost}):
+        if not player.active_monster.can_afford_retreat():
             return (
                 False,
                 f"Not enough mana to pay retreat cost for '{player.active_monster.title}'.",
@@ -499,25 +468,22 @@ class RulesEngine:
         return (True, None)
 
     @staticmethod
-    def _get_retreat_actions(game_state, player) -> list:
+    def _get_retreat_actions(game_state, player) -> list[Action]:
         """
         Generates a list of legal RETREAT actions.
         """
         actions = []
+        # The retreat cost is the same whichever monster is promoted; check it once.
+        if not player.active_monster or not player.active_monster.can_afford_retreat():
+            return actions
+
         # For each monster on the bench, check if it can be promoted.
         for benched_monster in player.bench.values():
             is_legal, _ = RulesEngine._validate_retreat_action(
                 game_state, player, benched_monster.id
             )
             if is_legal:
-                actions.append(
-                    {
-                        "type": "RETREAT",
-                        "payload": {
-                            "promoted_monster_id": benched_monster.id,
-                        },
-                    }
-                )
+                actions.append(Action(ActionType.RETREAT, benched_monster.id))
         return actions
 
     @staticmethod
@@ -540,7 +506,7 @@ class RulesEngine:
         return (True, None)
 
     @staticmethod
-    def _get_use_actions(game_state, player) -> list:
+    def _get_use_actions(game_state, player) -> list[Action]:
         """
         Generates a list of legal USE actions for utility cards in hand.
         """
@@ -549,10 +515,18 @@ class RulesEngine:
         for card in player.hand.values():
             is_legal, _ = RulesEngine._validate_use_action(game_state, player, card.id)
             if is_legal:
-                actions.append(
-                    {
-                        "type": "USE",
-                        "payload": {"card_id": card.id, "card_title": card.title},
-                    }
-                )
+                actions.append(Action(ActionType.USE, card.id))
         return actions
+
+
+# The get-action methods that make up `get_legal_actions`, in order, each paired with
+# the key under which the profiler records it.
+RulesEngine.ACTION_GENERATORS = (
+    ("legal_actions.ATTACK", RulesEngine._get_attack_actions),
+    ("legal_actions.ACTIVATE", RulesEngine._get_activate_actions),
+    ("legal_actions.ATTACH", RulesEngine._get_attach_actions),
+    ("legal_actions.BENCH", RulesEngine._get_bench_actions),
+    ("legal_actions.EVOLVE", RulesEngine._get_evolve_actions),
+    ("legal_actions.RETREAT", RulesEngine._get_retreat_actions),
+    ("legal_actions.USE", RulesEngine._get_use_actions),
+)
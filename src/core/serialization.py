@@ -0,0 +1,377 @@
+import struct
+from typing import TYPE_CHECKING, Callable, Mapping
+
+from core.deltas import FLAG_ATTACHED, FLAG_ATTACKED, FLAG_EVOLVED, FLAG_IMMUNE, monster_flags
+from core.enums import ManaType
+from core.game import GameState
+from effects.effect_registry import EffectRegistry
+from models.card import CardTemplate
+from models.deck import DeckZone
+from models.mana import ManaCard, ManaTemplate
+from models.monster import MANA_SLOTS, MonsterCard, MonsterTemplate
+from models.player import PlayerUnit
+from models.utility import UtilityCard, UtilityTemplate
+
+if TYPE_CHECKING:
+    TemplateSource = Mapping[str, object] | Callable[[str], object]
+
+MAGIC = b"BSGS"
+# Bump on any change to the layout below; `decode_game` refuses versions it does not know.
+FORMAT_VERSION = 1
+
+# Card kinds, as stored in the template table.
+KIND_MONSTER = 0
+KIND_MANA = 1
+KIND_UTILITY = 2
+TEMPLATE_KINDS = {MonsterTemplate: KIND_MONSTER, ManaTemplate: KIND_MANA, UtilityTemplate: KIND_UTILITY}
+CARD_CLASSES = {KIND_MONSTER: MonsterCard, KIND_MANA: ManaCard, KIND_UTILITY: UtilityCard}
+
+# A card or attachment reference that points at nothing (an empty prize slot, no active
+# monster, no attached mana).
+NO_INDEX = 0xFFFF
+
+# magic, version, then the sizes of the string, template, card and attachment tables.
+_HEADER = struct.Struct("<4sHHHHH")
+_U16 = struct.Struct("<H")
+_TEMPLATE = struct.Struct("<BH")  # kind, title (string index)
+_CARD = struct.Struct("<IH")  # card ID, template index
+_MONSTER = struct.Struct("<hBHBBB")  # health, flags, attachment, conditions, pooled mana, prior stages
+_POOLED = struct.Struct("<Bh")  # mana slot, amount
+_GAME = struct.Struct("<IBBH")  # turn, current player, winner, phase (string index)
+_PRIZE = struct.Struct("<BH")  # prize slot, card index
+
+MANA_TYPES = list(ManaType)
+# Copying a filled dictionary skips hashing every `ManaType` again, which `Enum` does slowly.
+_EMPTY_MANA_POOL = dict.fromkeys(ManaType, 0)
+PLAYER_INDEXES = {1: "player1", 2: "player2"}
+
+
+def _zones(player: PlayerUnit) -> tuple:
+    """The dictionary zones of a player, in the order they are stored."""
+    return (player.field, player.deck, player.hand, player.discard, player.bench)
+
+
+def encode_game(game_state: GameState) -> bytes:
+    """
+    Encodes a game as compact binary, for checkpoints, for handing positions to worker
+    processes and for saving suspended games.
+
+    Only per-game state is written: every card once, as its ID, its template's title and
+    (for monsters) the fields play mutates, then each player's zones as lists of indexes
+    into that card table. Templates, attacks and ability effects are not written; the
+    decoder looks the templates up again and rebuilds the rest from them, as
+    `GameState.clone()` does. Cards reachable from several places (the field and a zone,
+    an evolution and its prior stages, the attached-mana dictionary an evolution shares
+    with its base) are written once and stay shared after decoding.
+
+    Legal actions and event subscribers are not part of the encoding.
+
+    Layout (little-endian): a header of `MAGIC`, `FORMAT_VERSION` and the table sizes;
+    the string table (u16 length + UTF-8); the template table (kind, title); the card
+    table; the attached-mana table (a count and card indexes per dictionary); the game
+    fields; then the two players.
+    """
+    encoder = _Encoder()
+    for player in (game_state.player1, game_state.player2):
+        encoder.number_player(player)
+
+    winner = 0
+    if game_state.winner is not None:
+        winner = 1 if game_state.winner is game_state.player1 else 2
+    current = 1 if game_state.active_player is game_state.player1 else 2
+    game = _GAME.pack(game_state.turn_count, current, winner, encoder.string(game_state.current_phase))
+    players = b"".join(encoder.player(player) for player in (game_state.player1, game_state.player2))
+    cards = encoder.card_table()
+    attachments = encoder.attachment_table()
+
+    strings = bytearray()
+    for text in encoder.strings:
+        raw = text.encode("utf-8")
+        strings += _U16.pack(len(raw)) + raw
+    templates = b"".join(_TEMPLATE.pack(kind, title) for kind, title in encoder.template_rows)
+    header = _HEADER.pack(
+        MAGIC, FORMAT_VERSION, len(encoder.strings), len(encoder.template_rows),
+        len(encoder.cards), len(encoder.attachments),
+    )
+    return b"".join((header, strings, templates, cards, attachments, game, players))
+
+
+def collect_templates(game_state: GameState) -> dict[str, object]:
+    """
+    Returns the templates a game's cards use, by title: a template lookup for
+    `decode_game` in a process that already has the cards loaded.
+    """
+    templates = {}
+    for player in (game_state.player1, game_state.player2):
+        for card in _player_cards(player):
+            templates[card.card.title] = card.card
+    return templates
+
+
+def _player_cards(player: PlayerUnit):
+    for zone in _zones(player):
+        yield from zone.values()
+    yield from (card for card in player.prize.values() if card is not None)
+    if player.active_monster is not None:
+        yield player.active_monster
+
+
+class _Encoder:
+    """Numbers the strings, templates, cards and attachments of one game as it is encoded."""
+
+    def __init__(self) -> None:
+        self.strings: dict[str, int] = {}
+        # id(template) -> index; rows are (kind, title string index).
+        self.templates: dict[int, int] = {}
+        self.template_rows: list[tuple[int, int]] = []
+        # Cards and attached-mana dictionaries are numbered by identity so that sharing
+        # survives the round trip.
+        self.cards: dict[int, int] = {}
+        self.card_list: list = []
+        self.attachments: dict[int, int] = {}
+        self.attachment_list: list[dict] = []
+
+    def string(self, text: str) -> int:
+        index = self.strings.get(text)
+        if index is None:
+            index = self.strings[text] = len(self.strings)
+        return index
+
+    def template(self, template) -> int:
+        index = self.templates.get(id(template))
+        if index is None:
+            kind = TEMPLATE_KINDS.get(type(template))
+            if kind is None:
+                raise TypeError(f"Cannot encode a card with template {template!r}.")
+            index = self.templates[id(template)] = len(self.template_rows)
+            self.template_rows.append((kind, self.string(template.title)))
+        return index
+
+    #! NUMBERING
+    def number_player(self, player: PlayerUnit) -> None:
+        cards = self.cards
+        for card in _player_cards(player):
+            if id(card) not in cards:
+                self.number(card)
+
+    def number(self, card) -> int:
+        index = self.cards.get(id(card))
+        if index is not None:
+            return index
+        index = self.cards[id(card)] = len(self.card_list)
+        self.card_list.append(card)
+        if isinstance(card, MonsterCard):
+            if card.attached_mana and id(card.attached_mana) not in self.attachments:
+                self.attachments[id(card.attached_mana)] = len(self.attachment_list)
+                self.attachment_list.append(card.attached_mana)
+                for mana_card in card.attached_mana.values():
+                    self.number(mana_card)
+            for prior in card.prior_evos:
+                self.number(prior)
+        return index
+
+    #! TABLES
+    def card_table(self) -> bytes:
+        out = bytearray()
+        cards, attachments = self.cards, self.attachments
+        for card in self.card_list:
+            out += _CARD.pack(card.id, self.template(card.card))
+            if not isinstance(card, MonsterCard):
+                continue
+            # `mana_pool` always holds every mana type; only the nonzero entries are written.
+            pooled = [(MANA_SLOTS[mana_type], amount) for mana_type, amount in card.mana_pool.items() if amount]
+            attachment = attachments[id(card.attached_mana)] if card.attached_mana else NO_INDEX
+            out += _MONSTER.pack(
+                card.health, monster_flags(card), attachment,
+                len(card.special_conditions), len(pooled), len(card.prior_evos),
+            )
+            for condition in card.special_conditions:
+                out += _U16.pack(self.string(condition))
+            for slot, amount in pooled:
+                out += _POOLED.pack(slot, amount)
+            for prior in card.prior_evos:
+                out += _U16.pack(cards[id(prior)])
+        return bytes(out)
+
+    def attachment_table(self) -> bytes:
+        out = bytearray()
+        cards = self.cards
+        for attached in self.attachment_list:
+            out += _U16.pack(len(attached))
+            out += struct.pack(f"<{len(attached)}H", *(cards[id(card)] for card in attached.values()))
+        return bytes(out)
+
+    def player(self, player: PlayerUnit) -> bytes:
+        cards = self.cards
+        out = bytearray(_U16.pack(self.string(player.title)))
+        for zone in _zones(player):
+            out += _U16.pack(len(zone))
+            out += struct.pack(f"<{len(zone)}H", *(cards[id(card)] for card in zone.values()))
+        out += _U16.pack(len(player.prize))
+        for slot, card in player.prize.items():
+            out += _PRIZE.pack(slot, NO_INDEX if card is None else cards[id(card)])
+        active = player.active_monster
+        out += _U16.pack(NO_INDEX if active is None else cards[id(active)])
+        return bytes(out)
+
+
+def decode_game(data: bytes, templates: "TemplateSource") -> GameState:
+    """
+    Rebuilds a game encoded by `encode_game`.
+
+    Cards are relinked to the templates `templates` returns for their titles, so every
+    decoded game shares one set of templates, as clones do; per-card ability and effect
+    objects are rebuilt once per template and shared too. Card IDs are kept, and the
+    global ID counter is moved past them so cards created afterwards do not collide.
+
+    Args:
+        data: The encoded game.
+        templates: The template for each card title, as a mapping (see
+            `collect_templates`) or a function of the title.
+
+    Raises:
+        ValueError: If `data` is not an encoded game, was written by a different
+            `FORMAT_VERSION`, or names a template that is missing or of another kind.
+    """
+    lookup = templates.get if isinstance(templates, Mapping) else templates
+    try:
+        return _decode(data, lookup)
+    except (struct.error, IndexError):
+        raise ValueError("Truncated or corrupt game state.") from None
+
+
+def _decode(data, lookup: Callable[[str], object]) -> GameState:
+    magic, version, n_strings, n_templates, n_cards, n_attachments = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError("Not an encoded game state.")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported game state format version {version} (expected {FORMAT_VERSION}).")
+    offset = _HEADER.size
+
+    strings = []
+    for _ in range(n_strings):
+        (length,) = _U16.unpack_from(data, offset)
+        offset += 2
+        strings.append(bytes(data[offset:offset + length]).decode("utf-8"))
+        offset += length
+
+    # Per template: (class, template, the shared ability or effect objects).
+    kinds = []
+    for _ in range(n_templates):
+        kind, title_index = _TEMPLATE.unpack_from(data, offset)
+        offset += _TEMPLATE.size
+        title = strings[title_index]
+        template = lookup(title)
+        if template is None:
+            raise ValueError(f"No template for card '{title}'.")
+        if TEMPLATE_KINDS.get(type(template)) != kind:
+            raise ValueError(f"Template for card '{title}' is not of the encoded kind.")
+        kinds.append((CARD_CLASSES[kind], template, _card_effects(kind, template)))
+
+    cards = []
+    # (monster, attachment index, prior stage indexes), linked once every card exists.
+    links = []
+    max_id = -1
+    for _ in range(n_cards):
+        card_id, template_index = _CARD.unpack_from(data, offset)
+        offset += _CARD.size
+        card_cls, template, effects = kinds[template_index]
+        card = card_cls.__new__(card_cls)
+        card.id = card_id
+        card.card = template
+        max_id = max(max_id, card_id)
+        if card_cls is MonsterCard:
+            health, flags, attachment, n_conditions, n_pooled, n_prior = _MONSTER.unpack_from(data, offset)
+            offset += _MONSTER.size
+            card.health = health
+            card.mana_pool = _EMPTY_MANA_POOL.copy()
+            card.attached_mana = {}
+            card.special_conditions = {}
+            card.prior_evos = []
+            card.abilities = effects
+            card.has_attacked = bool(flags & FLAG_ATTACKED)
+            card.has_attached = bool(flags & FLAG_ATTACHED)
+            card.has_evolved = bool(flags & FLAG_EVOLVED)
+            card.is_immune = bool(flags & FLAG_IMMUNE)
+            for _ in range(n_conditions):
+                card.special_conditions[strings[_U16.unpack_from(data, offset)[0]]] = True
+                offset += 2
+            for _ in range(n_pooled):
+                slot, amount = _POOLED.unpack_from(data, offset)
+                offset += _POOLED.size
+                card.mana_pool[MANA_TYPES[slot]] = amount
+            prior = struct.unpack_from(f"<{n_prior}H", data, offset)
+            offset += 2 * n_prior
+            links.append((card, attachment, prior))
+        elif card_cls is UtilityCard:
+            card.effects = list(effects)
+        cards.append(card)
+
+    attachments = []
+    for _ in range(n_attachments):
+        indexes, offset = _indexes(data, offset)
+        attachments.append({cards[index].id: cards[index] for index in indexes})
+    for card, attachment, prior in links:
+        if attachment != NO_INDEX:
+            card.attached_mana = attachments[attachment]
+        card.prior_evos = [cards[index] for index in prior]
+
+    turn, current, winner, phase = _GAME.unpack_from(data, offset)
+    offset += _GAME.size
+    player1, offset = _decode_player(data, offset, strings, cards)
+    player2, offset = _decode_player(data, offset, strings, cards)
+
+    game_state = GameState(player1, player2)
+    game_state.turn_count = turn
+    game_state.active_player = player1 if current == 1 else player2
+    game_state.current_phase = strings[phase]
+    game_state.winner = getattr(game_state, PLAYER_INDEXES[winner]) if winner else None
+
+    CardTemplate._next_id = max(CardTemplate._next_id, max_id + 1)
+    return game_state
+
+
+def _card_effects(kind: int, template) -> list:
+    """
+    Builds the ability (monster) or effect (utility) objects of a template once, for every
+    card decoded from it to share, as `MonsterCard.__deepcopy__` shares them.
+    """
+    if kind == KIND_MONSTER:
+        data = template.abilities or []
+    elif kind == KIND_UTILITY:
+        data = template.effects or []
+    else:
+        return []
+    effects = (EffectRegistry.create_effect(entry) for entry in data)
+    return [effect for effect in effects if effect is not None]
+
+
+def _decode_player(data, offset: int, strings: list, cards: list) -> tuple[PlayerUnit, int]:
+    (title,) = _U16.unpack_from(data, offset)
+    player = PlayerUnit(strings[title])
+    offset += 2
+    field, offset = _indexes(data, offset)
+    player.field = {cards[index].id: cards[index] for index in field}
+    deck, offset = _indexes(data, offset)
+    player.deck = DeckZone(cards[index] for index in deck)
+    for name in ("hand", "discard", "bench"):
+        indexes, offset = _indexes(data, offset)
+        setattr(player, name, {cards[index].id: cards[index] for index in indexes})
+
+    (n_prizes,) = _U16.unpack_from(data, offset)
+    offset += 2
+    player.prize = {}
+    for _ in range(n_prizes):
+        slot, index = _PRIZE.unpack_from(data, offset)
+        offset += _PRIZE.size
+        player.prize[slot] = None if index == NO_INDEX else cards[index]
+    (active,) = _U16.unpack_from(data, offset)
+    player.active_monster = None if active == NO_INDEX else cards[active]
+    return player, offset + 2
+
+
+def _indexes(data, offset: int) -> tuple[tuple, int]:
+    (count,) = _U16.unpack_from(data, offset)
+    offset += 2
+    return struct.unpack_from(f"<{count}H", data, offset), offset + 2 * count
+
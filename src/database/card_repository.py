@@ -9,9 +9,33 @@ class CardRepository:
     Data in `CardRepository` is handed off to `core/card_factory.py` to produce card objects.
     """
 
-    def __init__(self) -> None:
-        """Initializes the repository with a database connection."""
-        self.conn = get_db_connection()
+    def __init__(self, db_path: str | None = None) -> None:
+        """
+        Initializes the repository with a database connection.
+
+        Args:
+            db_path: Optional path to a card database. Defaults to `data/cards.db`.
+        """
+        self.conn = get_db_connection(db_path)
+
+    def list_cards(self, card_type: str | None = None) -> list[tuple[str, str]]:
+        """
+        Lists the cards in the database.
+
+        Args:
+            card_type: Optional card type to filter by (e.g., "MONSTER").
+
+        Returns:
+            A list of `(title, set_code)` pairs, in database order.
+        """
+        cursor = self.conn.cursor()
+        if card_type is None:
+            cursor.execute("""SELECT title, set_code FROM cards ORDER BY id""")
+        else:
+            cursor.execute(
+                """SELECT title, set_code FROM cards WHERE card_type = ? ORDER BY id""", (card_type,)
+            )
+        return [(row["title"], row["set_code"]) for row in cursor.fetchall()]
 
     def get_card_data_as_kwargs(self, title: str, set_code: str) -> dict | None:
         """
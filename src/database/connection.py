@@ -7,14 +7,20 @@ SRC_DATABASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DB_PATH = os.path.join(SRC_DATABASE_DIR, "..", "..", "data", "cards.db")
 
 
-def get_db_connection() -> sqlite3.Connection:
-    """Establishes and returns a database connection."""
-    if not os.path.exists(DB_PATH):
+def get_db_connection(db_path: str | None = None) -> sqlite3.Connection:
+    """
+    Establishes and returns a database connection.
+
+    Args:
+        db_path: Optional path to a card database. Defaults to `data/cards.db`.
+    """
+    db_path = db_path or DB_PATH
+    if not os.path.exists(db_path):
         raise FileNotFoundError(
-            f"Database file not found at '{DB_PATH}'. Please ensure it exists."
+            f"Database file not found at '{db_path}'. Please ensure it exists."
         )
 
-    conn = sqlite3.connect(DB_PATH)
+    conn = sqlite3.connect(db_path)
     # This allows us to access columns by name (e.g., row['title']) which is very helpful.
     conn.row_factory = sqlite3.Row
     return conn
@@ -0,0 +1,270 @@
+import json
+import logging
+import multiprocessing
+import struct
+from multiprocessing import resource_tracker, shared_memory
+
+from core.enums import ManaType
+from .card_repository import CardRepository
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"BSCT"
+# Bump on any change to the layout below; `attach` refuses versions it does not know.
+FORMAT_VERSION = 1
+
+# magic, version, card count, string count.
+_HEADER = struct.Struct("<4sHII")
+_OFFSET = struct.Struct("<I")
+# One fixed-size record per card: string-table indexes for the text fields (see
+# `STRING_FIELDS`), then the numeric fields (see `INT_FIELDS`).
+STRING_FIELDS = (
+    "title", "set_code", "type", "stage", "mana_type", "weak_type", "weak_mult",
+    "resist_type", "resist_val", "evolve_from", "attacks", "abilities", "dex_data",
+)
+INT_FIELDS = ("health", "retreat_val", "level")
+_RECORD = struct.Struct(f"<{len(STRING_FIELDS)}I{len(INT_FIELDS)}h")
+
+# Stands for `None` in a string index and in a numeric field.
+NO_STRING = 0xFFFFFFFF
+NO_INT = -0x8000
+
+# Nested fields, stored as JSON text in the string table.
+JSON_FIELDS = ("attacks", "abilities", "dex_data")
+
+# Names of the segments this process created, and so has registered for cleanup.
+_created_segments: set[str] = set()
+
+
+class SharedCatalog:
+    """
+    A read-only copy of the card database in a `multiprocessing.shared_memory` segment,
+    so that the worker processes of a parallel simulation share one catalog instead of
+    each opening `data/cards.db` and holding its own copy.
+
+    The parent loads every card once with `create()` and hands `name` to its workers,
+    which `attach()` to the segment without copying it. The segment holds a table of
+    interned strings (every title, type name and modifier once, and the nested attack,
+    ability and Pokédex data as JSON) and one fixed-size record per card of string
+    indexes and numeric fields. Attaching reads the header and the titles, nothing else;
+    a card's data is read out of the segment when it is asked for.
+
+    `SharedCatalog` has the `get_card_data_as_kwargs` method of `CardRepository`, so it
+    can stand in for one: `CardFactory.create_card_from_db(catalog, title, set_code)`
+    and `generate_deck_from_list(..., card_repo=catalog, template_cache=...)` build
+    templates from it, and a per-worker template cache keeps them to the cards the
+    worker's decks actually use.
+
+    The process that created the segment owns it and must `unlink()` it when the
+    workers are done; every process `close()`s its own view. Both happen on leaving a
+    `with` block.
+    """
+
+    def __init__(self, segment: shared_memory.SharedMemory, owner: bool) -> None:
+        self._segment = segment
+        self._owner = owner
+        self._buffer = segment.buf.toreadonly()
+        self._closed = False
+        magic, version, card_count, string_count = _HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Shared memory segment '{segment.name}' is not a card catalog.")
+        if version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(
+                f"Card catalog format version {version} is not supported (expected {FORMAT_VERSION})."
+            )
+        self._string_offsets = _HEADER.size
+        self._records = self._string_offsets + _OFFSET.size * (string_count + 1)
+        self._text = self._records + _RECORD.size * card_count
+        self._card_count = card_count
+        # string index -> decoded string, filled as strings are read.
+        self._strings: dict[int, str] = {}
+        # (title, set_code) -> record number.
+        self._index: dict[tuple[str, str], int] = {}
+        for number in range(card_count):
+            title, set_code = _RECORD.unpack_from(self._buffer, self._records + _RECORD.size * number)[:2]
+            self._index[(self._string(title), self._string(set_code))] = number
+
+    #! CONSTRUCTION
+    @classmethod
+    def create(cls, card_repo: CardRepository | None = None, name: str | None = None) -> "SharedCatalog":
+        """
+        Loads every monster card from a repository into a new shared memory segment.
+
+        Args:
+            card_repo: The repository to load from. A new one is opened if omitted.
+            name: Optional segment name; a unique one is chosen if omitted.
+
+        Returns:
+            The catalog, owned by this process.
+        """
+        card_repo = card_repo or CardRepository()
+        cards = []
+        for title, set_code in card_repo.list_cards("MONSTER"):
+            card_data = card_repo.get_card_data_as_kwargs(title, set_code)
+            if card_data is not None:
+                cards.append((set_code, card_data))
+        data = pack_catalog(cards)
+        segment = shared_memory.SharedMemory(name=name, create=True, size=len(data))
+        segment.buf[:len(data)] = data
+        _created_segments.add(segment.name)
+        logger.info(f"Loaded {len(cards)} cards into shared catalog '{segment.name}' ({len(data)} bytes).")
+        return cls(segment, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedCatalog":
+        """
+        Attaches to a catalog created by another process, without copying it.
+
+        Raises:
+            FileNotFoundError: If no segment has that name.
+            ValueError: If the segment is not a card catalog of this format version.
+        """
+        segment = shared_memory.SharedMemory(name=name)
+        if multiprocessing.parent_process() is None and name not in _created_segments:
+            # Attaching registers the segment with this process's resource tracker, which
+            # would remove it when this process exits. The creating process and its
+            # children share one tracker, where the segment is already registered;
+            # unrelated processes must not take over the cleanup.
+            resource_tracker.unregister(segment._name, "shared_memory")
+        return cls(segment, owner=False)
+
+    @property
+    def name(self) -> str:
+        """The segment name workers pass to `attach`."""
+        return self._segment.name
+
+    @property
+    def size(self) -> int:
+        """The size of the segment in bytes."""
+        return self._segment.size
+
+    def close(self) -> None:
+        """Releases this process's view of the segment."""
+        if self._closed:
+            return
+        self._closed = True
+        self._buffer.release()
+        self._segment.close()
+
+    def unlink(self) -> None:
+        """Frees the segment. Only the creating process should call this, once."""
+        if self._owner:
+            self._owner = False
+            self._segment.unlink()
+            _created_segments.discard(self._segment.name)
+
+    def __enter__(self) -> "SharedCatalog":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+        self.unlink()
+
+    #! LOOKUP METHODS
+    def __len__(self) -> int:
+        return self._card_count
+
+    def __contains__(self, key) -> bool:
+        return key in self._index
+
+    def list_cards(self, card_type: str | None = None) -> list[tuple[str, str]]:
+        """Lists the `(title, set_code)` pairs in the catalog, as `CardRepository.list_cards` does."""
+        if card_type is None:
+            return list(self._index)
+        return [key for key in self._index if self.get_card_data_as_kwargs(*key)["type"] == card_type]
+
+    def get_card_data_as_kwargs(self, title: str, set_code: str) -> dict | None:
+        """
+        Reads one card's data out of the segment, in the form `CardRepository` returns it.
+
+        Returns:
+            A dictionary of kwargs for the card factory, or `None` if the card is not in
+            the catalog.
+        """
+        number = self._index.get((title, set_code))
+        if number is None:
+            return None
+        values = _RECORD.unpack_from(self._buffer, self._records + _RECORD.size * number)
+        card_data = {
+            field: self._string(index)
+            for field, index in zip(STRING_FIELDS, values[:len(STRING_FIELDS)])
+        }
+        for field, value in zip(INT_FIELDS, values[len(STRING_FIELDS):]):
+            card_data[field] = None if value == NO_INT else value
+        del card_data["set_code"]
+        for field in JSON_FIELDS:
+            card_data[field] = json.loads(card_data[field])
+        for attack in card_data["attacks"]:
+            attack["cost"] = {ManaType(mana_type): quantity for mana_type, quantity in attack["cost"].items()}
+        return card_data
+
+    def _string(self, index: int) -> str | None:
+        if index == NO_STRING:
+            return None
+        text = self._strings.get(index)
+        if text is None:
+            start, end = struct.unpack_from("<2I", self._buffer, self._string_offsets + _OFFSET.size * index)
+            text = self._strings[index] = str(self._buffer[self._text + start:self._text + end], "utf-8")
+        return text
+
+
+def pack_catalog(cards: list[tuple[str, dict]]) -> bytes:
+    """
+    Lays out card data in the shared catalog format.
+
+    Args:
+        cards: `(set_code, kwargs)` pairs, the kwargs as `CardRepository.get_card_data_as_kwargs`
+            returns them.
+    """
+    strings: dict[str, int] = {}
+
+    def intern(value) -> int:
+        if value is None:
+            return NO_STRING
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(strings)
+        return index
+
+    records = bytearray()
+    for set_code, card_data in cards:
+        fields = dict(card_data, set_code=set_code)
+        fields["attacks"] = [
+            dict(attack, cost={_mana_value(mana_type): quantity for mana_type, quantity in attack["cost"].items()})
+            for attack in card_data["attacks"]
+        ]
+        fields["abilities"] = [
+            {"details": dict(ability["details"]), "effects": [dict(effect) for effect in ability["effects"]]}
+            for ability in card_data.get("abilities") or []
+        ]
+        fields["dex_data"] = dict(card_data.get("dex_data") or {})
+        for field in JSON_FIELDS:
+            fields[field] = json.dumps(fields[field], separators=(",", ":"))
+        records += _RECORD.pack(
+            *(intern(_text(fields.get(field))) for field in STRING_FIELDS),
+            *(NO_INT if fields.get(field) is None else fields[field] for field in INT_FIELDS),
+        )
+
+    encoded = [text.encode("utf-8") for text in strings]
+    offsets = [0]
+    for raw in encoded:
+        offsets.append(offsets[-1] + len(raw))
+    return b"".join((
+        _HEADER.pack(MAGIC, FORMAT_VERSION, len(cards), len(strings)),
+        struct.pack(f"<{len(offsets)}I", *offsets),
+        bytes(records),
+        *encoded,
+    ))
+
+
+def _mana_value(mana_type) -> str:
+    return mana_type.value if isinstance(mana_type, ManaType) else str(mana_type).lower()
+
+
+def _text(value) -> str | None:
+    """Stores enum-valued fields by name, as the database does."""
+    if value is None or isinstance(value, str):
+        return value
+    return getattr(value, "value", str(value))
@@ -8,6 +8,7 @@ class EffectRegistry:
     """Central registry mapping effect-type strings to Effect classes"""
 
     _effects: dict = {}
+    _modules_loaded: bool = False
 
     @classmethod
     def register(cls, effect_type):
@@ -20,9 +21,29 @@ class EffectRegistry:
 
         return wrapper
 
+    @classmethod
+    def load_effect_modules(cls) -> None:
+        """
+        Imports the effect modules, whose classes register themselves on import.
+        This happens on first use rather than when the registry is imported.
+        """
+        if cls._modules_loaded:
+            return
+        cls._modules_loaded = True
+        from . import monster_effects  # noqa: F401
+        from . import player_effects  # noqa: F401
+
+    @classmethod
+    def get_effect_names(cls) -> frozenset[str]:
+        """Returns every registered effect name, e.g. for validating card data."""
+        cls.load_effect_modules()
+        return frozenset(cls._effects)
+
     @classmethod
     def create_effect(cls, effect_dict: dict) -> Effect:
         """Factory method: dict -> Effect instance"""
+        if not cls._modules_loaded:
+            cls.load_effect_modules()
         # Get the effect_name str from the dict, which matches the DB column
         effect_name = effect_dict.get("effect_name")
         # Get the effect_class from the _effects list
@@ -34,7 +55,3 @@ class EffectRegistry:
             return None
         return effect_class(**effect_dict)
 
-
-# Import all effect modules here to ensure they are registered.
-from . import monster_effects # noqa: E402, F401
-from . import player_effects  # noqa: E402, F401
@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING
 import copy
 from .base_effect import Effect
 from .effect_registry import EffectRegistry
+from core.events import DamageApplied
 from logging import getLogger
 
 logger = getLogger(__name__)
@@ -58,11 +59,14 @@ class DamageSelfEffect(Effect):
             self.damage_amount = 0
     
     def execute(self, **kwargs) -> None:
+        game_state: "GameState" = kwargs.get("game_state")
         source_player: "PlayerUnit" = kwargs.get("source_player")
         if self.damage_amount <= 0:
             return
 
-        source_player.active_monster.take_damage(self.damage_amount)
+        monster = source_player.active_monster
+        if monster.take_damage(self.damage_amount) and DamageApplied in game_state.events:
+            game_state.events.emit(DamageApplied(monster, self.damage_amount, "DAMAGE_SELF"))
         logger.info(f"Dealt {self.damage_amount} damage to {source_player.active_monster.title}.")
 
 
@@ -1,23 +1,42 @@
+import argparse
 import logging
-
-import colorlog
+import os
+import random
+import sys
 
 from controller.game_controller import GameController
-from core.card_factory import CardFactory
+from core.card_factory import generate_deck_from_list
 from core.carddata import give_test_card
 from core.game import GameState
+from core.profiling import PROFILER
 from database.card_repository import CardRepository
-from models.monster import MonsterCard, MonsterTemplate
 from models.player import PlayerUnit
-from termio.view import TerminalView
+from simulation.headless import prepare_player
 
 logger = logging.getLogger(__name__)
 
+# Define a specific deck list for the player for targeted testing.
+# The `generate_deck_from_list` function will take these titles
+# and fetch their full data from the database.
+PLAYER_DECK_LIST = ["Clefairy", "Hitmonchan", "Zapdos"] * 12
+
 
-def setup_logging():
+def setup_logging(level=logging.DEBUG):
     """
     Configures a colored logger for the application.
+
+    `colorlog` is imported here rather than at module load so that importing the engine
+    never pulls in terminal styling. Without it, logging falls back to plain text.
     """
+    try:
+        import colorlog
+    except ImportError:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(levelname)-8s [%(name)s] %(message)s"))
+        logging.getLogger().addHandler(handler)
+        logging.getLogger().setLevel(level)
+        return
+
     handler = colorlog.StreamHandler()
     formatter = colorlog.ColoredFormatter(
         "%(log_color)s%(levelname)-8s %(purple)s[%(name)s]%(reset)s %(blue)s%(message)s",
@@ -32,82 +51,233 @@ def setup_logging():
     handler.setFormatter(formatter)
     root_logger = logging.getLogger()
     root_logger.addHandler(handler)
-    root_logger.setLevel(logging.DEBUG)
+    root_logger.setLevel(level)
 
 
-def generate_deck_from_list(deck_list, player_unit):
+def parse_args(argv=None) -> argparse.Namespace:
     """
-    Populates a player's card field from a list of card data.
-    The list can contain either card data dictionaries or pre-instantiated card objects.
+    Parses the command-line options for the application.
     """
-    card_repo = CardRepository()
-    for card_data in deck_list:
-        title = card_data
-        set_code = "BS"  # Default set_code for test data
-        template = CardFactory.create_card_from_db(card_repo, title, set_code)
-
-        if not template:
-            logger.warning(f"Could not create card for {title} ({set_code})")
-            continue
-
-        if isinstance(template, MonsterTemplate):
-            player_unit.add_to_field(MonsterCard(template))
-        # Add cases for UTILITY and MANA here if needed.
+    parser = argparse.ArgumentParser(description="Blackstar, a monster-battling card game engine.")
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="record per-phase call counts and timings, and print them on exit",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="seed the shuffles and coin flips, so a game (and its card IDs) can be replayed",
+    )
+    parser.add_argument(
+        "--script",
+        metavar="FILE",
+        help="play the commands in FILE ('-' for stdin) without rendering, then print a summary",
+    )
+    parser.add_argument(
+        "--games",
+        type=int,
+        default=None,
+        help="with --script, play the script this many times over (default: 1); "
+        "with --matchups, the games per pair (default: 100)",
+    )
+    parser.add_argument(
+        "--strict",
+        action="store_true",
+        help="with --script, stop a game at its first rejected command or failed checkpoint",
+    )
+    parser.add_argument(
+        "--matchups",
+        metavar="DECK_FILE",
+        nargs="+",
+        help="print the win-rate matrix of these deck lists, replaying only pairs not cached in --results",
+    )
+    parser.add_argument(
+        "--results",
+        metavar="DB",
+        default=None,
+        help="with --matchups, the result store that caches pair results (default: data/results.db)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="with --matchups, the number of worker processes (default: the CPU count)",
+    )
+    parser.add_argument(
+        "--serve",
+        metavar="ADDRESS",
+        help="host games over newline-delimited JSON on HOST:PORT, PORT or unix:PATH",
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=600.0,
+        help="with --serve, evict games idle for this many seconds (default: 600)",
+    )
+    return parser.parse_args(argv)
 
 
-def main() -> None:
+def create_terminal_game(
+    card_repo: CardRepository, seed: int | None = None, template_cache: dict | None = None
+) -> GameState:
     """
-    Main entry point for the application. Sets up the game and starts the engine.
+    Sets up the game the terminal plays: the test deck against a random one.
+
+    Args:
+        card_repo: The repository to load cards from.
+        seed: Optional seed for the global RNG, applied before the opponent's deck is drawn.
+        template_cache: Optional template cache shared across games; see
+            `generate_deck_from_list`.
     """
-    setup_logging()
-    logger.info("starting blackstar! v0.1.0")
+    if seed is not None:
+        random.seed(seed)
     # 1. Create players
     player = PlayerUnit(title="Player")
     opponent = PlayerUnit(title="Opponent")
 
-    # Define a specific deck list for the player for targeted testing.
-    # The `generate_deck_from_list` function will take these titles
-    # and fetch their full data from the database.
-    player_deck_list = [
-        "Clefairy", "Hitmonchan", "Zapdos"
-    ] * 12
-
     # Generate and setup decks.
-    generate_deck_from_list(player_deck_list, player_unit=player)
-    generate_deck_from_list(give_test_card(60), player_unit=opponent) # Opponent can still use a random deck
-
-    player.initialize_deck()
-    player.shuffle_deck()
-    opponent.initialize_deck()
-    opponent.shuffle_deck()
-
-    player.set_prize_cards(6)
-    opponent.set_prize_cards(6)
-
-    player.draw_from_deck(7)
-    opponent.draw_from_deck(7)
-
-    # Handle mulligans if no basic monster is in the opening hand.
-    while not player.has_basic_monster_in_hand():
-        logger.warning(f"{player.title} has no basic monster, redrawing hand.")
-        player.return_hand_to_deck()
-        player.shuffle_deck()
-        player.draw_from_deck(7)
-
-    while not opponent.has_basic_monster_in_hand():
-        logger.warning(f"{opponent.title} has no basic monster, redrawing hand.")
-        opponent.return_hand_to_deck()
-        opponent.shuffle_deck()
-        opponent.draw_from_deck(7)
-
-    # Create and run the game state.
+    generate_deck_from_list(
+        PLAYER_DECK_LIST, player_unit=player, card_repo=card_repo, template_cache=template_cache
+    )
+    generate_deck_from_list(
+        give_test_card(60), player_unit=opponent, card_repo=card_repo, template_cache=template_cache
+    )  # Opponent can still use a random deck
+
+    # Shuffle, set prizes, draw opening hands and handle mulligans.
+    prepare_player(player)
+    prepare_player(opponent)
+
+    # Create the game state.
     game_state = GameState(player, opponent)
     # Manually trigger the start-of-turn logic for the first player.
     game_state._start_new_turn_for_player()
+    return game_state
+
+
+def run_script(args: argparse.Namespace) -> int:
+    """
+    Plays `args.script` headlessly and prints a summary.
+
+    Returns:
+        The process exit code: 0 if every command and checkpoint passed, 1 otherwise.
+    """
+    from controller.script_runner import Script, ScriptError, ScriptRunner
+
+    try:
+        script = Script.from_file(args.script)
+    except (OSError, ScriptError) as e:
+        logger.error(f"Cannot load script '{args.script}': {e}")
+        return 2
+
+    card_repo = CardRepository()
+    template_cache = {}
+    runner = ScriptRunner(
+        lambda seed: create_terminal_game(card_repo, seed, template_cache),
+        seed=args.seed or 0,
+        strict=args.strict,
+    )
+    result = runner.run(script, games=args.games or 1)
+    print(result.format_summary())
+    return 0 if result.ok else 1
+
+
+def run_matchups(args: argparse.Namespace) -> int:
+    """
+    Computes and prints the matchup matrix of the `args.matchups` deck files.
+
+    Returns:
+        The process exit code: 0 on success, 2 if a deck file cannot be read.
+    """
+    from database.connection import DB_PATH
+    from simulation.matchups import DEFAULT_GAMES_PER_PAIR, compute_matrix, deck_name, load_deck
+    from simulation.results import ResultStore
+
+    try:
+        decks = {deck_name(path): load_deck(path) for path in args.matchups}
+    except (OSError, ValueError) as e:
+        logger.error(f"Cannot load deck: {e}")
+        return 2
+    if len(decks) < len(args.matchups):
+        logger.error("Deck files must have distinct names.")
+        return 2
+
+    # The results live next to the card database unless told otherwise.
+    with ResultStore(args.results or os.path.join(os.path.dirname(DB_PATH), "results.db")) as store:
+        matrix = compute_matrix(
+            decks,
+            store,
+            games=args.games or DEFAULT_GAMES_PER_PAIR,
+            seed=args.seed or 0,
+            num_workers=args.workers,
+        )
+    print(matrix.format_table())
+    return 0
+
+
+def run_server(args: argparse.Namespace) -> None:
+    """Hosts games on `args.serve` until interrupted."""
+    import asyncio
+
+    from netio.server import serve
+
+    card_repo = CardRepository()
+    template_cache = {}
+    try:
+        asyncio.run(
+            serve(
+                lambda seed: create_terminal_game(card_repo, seed, template_cache),
+                args.serve,
+                idle_timeout=args.idle_timeout,
+            )
+        )
+    except KeyboardInterrupt:
+        logger.warning("Server stopped.")
+
+
+def main() -> None:
+    """
+    Main entry point for the application. Sets up the game and starts the engine.
+    """
+    args = parse_args()
+    # Scripts, servers and matchup runs play thousands of commands; per-card debug logging would dominate them.
+    setup_logging(logging.WARNING if args.script or args.serve or args.matchups else logging.DEBUG)
+    if args.profile:
+        PROFILER.enable()
+    if args.script:
+        try:
+            sys.exit(run_script(args))
+        finally:
+            if args.profile:
+                print(PROFILER.format_report())
+    if args.matchups:
+        try:
+            sys.exit(run_matchups(args))
+        finally:
+            if args.profile:
+                print(PROFILER.format_report())
+    if args.serve:
+        try:
+            run_server(args)
+        finally:
+            if args.profile:
+                print(PROFILER.format_report())
+        return
+    logger.info("starting blackstar! v0.1.0")
+    game_state = create_terminal_game(CardRepository(), args.seed)
+
+    # The view (and `colorful` with it) is only imported once a terminal game starts.
+    from termio.view import TerminalView
 
     terminal_view = TerminalView()
     game_controller = GameController(game_state, terminal_view)
-    game_controller.run()
+    try:
+        game_controller.run()
+    finally:
+        terminal_view.close()
+        if args.profile:
+            print(PROFILER.format_report())
 
 
 if __name__ == "__main__":
@@ -29,6 +29,16 @@ class CardTemplate:
         # Increment the class-level counter for the next card.
         CardTemplate._next_id += 1
 
+    @classmethod
+    def reset_ids(cls) -> None:
+        """
+        Empties the registry and restarts numbering at 0, so that a game built next gets
+        the same card IDs every time. Cards still in use elsewhere keep their IDs, which
+        new cards will reuse; only reset between games that never meet.
+        """
+        cls._next_id = 0
+        cls._all_cards.clear()
+
     @classmethod
     def get_card_by_id(cls, card_id):
         """
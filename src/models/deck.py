@@ -0,0 +1,198 @@
+import random
+from typing import Callable, Iterator
+
+
+class DeckZone:
+    """
+    An ordered deck of cards, backed by a list of card IDs (bottom to top) and a
+    dictionary of the card objects themselves.
+
+    The top of the deck is the end of the list, so drawing pops in O(1) and shuffling
+    happens in place. A card-ID-to-position index serves positional lookups; it is
+    built lazily on the first lookup and dropped by shuffles, so drawing and shuffling
+    never pay for it.
+
+    `DeckZone` keeps the dictionary interface the deck had as a plain `dict`
+    (`len`, `in`, `deck[card_id]`, `deck[card_id] = card`, `items()`, `values()`,
+    `popitem()`), so iteration runs from the bottom of the deck to the top.
+    """
+
+    __slots__ = ("_order", "_cards", "_index")
+
+    def __init__(self, cards=None) -> None:
+        """
+        Args:
+            cards: Optional iterable of card objects, given from bottom to top.
+        """
+        self._order: list[int] = []
+        self._cards: dict = {}
+        self._index: dict[int, int] | None = None
+        for card in cards or ():
+            self.push(card)
+
+    #! MAPPING INTERFACE
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __bool__(self) -> bool:
+        return bool(self._order)
+
+    def __contains__(self, card_id) -> bool:
+        return card_id in self._cards
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._order)
+
+    def __getitem__(self, card_id):
+        return self._cards[card_id]
+
+    def __setitem__(self, card_id, card) -> None:
+        """Replaces a card already in the deck, or places a new card on top."""
+        if card_id in self._cards:
+            self._cards[card_id] = card
+            return
+        self._cards[card_id] = card
+        if self._index is not None:
+            self._index[card_id] = len(self._order)
+        self._order.append(card_id)
+
+    def __delitem__(self, card_id) -> None:
+        if self.remove(card_id) is None:
+            raise KeyError(card_id)
+
+    def __repr__(self) -> str:
+        return f"DeckZone({len(self._order)} cards)"
+
+    def get(self, card_id, default=None):
+        return self._cards.get(card_id, default)
+
+    def keys(self) -> list[int]:
+        return list(self._order)
+
+    def values(self) -> list:
+        cards = self._cards
+        return [cards[card_id] for card_id in self._order]
+
+    def items(self) -> list[tuple]:
+        cards = self._cards
+        return [(card_id, cards[card_id]) for card_id in self._order]
+
+    def popitem(self) -> tuple:
+        """Removes and returns the top card as `(card_id, card)`, like `dict.popitem()`."""
+        if not self._order:
+            raise KeyError("popitem(): deck is empty")
+        card_id = self._order.pop()
+        if self._index is not None:
+            del self._index[card_id]
+        return card_id, self._cards.pop(card_id)
+
+    def clear(self) -> None:
+        self._order.clear()
+        self._cards.clear()
+        self._index = None
+
+    def copy(self) -> "DeckZone":
+        """Returns a shallow copy that shares the card objects but not the ordering."""
+        duplicate = DeckZone()
+        duplicate._order = self._order.copy()
+        duplicate._cards = self._cards.copy()
+        duplicate._index = None
+        return duplicate
+
+    #! DECK OPERATIONS
+    def push(self, card) -> None:
+        """Places a card on top of the deck."""
+        card_id = card.id
+        if card_id in self._cards:
+            self._cards[card_id] = card
+            return
+        self._cards[card_id] = card
+        if self._index is not None:
+            self._index[card_id] = len(self._order)
+        self._order.append(card_id)
+
+    def pop(self):
+        """Removes and returns the top card, or `None` if the deck is empty."""
+        if not self._order:
+            return None
+        card_id = self._order.pop()
+        if self._index is not None:
+            del self._index[card_id]
+        return self._cards.pop(card_id)
+
+    def extend(self, cards) -> None:
+        """Places several cards on top of the deck, in the order given."""
+        own_cards, order, index = self._cards, self._order, self._index
+        for card in cards:
+            card_id = card.id
+            if card_id not in own_cards:
+                if index is not None:
+                    index[card_id] = len(order)
+                order.append(card_id)
+            own_cards[card_id] = card
+
+    def pop_many(self, qty: int) -> list:
+        """
+        Removes up to `qty` cards from the top of the deck in a single slice.
+
+        Returns:
+            The removed cards, topmost first.
+        """
+        if qty <= 0:
+            return []
+        drawn_ids = self._order[-qty:]
+        del self._order[-qty:]
+        drawn_ids.reverse()
+        if self._index is not None:
+            for card_id in drawn_ids:
+                del self._index[card_id]
+        cards = self._cards
+        return [cards.pop(card_id) for card_id in drawn_ids]
+
+    def remove(self, card_id):
+        """
+        Removes a specific card from anywhere in the deck.
+
+        Returns:
+            The removed card, or `None` if it is not in the deck.
+        """
+        card = self._cards.pop(card_id, None)
+        if card is None:
+            return None
+        index = self._positions()
+        position = index.pop(card_id)
+        del self._order[position]
+        # Only the cards above the removed one change position.
+        for shifted_position in range(position, len(self._order)):
+            index[self._order[shifted_position]] = shifted_position
+        return card
+
+    def position(self, card_id) -> int | None:
+        """Returns a card's 0-based position counted from the top, or `None`."""
+        position = self._positions().get(card_id)
+        if position is None:
+            return None
+        return len(self._order) - 1 - position
+
+    def peek(self, qty: int = 1) -> list:
+        """Returns the top `qty` cards, topmost first, without removing them."""
+        cards = self._cards
+        return [cards[card_id] for card_id in reversed(self._order[-qty:])] if qty > 0 else []
+
+    def search(self, predicate: Callable) -> list:
+        """Returns every card matching `predicate`, topmost first, without reordering."""
+        cards = self._cards
+        return [
+            cards[card_id] for card_id in reversed(self._order) if predicate(cards[card_id])
+        ]
+
+    def shuffle(self, rng: random.Random | None = None) -> None:
+        """Shuffles the deck in place, using the global RNG unless one is given."""
+        (rng or random).shuffle(self._order)
+        self._index = None
+
+    def _positions(self) -> dict[int, int]:
+        """Returns the card-ID-to-position index, rebuilding it after a shuffle."""
+        if self._index is None:
+            self._index = {card_id: i for i, card_id in enumerate(self._order)}
+        return self._index
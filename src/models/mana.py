@@ -11,6 +11,10 @@ class ManaTemplate:
         self.mana_type = kwargs["mana_type"]
         self.mana_val = kwargs["mana_val"]
 
+    def __deepcopy__(self, memo) -> "ManaTemplate":
+        """Templates are immutable, so copies of a game state share them."""
+        return self
+
 
 class ManaCard(CardTemplate):
     def __init__(self, card) -> None:
@@ -18,6 +22,13 @@ class ManaCard(CardTemplate):
         super().__init__()  # self.id
         self.card = card
 
+    def __deepcopy__(self, memo) -> "ManaCard":
+        """A mana card holds no mutable state beyond its ID, so copies share the template."""
+        duplicate = ManaCard.__new__(ManaCard)
+        memo[id(self)] = duplicate
+        duplicate.__dict__.update(self.__dict__)
+        return duplicate
+
     @property
     def title(self):
         """Returns the title from the card template."""
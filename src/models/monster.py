@@ -1,3 +1,4 @@
+import copy
 import logging
 
 from core.combat import Attack
@@ -8,6 +9,9 @@ from .card import CardTemplate
 
 logger = logging.getLogger(__name__)
 
+# Position of each mana type within a mana signature (see `MonsterTemplate.cap_signature`).
+MANA_SLOTS = {mana_type: slot for slot, mana_type in enumerate(ManaType)}
+
 
 class MonsterTemplate:
     """
@@ -63,6 +67,75 @@ class MonsterTemplate:
         self.dex_data = kwargs.get("dex_data", {})  # dict: JSON-esque
         self.print_data = kwargs.get("print_data", {})  # dict: JSON-esque
 
+        # Affordability lookup: capped mana signature -> bitmask (see `get_affordable_mask`).
+        # Any count beyond the largest total cost cannot change the answer, so counts are
+        # capped there to keep the table small.
+        self._mana_cap = max(
+            [sum(attack.cost.values()) for attack in self.attacks] + [self.retreat_val or 0]
+        )
+        self._affordability: dict[tuple, int] = {}
+
+    def __deepcopy__(self, memo) -> "MonsterTemplate":
+        """Templates are immutable, so copies of a game state share them."""
+        return self
+
+    @property
+    def retreat_bit(self) -> int:
+        """The bit of an affordability mask that is set when the retreat cost is payable."""
+        return 1 << len(self.attacks)
+
+    def cap_signature(self, counts: list) -> tuple:
+        """
+        Turns per-type mana counts, indexed by `MANA_SLOTS`, into a capped signature.
+
+        Args:
+            counts (list): The amount of each mana type, in enum order.
+        """
+        cap = self._mana_cap
+        if max(counts) > cap:
+            counts = [min(count, cap) for count in counts]
+        return tuple(counts)
+
+    def get_affordable_mask(self, signature: tuple) -> int:
+        """
+        Returns which costs a mana signature can pay, as a bitmask: bit `i` is set when
+        attack `i` is affordable, and `retreat_bit` when the retreat cost is.
+        Masks are computed once per signature and memoized on the template.
+
+        Args:
+            signature (tuple): A key produced by `cap_signature()`.
+        """
+        mask = self._affordability.get(signature)
+        if mask is None:
+            pool = dict(zip(ManaType, signature))
+            mask = 0
+            for i, attack in enumerate(self.attacks):
+                if can_pay(pool, attack.cost):
+                    mask |= 1 << i
+            if can_pay(pool, {ManaType.COLORLESS: self.retreat_val or 0}):
+                mask |= self.retreat_bit
+            self._affordability[signature] = mask
+        return mask
+
+
+def can_pay(pool: dict, cost: dict) -> bool:
+    """
+    Checks whether a mana pool covers a cost. Specific mana types are paid first;
+    COLORLESS costs are then paid from whatever remains.
+
+    Args:
+        pool (dict): Available mana, expressed as `{ManaType: amount}`.
+        cost (dict): The cost, expressed as `{ManaType: amount}`.
+    """
+    remaining = sum(pool.values())
+    for mana_type, amount in cost.items():
+        if mana_type == ManaType.COLORLESS:
+            continue
+        if pool.get(mana_type, 0) < amount:
+            return False
+        remaining -= amount
+    return remaining >= cost.get(ManaType.COLORLESS, 0)
+
 
 class MonsterCard(CardTemplate):
     """
@@ -110,6 +183,22 @@ class MonsterCard(CardTemplate):
         self.has_evolved = False
         self.is_immune = False
 
+    def __deepcopy__(self, memo) -> "MonsterCard":
+        """
+        Copies only the per-card state that play mutates. The template and the ability
+        effects (configured once from template data) are shared with the original.
+        """
+        duplicate = MonsterCard.__new__(MonsterCard)
+        memo[id(self)] = duplicate
+        duplicate.__dict__.update(self.__dict__)
+        duplicate.mana_pool = self.mana_pool.copy()
+        # Evolving hands the base card's `attached_mana` to the evolution, so go through
+        # the memo to keep that dictionary shared in the copy too.
+        duplicate.attached_mana = copy.deepcopy(self.attached_mana, memo)
+        duplicate.special_conditions = self.special_conditions.copy()
+        duplicate.prior_evos = copy.deepcopy(self.prior_evos, memo)
+        return duplicate
+
     @property
     def title(self):
         """Returns the title from the card template."""
@@ -209,25 +298,29 @@ class MonsterCard(CardTemplate):
 
         :param cost: is the attack's cost—usually a dict like `{ManaType.FIRE: 2, ...}`
         """
+        return can_pay(self.total_mana, cost)
 
-        # Make a copy to not mutate original: what remains will be
-        remaining_pool = self.total_mana.copy()
-
-        # First, pay specific mana costs. Colorless costs are handled later
-        for mana_type, amount in cost.items():
-            if mana_type == ManaType.COLORLESS:
-                continue
-            if remaining_pool.get(mana_type, 0) < amount:
-                return False
-            remaining_pool[mana_type] -= amount
-
-        # Handle colorless costs
-        if ManaType.COLORLESS in cost:
-            total_remaining = sum(remaining_pool.values())
-            if total_remaining < cost[ManaType.COLORLESS]:
-                return False
-
-        return True
+    def get_affordable_mask(self) -> int:
+        """
+        Returns the template's affordability bitmask for the mana currently available:
+        bit `i` is set when attack `i` is payable, `card.retreat_bit` when retreat is.
+        """
+        # Count attached mana straight into signature slots; `total_mana` would build a dict.
+        counts = [0] * len(MANA_SLOTS)
+        for mana_card in self.attached_mana.values():
+            counts[MANA_SLOTS[mana_card.card.mana_type]] += 1
+        if any(self.mana_pool.values()):
+            for mana_type, amount in self.mana_pool.items():
+                counts[MANA_SLOTS[mana_type]] += amount
+        return self.card.get_affordable_mask(self.card.cap_signature(counts))
+
+    def can_afford_attack(self, attack_index: int) -> bool:
+        """Checks whether the mana currently available pays for the given attack."""
+        return bool(self.get_affordable_mask() >> attack_index & 1)
+
+    def can_afford_retreat(self) -> bool:
+        """Checks whether the mana currently available pays the retreat cost."""
+        return bool(self.get_affordable_mask() & self.card.retreat_bit)
 
     def spend_mana(self, cost):
         """
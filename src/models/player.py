@@ -1,8 +1,9 @@
 import logging
-import random
 from typing import TYPE_CHECKING
 
 from core.enums import CardType, ManaType, StageType
+from core.profiling import PROFILER
+from models.deck import DeckZone
 from models.monster import MonsterCard
 
 
@@ -24,7 +25,7 @@ class PlayerUnit:
         title (str): The name of the player (e.g., "Player" or "Opponent").
         field (dict): A dictionary of all cards belonging to the player before
             being assigned to a specific zone.
-        deck (dict): Cards currently in the player's deck.
+        deck (DeckZone): Cards currently in the player's deck, in draw order.
         hand (dict): Cards currently in the player's hand.
         discard (dict): Cards in the player's discard pile.
         bench (dict): Monster cards on the player's bench.
@@ -45,7 +46,7 @@ class PlayerUnit:
         """
         self.title: str = title
         self.field: dict = {}
-        self.deck: dict = {}
+        self.deck: DeckZone = DeckZone()
         self.hand: dict = {}
         self.discard: dict = {}
         self.bench: dict = {}
@@ -83,23 +84,18 @@ class PlayerUnit:
             if len(self.deck) >= self.CONST_MAX_CARDS:
                 break
             logger.debug(f"{card} added to deck for player {self.title}")
-            self.deck[card_id] = card
+            self.deck.push(card)
 
     def shuffle_deck(self):
         """
-        Performs a shuffle of the deck using `random.shuffle()`.
+        Performs an in-place shuffle of the deck using `random.shuffle()`.
         """
         # Perform a check for an initialized deck.
         if not self.deck:
             logger.warning("Deck is not initialized.")
             return
 
-        # Convert the dictionary's items to a list for shuffling.
-        deck_items = list(self.deck.items())
-        random.shuffle(deck_items)
-
-        # Recreate the deck as a new dictionary with the shuffled order.
-        self.deck = dict(deck_items)
+        self.deck.shuffle()
         logger.info(f"Deck for {self.title} is shuffled.")
 
     def remove_from_deck(self, qty):
@@ -119,15 +115,34 @@ class PlayerUnit:
             print("Deck is not initialized.")
             return
 
-        # Pop cards into a dict which we return.
-        popped_cards = {}
-        for i in range(qty):
-            if not self.deck:
-                print("Deck is empty.")
-                break
-            card_id, card = self.deck.popitem()
-            popped_cards[card_id] = card
-        return popped_cards
+        # Pop cards from the top of the deck into a dict which we return.
+        if qty > len(self.deck):
+            print("Deck is empty.")
+        return {card.id: card for card in self.deck.pop_many(qty)}
+
+    def peek_deck(self, qty: int = 1) -> list:
+        """
+        Returns the top cards of the deck without drawing them.
+
+        Args:
+            qty (int): The number of cards to look at.
+
+        Returns:
+            list: Up to `qty` card objects, topmost first.
+        """
+        return self.deck.peek(qty)
+
+    def search_deck(self, predicate) -> list:
+        """
+        Finds cards in the deck without changing its order.
+
+        Args:
+            predicate (callable): Receives a card object and returns `True` for a match.
+
+        Returns:
+            list: The matching card objects, topmost first.
+        """
+        return self.deck.search(predicate)
 
     #! HAND METHODS
     def add_to_hand(self, card):
@@ -160,8 +175,7 @@ class PlayerUnit:
         """
         Returns all cards from the hand back to the deck.
         """
-        for card_id, card in self.hand.items():
-            self.deck[card_id] = card
+        self.deck.extend(self.hand.values())
         self.hand.clear()
         logger.info(f"Returned hand to deck for player {self.title}.")
 
@@ -303,6 +317,20 @@ class PlayerUnit:
         """
         return self.bench.pop(card_id, None)
 
+    def get_field_monsters_by_title(self) -> dict[str, list["MonsterCard"]]:
+        """
+        Indexes the monsters in play (active first, then the bench) by title.
+
+        Returns:
+            dict: Monster title -> list of `MonsterCard`s with that title, in field order.
+        """
+        by_title = {}
+        if self.active_monster:
+            by_title[self.active_monster.title] = [self.active_monster]
+        for monster in self.bench.values():
+            by_title.setdefault(monster.title, []).append(monster)
+        return by_title
+
     #! ACTIVE MONSTER METHODS
     def set_active_monster(self, card_id):
         """
@@ -360,8 +388,7 @@ class PlayerUnit:
 
         # Check if the monster has enough mana to pay the retreat cost.
         retreat_cost = self.active_monster.card.retreat_val
-        cost_dict = {ManaType.COLORLESS: retreat_cost}
-        if not self.active_monster.has_mana(cost_dict):
+        if not self.active_monster.can_afford_retreat():
             logger.warning(
                 f"Retreat for {self.active_monster} unavailable due to insufficient mana."
             )
@@ -462,9 +489,20 @@ class PlayerUnit:
 
         effects_to_execute = self._get_card_effects(utility_card)
 
-        for effect in effects_to_execute:
-            # Pass the necessary context to the effect
-            effect.execute(game_state, self, None, controller=controller)
+        # Effects take their context as keywords, as attack effects do in `Attack.execute`;
+        # a utility card acts on the side of the player who plays it.
+        context = {
+            "game_state": game_state,
+            "source_player": self,
+            "target_player": self,
+            "controller": controller,
+        }
+        if PROFILER.enabled:
+            for effect in effects_to_execute:
+                PROFILER.call(f"effect.{effect.effect_name}", effect.execute, **context)
+        else:
+            for effect in effects_to_execute:
+                effect.execute(**context)
 
         self.remove_from_hand(card_id)
         self.add_to_discard(utility_card)
@@ -533,7 +571,7 @@ class PlayerUnit:
         """
         logger.info(f"Resetting state for player: {self.title}")
         self.field = {}
-        self.deck = {}
+        self.deck = DeckZone()
         self.hand = {}
         self.discard = {}
         self.bench = {}
@@ -25,6 +25,10 @@ class UtilityTemplate:
         self.descrpition = kwargs["description"]
         self.effects = kwargs.get("effects", [])  # list: Effect
 
+    def __deepcopy__(self, memo) -> "UtilityTemplate":
+        """Templates are immutable, so copies of a game state share them."""
+        return self
+
 
 class UtilityCard(CardTemplate):
     """
@@ -54,6 +58,14 @@ class UtilityCard(CardTemplate):
         ]
         logger.debug(f"Initiate {self.card.type} card ({self.id} {self.card.title})")
 
+    def __deepcopy__(self, memo) -> "UtilityCard":
+        """Utility cards are not mutated in play, so copies share the template and effects."""
+        duplicate = UtilityCard.__new__(UtilityCard)
+        memo[id(self)] = duplicate
+        duplicate.__dict__.update(self.__dict__)
+        duplicate.effects = list(self.effects)
+        return duplicate
+
     @property
     def title(self):
         """Returns the title from the card template."""
@@ -0,0 +1,463 @@
+import asyncio
+import itertools
+import json
+import logging
+import os
+import random
+from typing import Callable
+
+from controller.command_parser import CommandParser
+from controller.commands.inspect_command import InspectCommand
+from controller.commands.mana_command import ManaCommand
+from controller.game_controller import GameController
+from core.deltas import DeltaTracker
+from core.game import GameState
+from core.rules import RulesEngine
+from models.card import CardTemplate
+from models.player import PlayerUnit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IDLE_TIMEOUT = 600.0
+DEFAULT_MAX_SESSIONS = 10_000
+# The longest request line accepted; a longer one closes the connection.
+MAX_LINE_BYTES = 64 * 1024
+# Responses queued beyond this many bytes pause the connection until the client reads.
+WRITE_HIGH_WATER = 64 * 1024
+
+
+class SessionController(GameController):
+    """
+    A `GameController` without a view, for network sessions. Effects that prompt the
+    player for an attack get a choice from the session's RNG.
+    """
+
+    def __init__(self, game_state: GameState, rng: random.Random) -> None:
+        super().__init__(game_state, view=None)
+        self.rng = rng
+
+    def get_attack_choice(self, attacks: list) -> int:
+        return self.rng.randrange(len(attacks))
+
+
+class GameSession:
+    """
+    One hosted game: its state, the controller that plays commands on it, and when it
+    was last used. A session outlives the connection that created it until it is
+    closed or has been idle for longer than its timeout, so a client can reconnect
+    and `attach` to it again.
+
+    Attributes:
+        session_id (str): The identifier clients use to attach to the session.
+        controller (SessionController): Drives the session's game.
+        timeout (float): Seconds without a request after which the session is evicted.
+        last_active (float): The event-loop time of the last request.
+        writer (asyncio.StreamWriter): The connection attached to the session, if any.
+        tracker (DeltaTracker): For sessions that asked for deltas, tracks what was sent.
+        next_card_id (int): The ID the session's next new card (an evolution) gets.
+    """
+
+    __slots__ = ("session_id", "controller", "timeout", "last_active", "writer", "tracker", "next_card_id")
+
+    def __init__(
+        self, session_id: str, game_state: GameState, seed, timeout: float, now: float, deltas: bool = False
+    ) -> None:
+        self.session_id = session_id
+        self.controller = SessionController(game_state, random.Random(seed))
+        self.timeout = timeout
+        self.last_active = now
+        self.writer: asyncio.StreamWriter | None = None
+        self.tracker = DeltaTracker(game_state) if deltas else None
+        self.next_card_id = CardTemplate._next_id
+
+    @property
+    def game_state(self) -> GameState:
+        return self.controller.game_state
+
+    def play(self, command_string: str, command) -> dict:
+        """
+        Plays one parsed command, with the same legality check, end of turn and knockout
+        check as `GameController.run`.
+
+        Returns:
+            The result for this command: `{"ok": True}` or `{"ok": False, "error": ...}`.
+        """
+        game_state = self.game_state
+        if game_state.winner:
+            return {"ok": False, "error": "the game is over"}
+        if command is None:
+            return {"ok": False, "error": f"cannot parse '{command_string}'"}
+        # Debug commands print to the server's console or hand out mana; not over the wire.
+        if isinstance(command, (InspectCommand, ManaCommand)):
+            return {"ok": False, "error": f"'{command_string}' is not available over the server"}
+
+        controller = self.controller
+        game_state.legal_actions = game_state.get_legal_actions(game_state.current_player)
+        if not controller._is_command_legal(command):
+            return {"ok": False, "error": RulesEngine.get_illegality_reason(game_state, command)}
+        turn_ended, _ = controller.execute_command(command)
+        if turn_ended:
+            controller.end_turn()
+        game_state.check_knockouts()
+        return {"ok": True}
+
+    def state(self, full: bool = False) -> dict:
+        """
+        Returns the state part of a response: `{"state": ...}` with the whole summary, or
+        for a session that asked for deltas, `{"delta": ...}` with the changes since the
+        last response (a keyframe if `full`), or nothing if nothing changed.
+        """
+        if self.tracker is None:
+            return {"state": self.describe()}
+        delta = self.tracker.keyframe() if full else self.tracker.update()
+        return {"delta": delta.to_dict()} if delta else {}
+
+    def describe(self) -> dict:
+        """Returns the public summary of the game sent to clients."""
+        game_state = self.game_state
+        return {
+            "turn": game_state.turn_count,
+            "current": game_state.current_player.title,
+            "winner": game_state.winner.title if game_state.winner else None,
+            "players": [
+                _describe_player(player, show_hand=player is game_state.current_player)
+                for player in (game_state.player1, game_state.player2)
+            ],
+        }
+
+    def legal_actions(self) -> list:
+        """Returns the current player's legal actions, as `[type, *args]` lists."""
+        game_state = self.game_state
+        game_state.legal_actions = game_state.get_legal_actions(game_state.current_player)
+        return [[action.type.name.lower(), *action.args] for action in game_state.legal_actions]
+
+
+def _describe_player(player: PlayerUnit, show_hand: bool) -> dict:
+    """As the terminal does, only the current player's hand is listed; the other is a count."""
+    active = player.active_monster
+    return {
+        "title": player.title,
+        "deck": len(player.deck),
+        "hand": (
+            [[card_id, card.card.title] for card_id, card in player.hand.items()]
+            if show_hand
+            else len(player.hand)
+        ),
+        "discard": len(player.discard),
+        "prize": len(player.prize),
+        "active": _describe_monster(active) if active else None,
+        "bench": [_describe_monster(monster) for monster in player.bench.values()],
+    }
+
+
+def _describe_monster(monster) -> dict:
+    return {
+        "id": monster.id,
+        "title": monster.title,
+        "health": monster.health,
+        "conditions": list(monster.special_conditions),
+        "mana": {mana_type.name.lower(): count for mana_type, count in monster.total_mana.items() if count},
+    }
+
+
+class GameServer:
+    """
+    Hosts many games in one asyncio event loop, played over newline-delimited JSON.
+
+    Every request is one JSON object on one line, and gets one JSON object on one line
+    back, in order. A request's `"id"`, if any, is echoed in its response. Operations:
+
+    * `{"op": "new", "seed": 7, "timeout": 60, "deltas": true}` starts a game (all
+      fields optional) and attaches the connection to it. The response holds the
+      `session` ID and the `state`.
+    * `{"op": "attach", "session": "..."}` attaches the connection to an existing game,
+      e.g. after a reconnect.
+    * `{"op": "command", "text": "attach 3 4"}` plays one command, written as in the
+      terminal. `"text"` may also be a list of commands, which are parsed as a batch
+      and played in order, each with its own result in `results`. The response holds the
+      new `state`.
+    * `{"op": "state"}`, `{"op": "legal"}` and `{"op": "undo"}` return the state, list
+      the legal actions and revert the last command of the turn.
+    * `{"op": "close"}` ends the game.
+
+    Failures come back as `{"ok": false, "error": "..."}`.
+
+    A session started with `"deltas": true` gets a versioned `delta` (see
+    `core.deltas.StateDelta`) in place of each `state`: a keyframe for `new`, `attach`
+    and `state`, and only what changed after `command` and `undo`. Deltas list both
+    players' hands, as the one connection plays both seats.
+
+    A session is evicted once it has gone without a request for its timeout, whether or
+    not a client is still connected; its connection is then closed. Each connection
+    handles one request at a time and waits for the client to read its responses before
+    reading more, so a slow client cannot make the server buffer without bound. Idle
+    sessions cost only their game state: there is no task or thread per session.
+    """
+
+    def __init__(
+        self,
+        game_factory: Callable[[int | None], GameState],
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+    ) -> None:
+        """
+        Args:
+            game_factory: Builds a ready-to-play game from a seed (or `None`).
+            idle_timeout: The default, and the longest allowed, session timeout in seconds.
+            max_sessions: How many games may be hosted at once.
+        """
+        self.game_factory = game_factory
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        self.command_parser = CommandParser()
+        self.sessions: dict[str, GameSession] = {}
+        self._session_ids = itertools.count(1)
+        self._servers: list[asyncio.Server] = []
+        self._sweeper: asyncio.Task | None = None
+        self._shortest_timeout = idle_timeout
+
+    #! LIFECYCLE
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 0) -> tuple:
+        """Starts listening on a TCP address. Returns the bound `(host, port)`."""
+        server = await asyncio.start_server(self._serve_connection, host, port, limit=MAX_LINE_BYTES)
+        self._started(server)
+        return server.sockets[0].getsockname()[:2]
+
+    async def start_unix(self, path: str) -> str:
+        """Starts listening on a Unix socket at `path`, replacing a stale socket file."""
+        if os.path.exists(path):
+            os.unlink(path)
+        server = await asyncio.start_unix_server(self._serve_connection, path, limit=MAX_LINE_BYTES)
+        self._started(server)
+        return path
+
+    def _started(self, server) -> None:
+        self._servers.append(server)
+        if self._sweeper is None:
+            self._restart_sweeper()
+
+    def _restart_sweeper(self) -> None:
+        """(Re)starts the eviction sweep, e.g. so a shorter timeout takes effect at once."""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+        self._sweeper = asyncio.get_running_loop().create_task(self._sweep())
+
+    async def serve_forever(self) -> None:
+        """Serves until cancelled."""
+        await asyncio.gather(*(server.serve_forever() for server in self._servers))
+
+    async def close(self) -> None:
+        """Stops listening, drops every session and closes their connections."""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            self._sweeper = None
+        for server in self._servers:
+            server.close()
+        for session_id in list(self.sessions):
+            self._evict(session_id)
+        for server in self._servers:
+            await server.wait_closed()
+        self._servers.clear()
+
+    #! SESSIONS
+    def _sweep_interval(self) -> float:
+        # Check a few times per shortest timeout, but at least once a second.
+        return min(max(self._shortest_timeout / 4, 0.05), 1.0)
+
+    async def _sweep(self) -> None:
+        """Periodically evicts sessions that have been idle for longer than their timeout."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self._sweep_interval())
+            now = loop.time()
+            expired = [
+                session_id
+                for session_id, session in self.sessions.items()
+                if now - session.last_active > session.timeout
+            ]
+            for session_id in expired:
+                logger.info(f"Evicting idle session {session_id}.")
+                self._evict(session_id)
+
+    def _evict(self, session_id: str) -> None:
+        session = self.sessions.pop(session_id, None)
+        if session is not None and session.writer is not None:
+            session.writer.close()
+            session.writer = None
+
+    def _new_session(self, request: dict) -> GameSession:
+        if len(self.sessions) >= self.max_sessions:
+            raise ValueError("the server is full")
+        seed = request.get("seed")
+        if seed is not None and not isinstance(seed, int):
+            raise ValueError("'seed' must be an integer")
+        timeout = request.get("timeout", self.idle_timeout)
+        if not isinstance(timeout, (int, float)) or timeout <= 0:
+            raise ValueError("'timeout' must be a positive number of seconds")
+
+        # Each session numbers its cards from 0, as a terminal game started with the same
+        # seed would, and keeps its own counter for the cards it creates in play (see
+        # `_handle_session_op`), so sessions never hand out each other's IDs.
+        CardTemplate.reset_ids()
+        game_state = self.game_factory(seed)
+        session_id = f"{next(self._session_ids):x}"
+        timeout = min(float(timeout), self.idle_timeout)
+        if timeout < self._shortest_timeout:
+            self._shortest_timeout = timeout
+            self._restart_sweeper()
+        session = GameSession(
+            session_id,
+            game_state,
+            seed,
+            timeout,
+            asyncio.get_running_loop().time(),
+            deltas=bool(request.get("deltas")),
+        )
+        self.sessions[session_id] = session
+        return session
+
+    #! CONNECTIONS
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        writer.transport.set_write_buffer_limits(high=WRITE_HIGH_WATER)
+        session: GameSession | None = None
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # The line overran the reader's limit; the stream cannot be resynchronized.
+                    writer.write(_encode({"ok": False, "error": "request too long"}))
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                session, response = self._handle(line, session, writer)
+                writer.write(_encode(response))
+                # Backpressure: stop reading requests until the client takes the responses.
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            if session is not None and session.writer is writer:
+                session.writer = None
+            writer.close()
+
+    def _handle(self, line: bytes, session: GameSession | None, writer) -> tuple:
+        """Handles one request line. Returns the connection's session and the response."""
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("a request must be a JSON object")
+        except ValueError as e:
+            return session, {"ok": False, "error": f"bad request: {e}"}
+
+        op = request.get("op")
+        try:
+            if op == "new":
+                session = self._attach(session, self._new_session(request), writer)
+                response = {"ok": True, "session": session.session_id, **session.state(full=True)}
+            elif op == "attach":
+                found = self.sessions.get(request.get("session"))
+                if found is None:
+                    raise ValueError("no such session")
+                session = self._attach(session, found, writer)
+                response = {"ok": True, "session": session.session_id, **session.state(full=True)}
+            elif session is None or session.session_id not in self.sessions:
+                session = None
+                raise ValueError("no session; send 'new' or 'attach' first")
+            else:
+                response = self._handle_session_op(op, request, session)
+        except ValueError as e:
+            response = {"ok": False, "error": str(e)}
+        except Exception:
+            # A failure in the engine must not take the other games down with it.
+            logger.exception(f"Request {request!r} failed.")
+            response = {"ok": False, "error": "internal error"}
+
+        if session is not None:
+            session.last_active = asyncio.get_running_loop().time()
+        if "id" in request:
+            response["id"] = request["id"]
+        return session, response
+
+    def _attach(self, previous: GameSession | None, session: GameSession, writer) -> GameSession:
+        """Attaches `writer`'s connection to `session`, detaching it from `previous`."""
+        if previous is not None and previous is not session and previous.writer is writer:
+            previous.writer = None
+        if session.writer is not None and session.writer is not writer:
+            # A session is played from one connection at a time; the newest one wins.
+            session.writer.close()
+        session.writer = writer
+        return session
+
+    def _handle_session_op(self, op, request: dict, session: GameSession) -> dict:
+        # Cards are numbered by one global counter; point it at this session's own.
+        CardTemplate._next_id = session.next_card_id
+        try:
+            return self._play_session_op(op, request, session)
+        finally:
+            session.next_card_id = CardTemplate._next_id
+
+    def _play_session_op(self, op, request: dict, session: GameSession) -> dict:
+        if op == "command":
+            text = request.get("text")
+            if isinstance(text, str):
+                result = session.play(text, self.command_parser.parse(text))
+                result.update(session.state())
+                return result
+            if isinstance(text, list) and all(isinstance(item, str) for item in text):
+                results = [
+                    session.play(item, command)
+                    for item, command in zip(text, self.command_parser.parse_many(text))
+                ]
+                return {
+                    "ok": all(result["ok"] for result in results),
+                    "results": results,
+                    **session.state(),
+                }
+            raise ValueError("'text' must be a command string or a list of them")
+        if op == "state":
+            return {"ok": True, **session.state(full=True)}
+        if op == "legal":
+            return {"ok": True, "actions": session.legal_actions()}
+        if op == "undo":
+            if not session.controller.undo():
+                raise ValueError("nothing to undo this turn")
+            return {"ok": True, **session.state()}
+        if op == "close":
+            self.sessions.pop(session.session_id, None)
+            return {"ok": True}
+        raise ValueError(f"unknown op '{op}'")
+
+
+def _encode(response: dict) -> bytes:
+    return json.dumps(response, separators=(",", ":")).encode() + b"\n"
+
+
+def parse_address(address: str) -> tuple[str, object]:
+    """
+    Parses a `--serve` address: `unix:PATH`, `HOST:PORT` or a bare `PORT`.
+
+    Returns:
+        `("unix", path)` or `("tcp", (host, port))`.
+    """
+    if address.startswith("unix:"):
+        return "unix", address[len("unix:"):]
+    host, _, port = address.rpartition(":")
+    return "tcp", (host or "127.0.0.1", int(port))
+
+
+async def serve(game_factory, address: str, idle_timeout: float = DEFAULT_IDLE_TIMEOUT) -> None:
+    """Runs a `GameServer` on `address` (see `parse_address`) until cancelled."""
+    server = GameServer(game_factory, idle_timeout=idle_timeout)
+    kind, where = parse_address(address)
+    if kind == "unix":
+        bound = await server.start_unix(where)
+    else:
+        bound = await server.start_tcp(*where)
+    logger.warning(f"Serving games on {bound}.")
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
@@ -0,0 +1,246 @@
+from typing import Callable
+
+from core.coins import CoinScriptExhausted, ScriptedCoins, coin_source
+from core.game import GameState
+from core.serialization import encode_game
+from models.player import PlayerUnit
+
+# A line of play that needs more flips than this is rejected rather than enumerated.
+DEFAULT_MAX_FLIPS = 16
+
+
+class ChanceOutcome:
+    """
+    One distinct result of a chance event.
+
+    Attributes:
+        probability (float): The exact probability of reaching `state`.
+        flips (tuple): One coin-flip sequence (`True` for heads) that leads to `state`.
+        state (GameState): The resulting position. Shared with the evaluator's cache, so
+            treat it as read-only (clone it before playing on).
+    """
+
+    __slots__ = ("probability", "flips", "state")
+
+    def __init__(self, probability: float, flips: tuple, state: GameState) -> None:
+        self.probability = probability
+        self.flips = flips
+        self.state = state
+
+    def __repr__(self) -> str:
+        return f"ChanceOutcome(probability={self.probability}, flips={self.flips})"
+
+
+class ChanceAnalysis:
+    """
+    Exact expectations for one monster over a set of chance outcomes.
+
+    Attributes:
+        expected_damage (float): The expected damage taken by the monster.
+        knockout_probability (float): The probability that the monster is knocked out.
+        outcomes (list): The `ChanceOutcome`s the figures were computed from.
+    """
+
+    def __init__(self, expected_damage: float, knockout_probability: float, outcomes: list) -> None:
+        self.expected_damage = expected_damage
+        self.knockout_probability = knockout_probability
+        self.outcomes = outcomes
+
+    def __repr__(self) -> str:
+        return (
+            f"ChanceAnalysis(expected_damage={self.expected_damage}, "
+            f"knockout_probability={self.knockout_probability}, outcomes={len(self.outcomes)})"
+        )
+
+
+def position_key(game_state: GameState) -> bytes:
+    """
+    Returns a hashable key that identifies a position: its binary encoding (see
+    `core.serialization.encode_game`). It covers every card ID in every zone and in
+    order (deck order included), attached mana, pooled mana, conditions, all monster
+    flags, prizes, the turn and the winner. Positions with equal keys play identically,
+    so outcomes may be merged and cached states handed out under them.
+    """
+    return encode_game(game_state)
+
+
+class ChanceEvaluator:
+    """
+    Resolves coin flips exactly by treating each one as an explicit chance node.
+
+    A line of play is run on clones of the game under a `ScriptedCoins` source. Whenever
+    the line asks for a flip the script does not hold yet, both results are explored,
+    so every reachable flip sequence is enumerated once, each with probability
+    `0.5 ** len(flips)`. Sequences that end in the same position (see `position_key`)
+    are merged, and the expansion of each (position, step) pair is memoized, so
+    positions reached along several lines are expanded only once.
+
+    The original game state is never modified.
+    """
+
+    def __init__(self, controller=None, max_flips: int = DEFAULT_MAX_FLIPS) -> None:
+        """
+        Args:
+            controller: Passed to attacks for effects that prompt the player (e.g.
+                COPY_ATTACK). Choices are decisions, not chance, and are not enumerated.
+            max_flips: The longest flip sequence a single step may consume.
+        """
+        self.controller = controller
+        self.max_flips = max_flips
+        self._cache: dict[tuple, list[ChanceOutcome]] = {}
+
+    def clear(self) -> None:
+        """Forgets all memoized expansions."""
+        self._cache.clear()
+
+    def expand(
+        self, game_state: GameState, step: Callable[[GameState], None], step_key=None
+    ) -> list[ChanceOutcome]:
+        """
+        Enumerates every outcome of applying `step` to `game_state`.
+
+        Args:
+            game_state: The position to start from; it is not modified.
+            step: A callable that plays one step on the (cloned) state it receives.
+            step_key: A hashable name for `step`. When given, the result is memoized
+                under the position and this key.
+
+        Returns:
+            The distinct outcomes, whose probabilities sum to 1.
+        """
+        cache_key = None
+        if step_key is not None:
+            cache_key = (position_key(game_state), step_key)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        merged: dict[tuple, ChanceOutcome] = {}
+        pending = [()]
+        while pending:
+            flips = pending.pop()
+            state = game_state.clone()
+            try:
+                with coin_source(ScriptedCoins(flips)):
+                    step(state)
+            except CoinScriptExhausted:
+                # The line needs another flip: branch on both results.
+                if len(flips) >= self.max_flips:
+                    raise ValueError(
+                        f"Chance step needs more than {self.max_flips} coin flips."
+                    )
+                pending.append(flips + (False,))
+                pending.append(flips + (True,))
+                continue
+
+            probability = 0.5 ** len(flips)
+            key = position_key(state)
+            outcome = merged.get(key)
+            if outcome is None:
+                merged[key] = ChanceOutcome(probability, flips, state)
+            else:
+                outcome.probability += probability
+
+        outcomes = list(merged.values())
+        if cache_key is not None:
+            self._cache[cache_key] = outcomes
+        return outcomes
+
+    def expand_all(
+        self, outcomes: list[ChanceOutcome], step: Callable[[GameState], None], step_key=None
+    ) -> list[ChanceOutcome]:
+        """
+        Applies `step` to every outcome of an earlier expansion and merges the results,
+        weighting each by the probability of the outcome it started from.
+        """
+        merged: dict[tuple, ChanceOutcome] = {}
+        for outcome in outcomes:
+            for child in self.expand(outcome.state, step, step_key):
+                probability = outcome.probability * child.probability
+                key = position_key(child.state)
+                existing = merged.get(key)
+                if existing is None:
+                    merged[key] = ChanceOutcome(
+                        probability, outcome.flips + child.flips, child.state
+                    )
+                else:
+                    existing.probability += probability
+        return list(merged.values())
+
+    #! ANALYSES
+    def attack_outcomes(self, game_state: GameState, attack_index: int) -> list[ChanceOutcome]:
+        """
+        Enumerates the outcomes of the current player's active monster using an attack,
+        including the knockout check that follows it.
+        """
+
+        def attack(state: GameState) -> None:
+            state.current_player.active_monster.use_attack(
+                attack_index, state, state.current_player, state.waiting_player, self.controller
+            )
+            state.check_knockouts()
+
+        return self.expand(game_state, attack, ("ATTACK", attack_index))
+
+    def turn_start_outcomes(self, game_state: GameState) -> list[ChanceOutcome]:
+        """
+        Enumerates the outcomes of ending the turn: the next player's start-of-turn
+        status ticks (POISONED, BURNED, ASLEEP, PARALYZED) and the knockout check after them.
+        """
+
+        return self.expand(game_state, self._end_turn, "END_TURN")
+
+    def analyze_attack(self, game_state: GameState, attack_index: int) -> ChanceAnalysis:
+        """
+        Returns the exact expected damage to, and knockout probability of, the defending
+        monster when the current player uses an attack.
+        """
+        defender = game_state.waiting_player
+        outcomes = self.attack_outcomes(game_state, attack_index)
+        return self._analyze(game_state, defender, defender.active_monster, outcomes)
+
+    def analyze_turn(self, game_state: GameState, attack_index: int | None = None) -> ChanceAnalysis:
+        """
+        Returns the exact expected damage to, and knockout probability of, the opponent's
+        active monster over the rest of the turn: an optional attack, then the
+        start-of-turn status ticks it suffers once the turn passes (e.g. the poison an
+        attack just applied).
+        """
+        defender = game_state.waiting_player
+        if attack_index is None:
+            outcomes = [ChanceOutcome(1.0, (), game_state)]
+        else:
+            outcomes = self.attack_outcomes(game_state, attack_index)
+        outcomes = self.expand_all(outcomes, self._end_turn, "END_TURN")
+        return self._analyze(game_state, defender, defender.active_monster, outcomes)
+
+    @staticmethod
+    def _end_turn(state: GameState) -> None:
+        """Passes the turn and resolves any knockout from the status ticks."""
+        state.next_turn()
+        state.check_knockouts()
+
+    @staticmethod
+    def _analyze(game_state: GameState, owner: PlayerUnit, monster, outcomes: list) -> ChanceAnalysis:
+        """Folds the outcomes into the expectations for one monster of the original game."""
+        if monster is None:
+            return ChanceAnalysis(0.0, 0.0, outcomes)
+        owner_is_player1 = owner is game_state.player1
+        expected_damage = 0.0
+        knockout_probability = 0.0
+        for outcome in outcomes:
+            state = outcome.state
+            state_owner = state.player1 if owner_is_player1 else state.player2
+            counterpart = _find_monster(state_owner, monster.id)
+            health = counterpart.health if counterpart is not None else monster.health
+            expected_damage += outcome.probability * (monster.health - health)
+            if health <= 0:
+                knockout_probability += outcome.probability
+        return ChanceAnalysis(expected_damage, knockout_probability, outcomes)
+
+
+def _find_monster(player: PlayerUnit, monster_id: int):
+    """Finds a monster by ID in play or in the discard pile (where knocked-out monsters go)."""
+    if player.active_monster and player.active_monster.id == monster_id:
+        return player.active_monster
+    return player.bench.get(monster_id) or player.discard.get(monster_id)
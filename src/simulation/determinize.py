@@ -0,0 +1,90 @@
+import random
+
+from core.game import GameState
+from models.player import PlayerUnit
+
+
+class Determinizer:
+    """
+    Samples complete game states that are consistent with what one player can see.
+
+    A `GameState` holds every card in every zone, so a search that plays on it directly
+    knows the opponent's hand and both players' deck order and prizes. A determinization
+    keeps everything the observer can see (both fields, both discard piles, the observer's
+    hand and the size of every zone) and re-deals the rest uniformly at random:
+
+    * the opponent's hand, deck and prizes are shuffled together and dealt back into
+      zones of the same sizes, and;
+    * the observer's own deck and prizes are shuffled together, as the observer does not
+      know the deck order or which cards were set aside as prizes.
+
+    The engine does not track revealed cards, so every unseen card is treated as equally
+    likely to be in any hidden zone of its owner.
+
+    Worlds are made with `GameState.clone()`, which shares the card templates and ability
+    effects between copies, so a world costs one copy of the per-card state plus a shuffle
+    of the unseen cards. The original game state is never modified.
+    """
+
+    def __init__(
+        self, game_state: GameState, observer: PlayerUnit, rng: random.Random | None = None
+    ) -> None:
+        """
+        Args:
+            game_state: The real game to sample from.
+            observer: The player whose point of view the worlds are consistent with.
+            rng: The RNG used for the re-deals. Pass a seeded `random.Random` to make
+                sampling reproducible; defaults to a fresh, unseeded one.
+        """
+        if observer is not game_state.player1 and observer is not game_state.player2:
+            raise ValueError(f"Player {observer.title} is not part of this game.")
+        self.game_state = game_state
+        self.observer_is_player1 = observer is game_state.player1
+        self.rng = rng or random.Random()
+
+    def sample(self) -> GameState:
+        """Returns one independent world consistent with the observer's information."""
+        world = self.game_state.clone()
+        self.redeal(world)
+        return world
+
+    def sample_batch(self, count: int) -> list[GameState]:
+        """Returns `count` independent worlds, e.g. one per search iteration."""
+        return [self.sample() for _ in range(count)]
+
+    def redeal(self, world: GameState) -> None:
+        """
+        Re-deals the hidden zones of `world` in place. `world` must be a clone of this
+        determinizer's game (or a world sampled from it) in which no hidden card has been
+        played since. Reusing one scratch world this way avoids a clone per sample.
+        """
+        if self.observer_is_player1:
+            observer, opponent = world.player1, world.player2
+        else:
+            observer, opponent = world.player2, world.player1
+        _deal_unseen(opponent, self.rng, hand_hidden=True)
+        _deal_unseen(observer, self.rng, hand_hidden=False)
+        # Cached legal actions may name cards that have just left the opponent's hand.
+        if world.current_player is opponent and world.legal_actions:
+            world.legal_actions = world.get_legal_actions(opponent)
+
+
+def _deal_unseen(player: PlayerUnit, rng: random.Random, hand_hidden: bool) -> None:
+    """
+    Shuffles a player's unseen cards together and deals them back into their zones,
+    keeping the size of each zone and the prize slots in use.
+    """
+    hand_cards = list(player.hand.values()) if hand_hidden else []
+    prize_slots = [slot for slot, card in player.prize.items() if card is not None]
+    unseen = hand_cards + [player.prize[slot] for slot in prize_slots] + player.deck.values()
+    rng.shuffle(unseen)
+
+    hand_size = len(hand_cards)
+    prize_end = hand_size + len(prize_slots)
+    if hand_hidden:
+        player.hand.clear()
+        for card in unseen[:hand_size]:
+            player.hand[card.id] = card
+    player.prize.update(zip(prize_slots, unseen[hand_size:prize_end]))
+    player.deck.clear()
+    player.deck.extend(unseen[prize_end:])
@@ -0,0 +1,366 @@
+import random
+
+import numpy as np
+
+from core.actions import Action
+from core.enums import ActionType, CardType, StageType
+from core.game import GameState
+from database.card_repository import CardRepository
+from models.monster import MANA_SLOTS
+from models.player import PlayerUnit
+from simulation.headless import DEFAULT_MAX_TURNS, HeadlessController, create_game
+
+#! OBSERVATION LAYOUT
+# Field slot 0 is the active monster, slots 1-5 the bench in play order.
+FIELD_SLOTS = 1 + PlayerUnit.CONST_MAX_BENCH_CARDS
+# Hand cards beyond this many are neither observed nor addressable by actions.
+HAND_SLOTS = 16
+# Attacks beyond this index are not addressable by actions.
+MAX_ATTACKS = 4
+
+SPECIAL_CONDITIONS = ("ASLEEP", "BURNED", "CONFUSED", "PARALYZED", "POISONED", "POISONED_20")
+
+# Categorical features are encoded as 1-based codes, leaving 0 for "none".
+_STAGE_CODES = {stage: code for code, stage in enumerate(StageType, start=1)}
+_CARD_TYPE_CODES = {card_type: code for code, card_type in enumerate(CardType, start=1)}
+
+# Per-monster features of the "field" array.
+F_PRESENT = 0
+F_CARD = 1
+F_HEALTH = 2
+F_MAX_HEALTH = 3
+F_STAGE = 4
+F_MANA_TYPE = 5
+F_RETREAT = 6
+F_MANA = 7  # One count per ManaType, in `MANA_SLOTS` order.
+F_CONDITIONS = F_MANA + len(MANA_SLOTS)  # One flag per SPECIAL_CONDITIONS entry.
+F_FLAGS = F_CONDITIONS + len(SPECIAL_CONDITIONS)  # has_attacked, has_attached, has_evolved, is_immune
+FIELD_FEATURES = F_FLAGS + 4
+
+# Per-card features of the "hand" array (the observing player's hand only).
+H_PRESENT = 0
+H_CARD = 1
+H_CARD_TYPE = 2
+H_STAGE = 3
+H_MANA_TYPE = 4
+HAND_FEATURES = 5
+
+# Per-player features of the "zones" array.
+Z_HAND = 0
+Z_DECK = 1
+Z_PRIZES = 2
+Z_DISCARD = 3
+Z_BENCH = 4
+ZONE_FEATURES = 5
+
+# Features of the "turn" array: turn count, and whether attacking is allowed yet.
+TURN_FEATURES = 2
+
+OBSERVATION_SHAPES = {
+    "field": (2, FIELD_SLOTS, FIELD_FEATURES),
+    "hand": (HAND_SLOTS, HAND_FEATURES),
+    "zones": (2, ZONE_FEATURES),
+    "turn": (TURN_FEATURES,),
+}
+
+#! ACTION LAYOUT
+# Every action type owns a contiguous block of indices:
+#   PASS                      1
+#   ATTACK    attack index    MAX_ATTACKS
+#   ACTIVATE  hand slot       HAND_SLOTS
+#   BENCH     hand slot       HAND_SLOTS
+#   USE       hand slot       HAND_SLOTS
+#   ATTACH    hand x field    HAND_SLOTS * FIELD_SLOTS
+#   EVOLVE    hand x field    HAND_SLOTS * FIELD_SLOTS
+#   RETREAT   bench slot      FIELD_SLOTS - 1
+_ACTION_BLOCKS = (
+    (ActionType.PASS, 1),
+    (ActionType.ATTACK, MAX_ATTACKS),
+    (ActionType.ACTIVATE, HAND_SLOTS),
+    (ActionType.BENCH, HAND_SLOTS),
+    (ActionType.USE, HAND_SLOTS),
+    (ActionType.ATTACH, HAND_SLOTS * FIELD_SLOTS),
+    (ActionType.EVOLVE, HAND_SLOTS * FIELD_SLOTS),
+    (ActionType.RETREAT, FIELD_SLOTS - 1),
+)
+ACTION_OFFSETS: dict[ActionType, int] = {}
+ACTION_SPACE_SIZE = 0
+for _action_type, _block_size in _ACTION_BLOCKS:
+    ACTION_OFFSETS[_action_type] = ACTION_SPACE_SIZE
+    ACTION_SPACE_SIZE += _block_size
+
+
+class ObservationEncoder:
+    """
+    Encodes a `GameState` from one player's point of view into fixed-shape NumPy arrays.
+
+    The observation is a dictionary of `float32` arrays (see `OBSERVATION_SHAPES`); index 0
+    of the per-player axes is the observing player, index 1 the opponent. Only the
+    observer's hand is encoded card by card; the opponent's hand is a count.
+
+    `encode()` writes into arrays allocated once by `allocate()`, so encoding a step never
+    allocates arrays. The arrays may also be views into a larger batch (see `vec_env`).
+    """
+
+    def __init__(self, card_titles) -> None:
+        """
+        Args:
+            card_titles: Every card title the encoder should tell apart. Titles are encoded
+                as 1-based codes in sorted order; unknown titles encode as 0.
+        """
+        self.card_codes = {
+            title: code for code, title in enumerate(sorted(set(card_titles)), start=1)
+        }
+
+    @staticmethod
+    def allocate(batch_shape: tuple = ()) -> dict[str, np.ndarray]:
+        """Returns a zeroed observation buffer, optionally with leading batch dimensions."""
+        return {
+            key: np.zeros(batch_shape + shape, dtype=np.float32)
+            for key, shape in OBSERVATION_SHAPES.items()
+        }
+
+    def encode(self, game_state: GameState, player: PlayerUnit, out: dict) -> dict:
+        """
+        Writes the observation of `game_state` as seen by `player` into `out`.
+
+        Returns:
+            `out`, for convenience.
+        """
+        opponent = (
+            game_state.player2 if player is game_state.player1 else game_state.player1
+        )
+        field, zones = out["field"], out["zones"]
+        field.fill(0)
+        for side, owner in enumerate((player, opponent)):
+            if owner.active_monster:
+                self._encode_monster(owner.active_monster, field[side, 0])
+            for slot, monster in enumerate(owner.bench.values(), start=1):
+                self._encode_monster(monster, field[side, slot])
+
+            owner_zones = zones[side]
+            owner_zones[Z_HAND] = len(owner.hand)
+            owner_zones[Z_DECK] = len(owner.deck)
+            owner_zones[Z_PRIZES] = len(owner.prize)
+            owner_zones[Z_DISCARD] = len(owner.discard)
+            owner_zones[Z_BENCH] = len(owner.bench)
+
+        hand = out["hand"]
+        hand.fill(0)
+        card_codes = self.card_codes
+        for slot, card in enumerate(player.hand.values()):
+            if slot >= HAND_SLOTS:
+                break
+            template = card.card
+            row = hand[slot]
+            row[H_PRESENT] = 1
+            row[H_CARD] = card_codes.get(template.title, 0)
+            row[H_CARD_TYPE] = _CARD_TYPE_CODES[template.type]
+            stage = getattr(template, "stage", None)
+            if stage is not None:
+                row[H_STAGE] = _STAGE_CODES[stage]
+            mana_type = getattr(template, "mana_type", None)
+            if mana_type is not None:
+                row[H_MANA_TYPE] = MANA_SLOTS[mana_type] + 1
+
+        turn = out["turn"]
+        turn[0] = game_state.turn_count
+        turn[1] = game_state.turn_count > 1
+        return out
+
+    def _encode_monster(self, monster, row: np.ndarray) -> None:
+        """Writes one monster's features into a zeroed row of the field array."""
+        template = monster.card
+        row[F_PRESENT] = 1
+        row[F_CARD] = self.card_codes.get(template.title, 0)
+        row[F_HEALTH] = monster.health
+        row[F_MAX_HEALTH] = template.health
+        if template.stage is not None:
+            row[F_STAGE] = _STAGE_CODES[template.stage]
+        row[F_MANA_TYPE] = MANA_SLOTS[template.mana_type] + 1
+        row[F_RETREAT] = template.retreat_val or 0
+        for mana_card in monster.attached_mana.values():
+            row[F_MANA + MANA_SLOTS[mana_card.card.mana_type]] += 1
+        if any(monster.mana_pool.values()):
+            for mana_type, amount in monster.mana_pool.items():
+                row[F_MANA + MANA_SLOTS[mana_type]] += amount
+        for i, condition in enumerate(SPECIAL_CONDITIONS):
+            if condition in monster.special_conditions:
+                row[F_CONDITIONS + i] = 1
+        row[F_FLAGS] = monster.has_attacked
+        row[F_FLAGS + 1] = monster.has_attached
+        row[F_FLAGS + 2] = monster.has_evolved
+        row[F_FLAGS + 3] = monster.is_immune
+
+
+def index_legal_actions(player: PlayerUnit, legal_actions: list[Action]) -> dict[int, Action]:
+    """
+    Maps legal actions onto the fixed action space (see `ACTION_OFFSETS`).
+
+    Actions that address a hand card beyond `HAND_SLOTS` or an attack beyond
+    `MAX_ATTACKS` have no index and are left out.
+
+    Returns:
+        Action index -> `Action`.
+    """
+    hand_slots = {card_id: slot for slot, card_id in enumerate(player.hand) if slot < HAND_SLOTS}
+    field_slots = {monster_id: slot for slot, monster_id in enumerate(player.bench, start=1)}
+    if player.active_monster:
+        field_slots[player.active_monster.id] = 0
+
+    indexed = {}
+    for action in legal_actions:
+        action_type = action.type
+        offset = ACTION_OFFSETS[action_type]
+        if action_type == ActionType.PASS:
+            index = offset
+        elif action_type == ActionType.ATTACK:
+            if action.subject >= MAX_ATTACKS:
+                continue
+            index = offset + action.subject
+        elif action_type == ActionType.RETREAT:
+            index = offset + field_slots[action.subject] - 1
+        else:
+            hand_slot = hand_slots.get(action.subject)
+            if hand_slot is None:
+                continue
+            if action_type in (ActionType.ATTACH, ActionType.EVOLVE):
+                index = offset + hand_slot * FIELD_SLOTS + field_slots[action.target]
+            else:
+                index = offset + hand_slot
+        indexed[index] = action
+    return indexed
+
+
+class BlackstarEnv:
+    """
+    A Gym-style reinforcement-learning environment around `GameState` and `RulesEngine`.
+
+    The agent plays the first player; the opponent's turns are played by
+    `opponent_policy` inside `step()`. Actions are indices into a fixed action space of
+    `ACTION_SPACE_SIZE` entries, and `action_mask` marks the legal ones. Observations are
+    produced by `ObservationEncoder` into buffers owned by the environment: they are
+    overwritten by the next `reset()` or `step()`, so copy them to keep them.
+
+    Rewards are +1 when the agent wins, -1 when it loses, and 0 otherwise. An episode is
+    truncated once the turn count exceeds `max_turns`.
+    """
+
+    def __init__(
+        self,
+        player_deck: list,
+        opponent_deck: list,
+        card_repo: CardRepository | None = None,
+        opponent_policy=None,
+        max_turns: int = DEFAULT_MAX_TURNS,
+        observation: dict | None = None,
+        action_mask: np.ndarray | None = None,
+        template_cache: dict | None = None,
+    ) -> None:
+        """
+        Args:
+            player_deck: Card titles for the agent's deck.
+            opponent_deck: Card titles for the opponent's deck.
+            card_repo: Optional repository to load cards from.
+            opponent_policy: A callable `(game_state, legal_actions) -> action` for the
+                opponent. Defaults to `RandomPolicy`.
+            max_turns: The turn after which an episode is truncated.
+            observation: Optional preallocated observation buffer to write into.
+            action_mask: Optional preallocated boolean mask of `ACTION_SPACE_SIZE` entries.
+            template_cache: Optional card template cache to share with other environments.
+        """
+        self.player_deck = player_deck
+        self.opponent_deck = opponent_deck
+        self.card_repo = card_repo or CardRepository()
+        self.opponent_policy = opponent_policy
+        self.max_turns = max_turns
+
+        self.encoder = ObservationEncoder([*player_deck, *opponent_deck])
+        self.observation = observation if observation is not None else self.encoder.allocate()
+        self.action_mask = (
+            action_mask if action_mask is not None else np.zeros(ACTION_SPACE_SIZE, dtype=bool)
+        )
+
+        # Card templates are immutable, so every episode reuses the ones loaded first.
+        self.template_cache = template_cache if template_cache is not None else {}
+
+        self.game_state: GameState | None = None
+        self.controller: HeadlessController | None = None
+        self._indexed_actions: dict[int, Action] = {}
+
+    @property
+    def agent(self) -> PlayerUnit:
+        return self.game_state.player1
+
+    def reset(self, seed: int | None = None) -> tuple[dict, dict]:
+        """
+        Starts a new episode.
+
+        Args:
+            seed: Optional seed for shuffles, coin flips and the opponent's choices.
+
+        Returns:
+            `(observation, info)`, where `info["action_mask"]` is the legal-action mask.
+        """
+        self.game_state = create_game(
+            self.player_deck,
+            self.opponent_deck,
+            card_repo=self.card_repo,
+            seed=seed,
+            template_cache=self.template_cache,
+        )
+        self.controller = HeadlessController(
+            self.game_state, policy=self.opponent_policy, rng=random.Random(seed)
+        )
+        return self._observe(), {"action_mask": self.action_mask}
+
+    def step(self, action_index: int) -> tuple[dict, float, bool, bool, dict]:
+        """
+        Plays the agent's action, then the opponent's turns until the agent is to act
+        again or the episode ends.
+
+        Args:
+            action_index: An index whose `action_mask` entry is set.
+
+        Returns:
+            `(observation, reward, terminated, truncated, info)`.
+        """
+        action = self._indexed_actions.get(int(action_index))
+        if action is None:
+            raise ValueError(f"Action index {action_index} is not legal in this state.")
+
+        game_state = self.game_state
+        self.controller.apply(action)
+        while (
+            not game_state.winner
+            and game_state.current_player is not self.agent
+            and game_state.turn_count <= self.max_turns
+        ):
+            self.controller.step()
+
+        terminated = game_state.winner is not None
+        truncated = not terminated and game_state.turn_count > self.max_turns
+        if terminated:
+            reward = 1.0 if game_state.winner is self.agent else -1.0
+        else:
+            reward = 0.0
+        info = {"action_mask": self.action_mask, "turn": game_state.turn_count}
+        return self._observe(), reward, terminated, truncated, info
+
+    def legal_action(self, action_index: int) -> Action | None:
+        """Returns the `Action` behind a legal action index, or `None`."""
+        return self._indexed_actions.get(int(action_index))
+
+    def _observe(self) -> dict:
+        """Refreshes the legal actions and mask for the agent and encodes the observation."""
+        game_state = self.game_state
+        mask = self.action_mask
+        mask.fill(False)
+        if game_state.winner or game_state.turn_count > self.max_turns:
+            self._indexed_actions = {}
+        else:
+            game_state.legal_actions = game_state.get_legal_actions(self.agent)
+            self._indexed_actions = index_legal_actions(self.agent, game_state.legal_actions)
+            for index in self._indexed_actions:
+                mask[index] = True
+        return self.encoder.encode(game_state, self.agent, self.observation)
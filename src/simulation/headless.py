@@ -0,0 +1,205 @@
+import logging
+import random
+
+from controller.game_controller import GameController
+from core.actions import Action
+from core.card_factory import generate_deck_from_list
+from core.enums import CardType, StageType
+from core.game import GameState
+from database.card_repository import CardRepository
+from models.player import PlayerUnit
+
+logger = logging.getLogger(__name__)
+
+OPENING_HAND_SIZE = 7
+PRIZE_CARD_COUNT = 6
+DEFAULT_MAX_TURNS = 200
+
+
+def prepare_player(player: PlayerUnit) -> bool:
+    """
+    Readies a player for the first turn: builds and shuffles the deck from the field,
+    sets aside prize cards and draws an opening hand, redrawing until the hand holds a
+    basic monster.
+
+    Returns:
+        bool: `False` if the deck holds no basic monster at all, otherwise `True`.
+    """
+    player.initialize_deck()
+    player.shuffle_deck()
+    player.set_prize_cards(PRIZE_CARD_COUNT)
+    player.draw_from_deck(OPENING_HAND_SIZE)
+
+    # Guard against decks that could never produce a legal opening hand.
+    if not player.has_basic_monster_in_hand() and not any(
+        card.card.type == CardType.MONSTER and card.card.stage == StageType.BASIC
+        for card in player.deck.values()
+    ):
+        logger.error(f"{player.title} has no basic monster in their deck.")
+        return False
+
+    # Handle mulligans if no basic monster is in the opening hand.
+    while not player.has_basic_monster_in_hand():
+        logger.warning(f"{player.title} has no basic monster, redrawing hand.")
+        player.return_hand_to_deck()
+        player.shuffle_deck()
+        player.draw_from_deck(OPENING_HAND_SIZE)
+    return True
+
+
+def create_game(
+    player_deck: list,
+    opponent_deck: list,
+    card_repo: CardRepository | None = None,
+    seed: int | None = None,
+    template_cache: dict | None = None,
+) -> GameState:
+    """
+    Sets up a ready-to-play game between two deck lists, as `main.py` does for the terminal.
+
+    Args:
+        player_deck: Card titles for the first player.
+        opponent_deck: Card titles for the second player.
+        card_repo: Optional repository to load cards from.
+        seed: Optional seed for the global RNG used by shuffles and coin flips.
+        template_cache: Optional template cache shared across games; see
+            `generate_deck_from_list`.
+
+    Returns:
+        A GameState with the first player's turn started.
+    """
+    if seed is not None:
+        random.seed(seed)
+    card_repo = card_repo or CardRepository()
+
+    player = PlayerUnit(title="Player")
+    opponent = PlayerUnit(title="Opponent")
+    generate_deck_from_list(
+        player_deck, player_unit=player, card_repo=card_repo, template_cache=template_cache
+    )
+    generate_deck_from_list(
+        opponent_deck, player_unit=opponent, card_repo=card_repo, template_cache=template_cache
+    )
+    prepare_player(player)
+    prepare_player(opponent)
+
+    game_state = GameState(player, opponent)
+    game_state._start_new_turn_for_player()
+    return game_state
+
+
+class RandomPolicy:
+    """
+    A policy that chooses uniformly among the legal actions.
+    """
+
+    def __init__(self, rng: random.Random | None = None) -> None:
+        self.rng = rng or random.Random()
+
+    def __call__(self, game_state: GameState, legal_actions: list) -> Action:
+        return self.rng.choice(legal_actions)
+
+
+class GameResult:
+    """
+    The outcome of a finished (or turn-limited) headless game.
+
+    Attributes:
+        winner (str): The title of the winning player, or `None` if the game hit the turn limit.
+        turns (int): The number of turns played.
+        prizes_left (tuple): Prize cards remaining for player one and player two.
+        card_stats (dict): Per-card statistics, if they were recorded; see
+            `simulation.results.CardStatsRecorder`.
+    """
+
+    def __init__(self, winner, turns, prizes_left, card_stats=None) -> None:
+        self.winner: str | None = winner
+        self.turns: int = turns
+        self.prizes_left: tuple[int, int] = prizes_left
+        self.card_stats: dict | None = card_stats
+
+    @classmethod
+    def from_state(cls, game_state: GameState) -> "GameResult":
+        """Builds a result from the final game state."""
+        return cls(
+            winner=game_state.winner.title if game_state.winner else None,
+            turns=game_state.turn_count,
+            prizes_left=(len(game_state.player1.prize), len(game_state.player2.prize)),
+        )
+
+    def __repr__(self) -> str:
+        return f"GameResult(winner={self.winner!r}, turns={self.turns}, prizes_left={self.prizes_left})"
+
+
+class HeadlessController(GameController):
+    """
+    A `GameController` without a view. Instead of parsing typed commands, it asks a
+    policy to pick one of the legal actions each step, which makes it suitable for
+    simulations and benchmarks.
+    """
+
+    def __init__(self, game_state: GameState, policy=None, rng: random.Random | None = None):
+        """
+        Args:
+            game_state: The game to drive.
+            policy: A callable `(game_state, legal_actions) -> action`. Defaults to `RandomPolicy`.
+            rng: The random source for policy and prompt choices.
+        """
+        super().__init__(game_state, view=None)
+        self.rng = rng or random.Random()
+        self.policy = policy or RandomPolicy(self.rng)
+
+    def get_attack_choice(self, attacks: list) -> int:
+        """Chooses an attack at random for effects that prompt the player."""
+        return self.rng.randrange(len(attacks))
+
+    def step(self) -> bool:
+        """
+        Chooses and executes one legal action for the current player.
+
+        Returns:
+            `True` if the action ended the turn.
+        """
+        game_state = self.game_state
+        game_state.legal_actions = game_state.get_legal_actions(game_state.current_player)
+        return self.apply(self.policy(game_state, game_state.legal_actions))
+
+    def apply(self, action: Action) -> bool:
+        """
+        Executes a legal action for the current player, then ends the turn if the
+        action did so and resolves knockouts.
+
+        Returns:
+            `True` if the action ended the turn.
+        """
+        turn_ended, _ = self.execute_command(action.to_command())
+        if turn_ended:
+            self.end_turn()
+        self.game_state.check_knockouts()
+        return turn_ended
+
+    def play(self, max_turns: int = DEFAULT_MAX_TURNS) -> GameResult:
+        """
+        Plays until a player wins or the turn limit is reached.
+
+        Args:
+            max_turns: The turn after which the game is abandoned without a winner.
+        """
+        while not self.game_state.winner and self.game_state.turn_count <= max_turns:
+            self.step()
+        return GameResult.from_state(self.game_state)
+
+
+def play_game(
+    player_deck: list,
+    opponent_deck: list,
+    card_repo: CardRepository | None = None,
+    seed: int | None = None,
+    max_turns: int = DEFAULT_MAX_TURNS,
+) -> GameResult:
+    """
+    Sets up and plays a complete headless game with random policies for both players.
+    """
+    game_state = create_game(player_deck, opponent_deck, card_repo=card_repo, seed=seed)
+    controller = HeadlessController(game_state, rng=random.Random(seed))
+    return controller.play(max_turns=max_turns)
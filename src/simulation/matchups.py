@@ -0,0 +1,180 @@
+import hashlib
+import json
+import logging
+import os
+import time
+
+from core.rules import RULES_VERSION
+from database.card_repository import CardRepository
+from simulation.headless import DEFAULT_MAX_TURNS
+from simulation.pool import WarmPool, play_games
+from simulation.results import GameRecord, MatchupSummary, ResultStore, deck_hash
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_GAMES_PER_PAIR = 100
+# Games per pool job. Small enough that many pairs keep every worker busy, large
+# enough that dispatch costs little next to the games.
+DEFAULT_CHUNK_SIZE = 25
+
+
+def load_deck(path: str) -> list[str]:
+    """
+    Reads a deck list file: one card per line, as a title or as `<count> <title>`.
+    Blank lines and everything after a `#` are ignored.
+
+    Raises:
+        ValueError: If a count is not a positive whole number.
+    """
+    deck = []
+    with open(path, encoding="utf-8") as deck_file:
+        for line_number, raw_line in enumerate(deck_file, start=1):
+            line = raw_line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            count, _, title = line.partition(" ")
+            if count.isdecimal():
+                if int(count) < 1:
+                    raise ValueError(f"{path}, line {line_number}: the count must be at least 1.")
+                deck.extend([title.strip()] * int(count))
+            else:
+                deck.append(line)
+    return deck
+
+
+def deck_name(path: str) -> str:
+    """Names a deck after its file, without the directory or extension."""
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def matchup_key(player_deck: list, opponent_deck: list, games: int, seed: int, max_turns: int) -> str:
+    """
+    Returns the cache key of one matchup's results: a hash of both decks' contents, the
+    rules version (`core.rules.RULES_VERSION`) and the parameters the games were played
+    with. Any change to those runs the matchup again.
+    """
+    payload = json.dumps(
+        [deck_hash(player_deck), deck_hash(opponent_deck), RULES_VERSION, games, seed, max_turns]
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:24]
+
+
+class MatchupMatrix:
+    """
+    Win rates of every deck against every other, itself included.
+
+    Attributes:
+        names (list): The deck names, in row and column order.
+        summaries (dict): `(row, column) -> MatchupSummary` of the row deck, playing
+            first, against the column deck.
+        computed (set): The `(row, column)` pairs played for this matrix rather than
+            taken from the cache.
+        seconds (float): The wall-clock time to build the matrix.
+    """
+
+    def __init__(self, names: list[str]) -> None:
+        self.names = names
+        self.summaries: dict[tuple[int, int], MatchupSummary] = {}
+        self.computed: set[tuple[int, int]] = set()
+        self.seconds = 0.0
+
+    def win_rate(self, row: int, column: int) -> float:
+        return self.summaries[(row, column)].win_rate
+
+    def format_table(self) -> str:
+        """Returns the matrix as text: win rates in percent, rows playing first."""
+        width = max(6, *(len(name) for name in self.names))
+        lines = [" " * width + "".join(f" {name[:8]:>8}" for name in self.names)]
+        for row, name in enumerate(self.names):
+            cells = "".join(f" {self.win_rate(row, column) * 100:7.1f}%" for column in range(len(self.names)))
+            lines.append(f"{name:<{width}}{cells}")
+        pairs = len(self.names) ** 2
+        lines.append(
+            f"{pairs} pairs: {len(self.computed)} played, {pairs - len(self.computed)} cached, "
+            f"in {self.seconds:.2f}s"
+        )
+        return "\n".join(lines)
+
+
+def compute_matrix(
+    decks: dict[str, list],
+    store: ResultStore,
+    games: int = DEFAULT_GAMES_PER_PAIR,
+    seed: int = 0,
+    max_turns: int = DEFAULT_MAX_TURNS,
+    pool: WarmPool | None = None,
+    num_workers: int | None = None,
+    card_repo: CardRepository | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> MatchupMatrix:
+    """
+    Builds the N×N matchup matrix of `decks`, running only the pairs not in the cache.
+
+    Each pair plays `games` headless games seeded `seed`, `seed + 1`, ... and is cached
+    in `store` under `matchup_key`, so a later run with one deck changed replays only
+    that deck's row and column, and a rules version bump replays everything. The games
+    of all uncached pairs are queued on the pool at once, in chunks, so workers stay
+    busy across pairs; every game is also recorded in `store`.
+
+    Args:
+        decks: Deck name -> card titles.
+        store: The result store that holds the cache and receives the games.
+        pool: A pool to play on. If omitted and any pair must be played, a `WarmPool`
+            of `num_workers` is started on `card_repo` and closed afterwards.
+        chunk_size: Games per pool job.
+    """
+    start = time.perf_counter()
+    names = list(decks)
+    matrix = MatchupMatrix(names)
+    keys = {
+        (row, column): matchup_key(decks[names[row]], decks[names[column]], games, seed, max_turns)
+        for row in range(len(names))
+        for column in range(len(names))
+    }
+    cached = store.cached_matchups(keys.values())
+    missing = []
+    for pair, key in keys.items():
+        if key in cached:
+            matrix.summaries[pair] = cached[key]
+        else:
+            missing.append(pair)
+    logger.info(f"{len(keys) - len(missing)} of {len(keys)} matchups cached; playing {len(missing)}.")
+
+    if missing:
+        owns_pool = pool is None
+        if owns_pool:
+            pool = WarmPool(num_workers, card_repo=card_repo, warm_decks=list(decks.values()))
+        try:
+            _play_pairs(matrix, decks, missing, keys, store, pool, games, seed, max_turns, chunk_size)
+        finally:
+            if owns_pool:
+                pool.close()
+    matrix.seconds = time.perf_counter() - start
+    return matrix
+
+
+def _play_pairs(matrix, decks, pairs, keys, store, pool, games, seed, max_turns, chunk_size) -> None:
+    names = matrix.names
+    seeds = list(range(seed, seed + games))
+    # Queue everything first, then collect pair by pair.
+    jobs = []
+    for row, column in pairs:
+        player_deck, opponent_deck = decks[names[row]], decks[names[column]]
+        futures = [
+            pool.submit(play_games, player_deck, opponent_deck, seeds[i:i + chunk_size], max_turns, True)
+            for i in range(0, games, chunk_size)
+        ]
+        jobs.append(((row, column), player_deck, opponent_deck, futures))
+
+    for pair, player_deck, opponent_deck, futures in jobs:
+        results = [result for future in futures for result in future.result()]
+        store.add_many(
+            GameRecord.from_result(player_deck, opponent_deck, game_seed, result)
+            for game_seed, result in zip(seeds, results)
+        )
+        summary = MatchupSummary.from_results(results)
+        # The games go through the writer; commit them before the cache entry that vouches for them.
+        store.flush()
+        store.save_matchup(keys[pair], player_deck, opponent_deck, RULES_VERSION, summary)
+        matrix.summaries[pair] = summary
+        matrix.computed.add(pair)
@@ -0,0 +1,151 @@
+import random
+import time
+
+from core.actions import Action
+from core.coins import coin_source
+from core.game import GameState
+from simulation.headless import HeadlessController
+
+
+class PerftResult:
+    """
+    The counts and timing of one perft run.
+
+    Attributes:
+        depth (int): The number of actions searched.
+        leaves (int): The number of leaf positions (the perft count).
+        nodes (int): The number of positions visited, root included; one command was
+            applied for every position but the root.
+        seconds (float): The wall-clock time of the walk.
+    """
+
+    def __init__(self, depth: int, leaves: int, nodes: int, seconds: float) -> None:
+        self.depth = depth
+        self.leaves = leaves
+        self.nodes = nodes
+        self.seconds = seconds
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.seconds if self.seconds else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"PerftResult(depth={self.depth}, leaves={self.leaves}, nodes={self.nodes}, "
+            f"nodes_per_second={self.nodes_per_second:.0f})"
+        )
+
+
+class Perft:
+    """
+    Counts the legal action sequences of one turn, like a chess engine's perft.
+
+    From the root, every legal action is applied to a snapshot (`GameState.clone()`) of
+    the position and the walk recurses into the result, so the root is never modified.
+    A sequence ends at a leaf when it reaches `depth` actions, when its last action ends
+    the turn (PASS, ATTACK and RETREAT do) or when it decides the game. The walk never
+    crosses into the next turn.
+
+    With `in_place=True` the walk instead applies each action to the position itself and
+    reverts it with `GameController.undo()`, which avoids the clones; the position is
+    back to where it started when the walk returns. Both walks must give the same counts.
+
+    Chance is fixed by the seed: every action is applied with coin flips and attack
+    prompts drawn from a fresh RNG seeded with `seed`, so the counts do not depend on the
+    order of the walk and are reproducible across runs and machines.
+    """
+
+    def __init__(self, seed: int = 0, in_place: bool = False) -> None:
+        """
+        Args:
+            seed: The seed for the coin flips and prompts of every applied action.
+            in_place: Walk by executing and undoing commands instead of cloning.
+        """
+        self.seed = seed
+        self.in_place = in_place
+        self.nodes = 0
+        self._controller: HeadlessController | None = None
+
+    def count(self, game_state: GameState, depth: int) -> int:
+        """Returns the number of leaf positions `depth` actions (or fewer) from `game_state`."""
+        self._bind(game_state)
+        self.nodes += 1
+        return self._walk(game_state, depth)
+
+    def divide(self, game_state: GameState, depth: int) -> dict[Action, int]:
+        """
+        Returns the perft count below each legal root action. The counts sum to
+        `count(game_state, depth)`; comparing them narrows a mismatch down to one action.
+        """
+        self._bind(game_state)
+        self.nodes += 1
+        counts = {}
+        for action in game_state.get_legal_actions(game_state.current_player):
+            counts[action] = self._walk_child(game_state, action, depth)
+        return counts
+
+    def run(self, game_state: GameState, depth: int) -> PerftResult:
+        """Counts the leaves at `depth` and times the walk, for benchmarking."""
+        self.nodes = 0
+        start = time.perf_counter()
+        leaves = self.count(game_state, depth)
+        return PerftResult(depth, leaves, self.nodes, time.perf_counter() - start)
+
+    def _bind(self, game_state: GameState) -> None:
+        if self._controller is None:
+            self._controller = HeadlessController(game_state, rng=random.Random(self.seed))
+
+    def _walk(self, game_state: GameState, depth: int) -> int:
+        if depth <= 0:
+            return 1
+        leaves = 0
+        for action in game_state.get_legal_actions(game_state.current_player):
+            leaves += self._walk_child(game_state, action, depth)
+        return leaves
+
+    def _walk_child(self, game_state: GameState, action: Action, depth: int) -> int:
+        """Applies `action` to the position (or a snapshot of it) and counts the leaves below."""
+        self.nodes += 1
+        if self.in_place:
+            turn_ended = self._execute(game_state, action)
+            if turn_ended or game_state.winner or depth == 1:
+                leaves = 1
+            else:
+                leaves = self._walk(game_state, depth - 1)
+            self._controller.undo()
+            return leaves
+
+        child = game_state.clone()
+        if self._apply(child, action) or child.winner or depth == 1:
+            return 1
+        return self._walk(child, depth - 1)
+
+    def _apply(self, game_state: GameState, action: Action) -> bool:
+        """Applies one action with the seeded chance sources. Returns whether the turn ended."""
+        controller = self._controller
+        controller.game_state = game_state
+        controller.rng.seed(self.seed)
+        rng = random.Random(self.seed)
+        with coin_source(lambda: bool(rng.getrandbits(1))):
+            return controller.apply(action)
+
+    def _execute(self, game_state: GameState, action: Action) -> bool:
+        """
+        Executes one action's command with the seeded chance sources, without passing the
+        turn, so that it can be undone. Returns whether the action ended the turn.
+        """
+        controller = self._controller
+        controller.game_state = game_state
+        controller.rng.seed(self.seed)
+        rng = random.Random(self.seed)
+        with coin_source(lambda: bool(rng.getrandbits(1))):
+            turn_ended, _ = controller.execute_command(action.to_command())
+        return turn_ended
+
+
+def perft(game_state: GameState, depth: int, seed: int = 0, in_place: bool = False) -> int:
+    """
+    Returns the number of leaf positions reachable from `game_state` within `depth`
+    actions of the current turn. See `Perft`.
+    """
+    return Perft(seed, in_place).count(game_state, depth)
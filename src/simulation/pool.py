@@ -0,0 +1,308 @@
+import itertools
+import logging
+import multiprocessing
+import queue
+import random
+import threading
+import time
+import traceback
+from concurrent.futures import Future
+
+from core.card_factory import CardFactory
+from database.card_repository import CardRepository
+from database.shared_catalog import SharedCatalog
+from models.card import CardTemplate
+from simulation.headless import DEFAULT_MAX_TURNS, GameResult, HeadlessController, create_game
+from simulation.results import CardStatsRecorder
+
+logger = logging.getLogger(__name__)
+
+# Imported once by the fork server, so that workers forked from it start with the
+# engine loaded and the effect registry populated.
+WARM_MODULES = [
+    "core.game",
+    "core.rules",
+    "core.card_factory",
+    "effects.effect_registry",
+    "models.monster",
+    "database.card_repository",
+    "database.shared_catalog",
+    "simulation.headless",
+    "simulation.results",
+    "simulation.pool",
+]
+
+# How often the result collector checks that the workers are still alive, in seconds.
+LIVENESS_INTERVAL = 0.5
+
+# The card source and template cache of this process when it is a pool worker.
+_worker_repo = None
+_worker_templates: dict = {}
+
+
+def play_games(
+    player_deck: list,
+    opponent_deck: list,
+    seeds: list,
+    max_turns: int = DEFAULT_MAX_TURNS,
+    card_stats: bool = False,
+) -> list[GameResult]:
+    """
+    Plays one headless game per seed between two deck lists, with random policies, as
+    `simulation.headless.play_game` does.
+
+    In a pool worker the cards come from the shared catalog and the templates from the
+    worker's cache, so only the first game with a new card builds its template. Card
+    IDs restart at 0 for every game, which also keeps the card registry of a
+    long-lived worker from growing. With `card_stats`, each result carries the game's
+    `CardStatsRecorder.stats`.
+    """
+    card_repo = _worker_repo or CardRepository()
+    results = []
+    for seed in seeds:
+        CardTemplate.reset_ids()
+        game_state = create_game(
+            player_deck, opponent_deck, card_repo=card_repo, seed=seed, template_cache=_worker_templates
+        )
+        recorder = CardStatsRecorder(game_state) if card_stats else None
+        controller = HeadlessController(game_state, rng=random.Random(seed))
+        result = controller.play(max_turns=max_turns)
+        if recorder is not None:
+            result.card_stats = recorder.stats
+        results.append(result)
+    return results
+
+
+def _init_worker(catalog_name: str, warm_decks: list) -> None:
+    global _worker_repo
+    _worker_repo = SharedCatalog.attach(catalog_name)
+    for deck in warm_decks:
+        for title in deck:
+            # Same key as `generate_deck_from_list`.
+            key = (title, "BS")
+            if key not in _worker_templates:
+                _worker_templates[key] = CardFactory.create_card_from_db(_worker_repo, title, "BS")
+
+
+def _worker_loop(jobs, results, catalog_name: str, warm_decks: list) -> None:
+    """
+    Runs jobs until it receives `None`. Each job is `(job_id, fn, args, kwargs)`; each
+    answer is `(job_id, ok, value)`, where the value is the result, or a traceback string
+    if the job raised. The first answer, with job ID `None`, reports that the worker is
+    ready.
+    """
+    try:
+        _init_worker(catalog_name, warm_decks)
+        results.put((None, True, None))
+    except Exception:
+        results.put((None, False, traceback.format_exc()))
+        return
+    while True:
+        job = jobs.get()
+        if job is None:
+            break
+        job_id, fn, args, kwargs = job
+        try:
+            results.put((job_id, True, fn(*args, **kwargs)))
+        except Exception:
+            results.put((job_id, False, traceback.format_exc()))
+    _worker_repo.close()
+
+
+class WarmPool:
+    """
+    A pool of simulation workers that are started, and warmed up, once.
+
+    Starting a worker the ordinary way costs importing the engine (which registers
+    every effect), opening the card database and building the templates of the decks
+    it plays. `WarmPool` pays that once: under the `forkserver` start method the fork
+    server imports `WARM_MODULES` before forking any worker, the card database is
+    loaded once into a `SharedCatalog` that every worker attaches to, and each worker
+    can build the templates of `warm_decks` before it reports ready. The constructor
+    returns when every worker is ready, after which a job costs a queue round trip.
+
+    Jobs are module-level functions (they are pickled by reference), e.g.
+    `play_games`; `play()` splits a batch of games over the workers.
+
+    Use as a context manager, or call `close()`, to stop the workers and free the
+    catalog.
+    """
+
+    def __init__(
+        self,
+        num_workers: int | None = None,
+        card_repo: CardRepository | None = None,
+        catalog: SharedCatalog | None = None,
+        warm_decks: list | None = None,
+        start_method: str | None = None,
+    ) -> None:
+        """
+        Args:
+            num_workers: The number of worker processes. Defaults to the CPU count.
+            card_repo: The repository to load the shared catalog from, if `catalog` is
+                not given. A new one is opened if both are omitted.
+            catalog: A shared catalog to use instead of creating one; it stays open
+                when the pool closes.
+            warm_decks: Deck lists whose templates every worker builds before reporting ready.
+            start_method: The multiprocessing start method. Defaults to `forkserver`
+                where the platform has it.
+        """
+        start = time.perf_counter()
+        self.num_workers = num_workers or multiprocessing.cpu_count()
+        self._owns_catalog = catalog is None
+        self.catalog = catalog or SharedCatalog.create(card_repo)
+
+        if start_method is None:
+            start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else None
+        context = multiprocessing.get_context(start_method)
+        if context.get_start_method() == "forkserver":
+            context.set_forkserver_preload(WARM_MODULES)
+
+        self._jobs = context.Queue()
+        self._results = context.Queue()
+        self._futures: dict[int, Future] = {}
+        self._lock = threading.Lock()
+        self._job_ids = itertools.count()
+        self._closed = False
+        self._collector = None
+        self._processes = [
+            context.Process(
+                target=_worker_loop,
+                args=(self._jobs, self._results, self.catalog.name, list(warm_decks or [])),
+                daemon=True,
+            )
+            for _ in range(self.num_workers)
+        ]
+        for process in self._processes:
+            process.start()
+
+        try:
+            ready = 0
+            while ready < self.num_workers:
+                try:
+                    _, ok, error = self._results.get(timeout=LIVENESS_INTERVAL)
+                except queue.Empty:
+                    if not all(process.is_alive() for process in self._processes):
+                        raise RuntimeError("A pool worker exited during startup.") from None
+                    continue
+                if not ok:
+                    raise RuntimeError(f"Worker failed to start:\n{error}")
+                ready += 1
+        except BaseException:
+            self.close()
+            raise
+        self._collector = threading.Thread(target=self._collect, name="warm-pool-results", daemon=True)
+        self._collector.start()
+        self.startup_seconds = time.perf_counter() - start
+        logger.info(f"Started {self.num_workers} warm workers in {self.startup_seconds:.3f}s.")
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        """
+        Queues `fn(*args, **kwargs)` for the next free worker.
+
+        Returns:
+            A `Future` for the result. If the job raises, the future's exception is a
+            `RuntimeError` holding the worker's traceback.
+        """
+        future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("The pool is closed.")
+            job_id = next(self._job_ids)
+            self._futures[job_id] = future
+        self._jobs.put((job_id, fn, args, kwargs))
+        return future
+
+    def play(
+        self,
+        player_deck: list,
+        opponent_deck: list,
+        games: int,
+        seed: int = 0,
+        max_turns: int = DEFAULT_MAX_TURNS,
+        chunk_size: int | None = None,
+        card_stats: bool = False,
+    ) -> list[GameResult]:
+        """
+        Plays `games` games of one matchup across the workers, seeded `seed`,
+        `seed + 1`, ... as `play_games` seeds them.
+
+        Args:
+            chunk_size: Games per job. Defaults to spreading the games evenly over the workers.
+            card_stats: Record per-card statistics in each result.
+
+        Returns:
+            The results, in seed order.
+        """
+        chunk_size = chunk_size or max(1, -(-games // self.num_workers))
+        seeds = list(range(seed, seed + games))
+        futures = [
+            self.submit(play_games, player_deck, opponent_deck, seeds[i:i + chunk_size], max_turns, card_stats)
+            for i in range(0, games, chunk_size)
+        ]
+        return [result for future in futures for result in future.result()]
+
+    def _collect(self) -> None:
+        """
+        Resolves futures as results arrive, and fails them all if a worker dies. Stops at
+        the `None` job ID `close()` sends once the workers have exited.
+        """
+        while True:
+            try:
+                job_id, ok, value = self._results.get(timeout=LIVENESS_INTERVAL)
+            except queue.Empty:
+                if self._closed or all(process.is_alive() for process in self._processes):
+                    continue
+                self._fail_pending(RuntimeError("A pool worker exited unexpectedly."))
+                return
+            if job_id is None:
+                return
+            with self._lock:
+                future = self._futures.pop(job_id, None)
+            if future is None:
+                continue
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(RuntimeError(f"Job failed in a pool worker:\n{value}"))
+
+    def _fail_pending(self, error: Exception) -> None:
+        with self._lock:
+            self._closed = True
+            futures, self._futures = self._futures, {}
+        for future in futures.values():
+            future.set_exception(error)
+
+    def close(self) -> None:
+        """
+        Stops the workers once the queued jobs are done, and frees the catalog if the
+        pool created it.
+        """
+        with self._lock:
+            if self._processes is None:
+                return
+            self._closed = True
+        for process in self._processes:
+            if process.is_alive():
+                self._jobs.put(None)
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        if self._collector is not None:
+            # Results are in the queue ahead of this, so the collector resolves them first.
+            self._results.put((None, True, None))
+            self._collector.join()
+        self._processes = None
+        self._fail_pending(RuntimeError("The pool was closed."))
+        self._jobs.close()
+        self._results.close()
+        if self._owns_catalog:
+            self.catalog.close()
+            self.catalog.unlink()
+
+    def __enter__(self) -> "WarmPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,425 @@
+import hashlib
+import json
+import logging
+import queue
+import sqlite3
+import threading
+from typing import TYPE_CHECKING, Iterable
+
+from core.events import AttackResolved, Knockout
+
+if TYPE_CHECKING:
+    from core.game import GameState
+    from simulation.headless import GameResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 2000
+# How long the writer waits for more records before committing a partial batch, in seconds.
+DEFAULT_FLUSH_INTERVAL = 0.5
+# Records queued beyond this block `add` until the writer catches up.
+DEFAULT_MAX_PENDING = 100_000
+
+# Winner codes stored in `games.winner`.
+NO_WINNER = 0
+PLAYER_WINS = 1
+OPPONENT_WINS = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS decks (
+    hash TEXT PRIMARY KEY,
+    cards TEXT NOT NULL -- JSON list of card titles
+);
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    player_deck TEXT NOT NULL REFERENCES decks(hash),
+    opponent_deck TEXT NOT NULL REFERENCES decks(hash),
+    seed INTEGER,
+    winner INTEGER NOT NULL, -- 0 none (turn limit), 1 player, 2 opponent
+    turns INTEGER NOT NULL,
+    player_prizes INTEGER NOT NULL, -- prize cards left
+    opponent_prizes INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS card_stats (
+    game_id INTEGER NOT NULL REFERENCES games(id),
+    side INTEGER NOT NULL, -- 1 player, 2 opponent
+    title TEXT NOT NULL,
+    attacks INTEGER NOT NULL,
+    damage INTEGER NOT NULL,
+    knocked_out INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS matchups (
+    key TEXT PRIMARY KEY, -- see `simulation.matchups.matchup_key`
+    player_deck TEXT NOT NULL REFERENCES decks(hash),
+    opponent_deck TEXT NOT NULL REFERENCES decks(hash),
+    rules_version INTEGER NOT NULL,
+    games INTEGER NOT NULL,
+    wins INTEGER NOT NULL,
+    losses INTEGER NOT NULL,
+    draws INTEGER NOT NULL,
+    average_turns REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_by_matchup ON games (player_deck, opponent_deck, winner);
+CREATE INDEX IF NOT EXISTS card_stats_by_game ON card_stats (game_id);
+CREATE INDEX IF NOT EXISTS card_stats_by_title ON card_stats (title, side);
+"""
+
+
+def deck_hash(deck_list: Iterable[str]) -> str:
+    """
+    Returns a content hash of a deck list. The order of the cards does not matter, so
+    two lists with the same cards hash the same.
+    """
+    payload = json.dumps(sorted(deck_list), separators=(",", ":")).encode("utf-8")
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+class CardStatsRecorder:
+    """
+    Counts, per side and card title, the attacks made, the damage they dealt and the
+    knockouts suffered during one game, by subscribing to the game's `EventBus`.
+
+    Attributes:
+        stats (dict): `(side, title) -> [attacks, damage, knocked_out]`, with side 1 for
+            the first player and 2 for the second.
+    """
+
+    def __init__(self, game_state: "GameState") -> None:
+        self.game_state = game_state
+        self.stats: dict[tuple[int, str], list[int]] = {}
+        game_state.events.subscribe(self._on_attack, AttackResolved)
+        game_state.events.subscribe(self._on_knockout, Knockout)
+
+    def _side(self, player) -> int:
+        return PLAYER_WINS if player is self.game_state.player1 else OPPONENT_WINS
+
+    def _entry(self, player, monster) -> list[int]:
+        key = (self._side(player), monster.card.title)
+        entry = self.stats.get(key)
+        if entry is None:
+            entry = self.stats[key] = [0, 0, 0]
+        return entry
+
+    def _on_attack(self, event: AttackResolved) -> None:
+        entry = self._entry(event.player, event.attacker)
+        entry[0] += 1
+        if event.damage_was_dealt:
+            entry[1] += event.damage
+
+    def _on_knockout(self, event: Knockout) -> None:
+        self._entry(event.player, event.monster)[2] += 1
+
+
+class GameRecord:
+    """
+    One stored game outcome.
+
+    Attributes:
+        player_deck (list): The first player's card titles.
+        opponent_deck (list): The second player's card titles.
+        seed (int): The game's seed, if any.
+        winner (int): `NO_WINNER`, `PLAYER_WINS` or `OPPONENT_WINS`.
+        turns (int): The number of turns played.
+        prizes_left (tuple): Prize cards left for the first and second player.
+        card_stats (dict): Optional `CardStatsRecorder.stats`.
+    """
+
+    __slots__ = ("player_deck", "opponent_deck", "seed", "winner", "turns", "prizes_left", "card_stats")
+
+    def __init__(self, player_deck, opponent_deck, seed, winner, turns, prizes_left, card_stats=None) -> None:
+        self.player_deck: list[str] = player_deck
+        self.opponent_deck: list[str] = opponent_deck
+        self.seed: int | None = seed
+        self.winner: int = winner
+        self.turns: int = turns
+        self.prizes_left: tuple[int, int] = prizes_left
+        self.card_stats: dict | None = card_stats
+
+    @classmethod
+    def from_result(
+        cls, player_deck: list, opponent_deck: list, seed: int | None, result: "GameResult"
+    ) -> "GameRecord":
+        """Builds a record from the result of a game set up by `simulation.headless.create_game`."""
+        winner = {None: NO_WINNER, "Player": PLAYER_WINS, "Opponent": OPPONENT_WINS}[result.winner]
+        return cls(
+            player_deck, opponent_deck, seed, winner, result.turns, result.prizes_left,
+            result.card_stats,
+        )
+
+
+class MatchupSummary:
+    """
+    The stored results of one deck against another.
+
+    Attributes:
+        games (int): Games recorded.
+        wins (int): Games the first deck won.
+        losses (int): Games the second deck won.
+        draws (int): Games that hit the turn limit.
+        average_turns (float): The mean game length.
+    """
+
+    __slots__ = ("games", "wins", "losses", "draws", "average_turns")
+
+    def __init__(self, games: int, wins: int, losses: int, draws: int, average_turns: float) -> None:
+        self.games = games
+        self.wins = wins
+        self.losses = losses
+        self.draws = draws
+        self.average_turns = average_turns
+
+    @classmethod
+    def from_results(cls, results: list) -> "MatchupSummary":
+        """Summarizes `GameResult`s of games set up by `simulation.headless.create_game`."""
+        winners = [result.winner for result in results]
+        turns = sum(result.turns for result in results)
+        return cls(
+            len(results), winners.count("Player"), winners.count("Opponent"), winners.count(None),
+            turns / len(results) if results else 0.0,
+        )
+
+    @property
+    def win_rate(self) -> float:
+        """The first deck's share of the games, counting draws as half a win."""
+        return (self.wins + self.draws / 2) / self.games if self.games else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"MatchupSummary(games={self.games}, wins={self.wins}, losses={self.losses}, "
+            f"draws={self.draws}, average_turns={self.average_turns:.1f})"
+        )
+
+
+class ResultStore:
+    """
+    Stores simulation outcomes in a dedicated SQLite database.
+
+    `add()` only queues a record. A background writer thread takes records off the
+    queue in batches of up to `batch_size` (or whatever has arrived within
+    `flush_interval`) and writes each batch with `executemany` in a single transaction,
+    so a commit, and its sync, is paid per batch rather than per game. The database is
+    in WAL mode, so queries (and other readers) are not blocked by the writer.
+
+    Game IDs are assigned by the writer, so only one `ResultStore` should write to a
+    database at a time; worker processes send their results to the process that owns
+    the store (e.g. through `WarmPool` futures).
+
+    Queries read what has been committed; call `flush()` first to include everything
+    added so far. An error in the writer is raised from the next `add`, `flush` or
+    `close`.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ) -> None:
+        """
+        Args:
+            db_path: The results database; created if missing.
+            batch_size: The most records written per transaction.
+            flush_interval: The longest a record waits for its batch to fill, in seconds.
+            max_pending: The most records queued before `add` blocks.
+        """
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.games_written = 0
+        self.batches_written = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._error: BaseException | None = None
+        self._reader: sqlite3.Connection | None = None
+
+        conn = self._connect()
+        conn.executescript(SCHEMA)
+        conn.close()
+
+        self._writer = threading.Thread(target=self._write_loop, name="result-store-writer", daemon=True)
+        self._writer.start()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        # In WAL mode, NORMAL syncs at checkpoints only; a crash can lose the last
+        # batches but never corrupts the database.
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    #! WRITING
+    def add(self, record: GameRecord) -> None:
+        """Queues one record for writing."""
+        self._check()
+        self._queue.put(record)
+
+    def add_many(self, records: Iterable[GameRecord]) -> None:
+        """Queues records for writing."""
+        for record in records:
+            self.add(record)
+
+    def flush(self) -> None:
+        """Waits until every record added so far is committed."""
+        self._check()
+        self._queue.join()
+        self._check()
+
+    def close(self) -> None:
+        """Writes the remaining records and stops the writer."""
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
+        self._check()
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _check(self) -> None:
+        if self._error is not None:
+            raise RuntimeError("The result store writer failed.") from self._error
+
+    def _write_loop(self) -> None:
+        conn = self._connect()
+        (last_id,) = conn.execute("SELECT COALESCE(MAX(id), 0) FROM games").fetchone()
+        self._next_id = last_id + 1
+        known_decks: set[str] = set()
+        stopping = False
+        try:
+            while not stopping:
+                record = self._queue.get()
+                if record is None:
+                    self._queue.task_done()
+                    break
+                batch = [record]
+                while len(batch) < self.batch_size:
+                    try:
+                        record = self._queue.get(timeout=self.flush_interval)
+                    except queue.Empty:
+                        break
+                    if record is None:
+                        stopping = True
+                        self._queue.task_done()
+                        break
+                    batch.append(record)
+                try:
+                    if self._error is None:
+                        self._write_batch(conn, batch, known_decks)
+                except BaseException as error:
+                    logger.exception(f"Failed to write {len(batch)} game results.")
+                    self._error = error
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+        finally:
+            conn.close()
+
+    def _write_batch(self, conn: sqlite3.Connection, batch: list[GameRecord], known_decks: set) -> None:
+        decks, games, stats = [], [], []
+        # Records of one matchup usually share their deck lists, so hash each list object
+        # once per batch (the batch keeps them alive, so their IDs stay unique).
+        digests: dict[int, str] = {}
+        for record in batch:
+            hashes = []
+            for deck in (record.player_deck, record.opponent_deck):
+                digest = digests.get(id(deck))
+                if digest is None:
+                    digest = digests[id(deck)] = deck_hash(deck)
+                hashes.append(digest)
+                if digest not in known_decks:
+                    known_decks.add(digest)
+                    decks.append((digest, json.dumps(list(deck))))
+            game_id = self._next_id
+            self._next_id += 1
+            games.append((game_id, *hashes, record.seed, record.winner, record.turns, *record.prizes_left))
+            if record.card_stats:
+                stats.extend(
+                    (game_id, side, title, *counts) for (side, title), counts in record.card_stats.items()
+                )
+        with conn:
+            conn.executemany("INSERT OR IGNORE INTO decks (hash, cards) VALUES (?, ?)", decks)
+            conn.executemany(
+                """INSERT INTO games (id, player_deck, opponent_deck, seed, winner, turns, player_prizes, opponent_prizes)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                games,
+            )
+            conn.executemany(
+                """INSERT INTO card_stats (game_id, side, title, attacks, damage, knocked_out)
+                VALUES (?, ?, ?, ?, ?, ?)""",
+                stats,
+            )
+        self.games_written += len(games)
+        self.batches_written += 1
+
+    #! QUERIES
+    def _read(self) -> sqlite3.Connection:
+        """The connection for queries and matchup saves, separate from the writer's."""
+        if self._reader is None:
+            self._reader = sqlite3.connect(self.db_path, check_same_thread=False)
+        return self._reader
+
+    def matchup(self, player_deck: Iterable[str], opponent_deck: Iterable[str]) -> MatchupSummary:
+        """Summarizes the stored games of `player_deck` (first player) against `opponent_deck`."""
+        row = self._read().execute(
+            """SELECT COUNT(*), COALESCE(SUM(winner = 1), 0), COALESCE(SUM(winner = 2), 0),
+                COALESCE(SUM(winner = 0), 0), COALESCE(AVG(turns), 0)
+            FROM games WHERE player_deck = ? AND opponent_deck = ?""",
+            (deck_hash(player_deck), deck_hash(opponent_deck)),
+        ).fetchone()
+        return MatchupSummary(*row)
+
+    def card_summary(self, title: str) -> dict:
+        """Totals a card's stats over every stored game: games appeared in, attacks, damage and knockouts."""
+        games, attacks, damage, knocked_out = self._read().execute(
+            """SELECT COUNT(DISTINCT game_id), COALESCE(SUM(attacks), 0), COALESCE(SUM(damage), 0),
+                COALESCE(SUM(knocked_out), 0)
+            FROM card_stats WHERE title = ?""",
+            (title,),
+        ).fetchone()
+        return {"games": games, "attacks": attacks, "damage": damage, "knocked_out": knocked_out}
+
+    def cached_matchups(self, keys: Iterable[str]) -> dict[str, MatchupSummary]:
+        """Returns the saved matchup summaries among `keys`, by key."""
+        found = {}
+        conn = self._read()
+        for key in keys:
+            row = conn.execute(
+                "SELECT games, wins, losses, draws, average_turns FROM matchups WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                found[key] = MatchupSummary(*row)
+        return found
+
+    def save_matchup(
+        self, key: str, player_deck: list, opponent_deck: list, rules_version: int, summary: MatchupSummary
+    ) -> None:
+        """
+        Saves a matchup summary under `key`, replacing any saved before. This commits
+        directly rather than through the writer; `flush()` first if the summary must not
+        be visible before the games it summarizes.
+        """
+        conn = self._read()
+        with conn:
+            for deck in (player_deck, opponent_deck):
+                conn.execute(
+                    "INSERT OR IGNORE INTO decks (hash, cards) VALUES (?, ?)",
+                    (deck_hash(deck), json.dumps(list(deck))),
+                )
+            conn.execute(
+                """INSERT OR REPLACE INTO matchups
+                (key, player_deck, opponent_deck, rules_version, games, wins, losses, draws, average_turns)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    key, deck_hash(player_deck), deck_hash(opponent_deck), rules_version, summary.games,
+                    summary.wins, summary.losses, summary.draws, summary.average_turns,
+                ),
+            )
+
+    def count(self) -> int:
+        """Returns the number of committed games."""
+        return self._read().execute("SELECT COUNT(*) FROM games").fetchone()[0]
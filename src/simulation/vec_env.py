@@ -0,0 +1,374 @@
+import multiprocessing
+import traceback
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from database.card_repository import CardRepository
+from simulation.env import ACTION_SPACE_SIZE, OBSERVATION_SHAPES, BlackstarEnv
+from simulation.headless import DEFAULT_MAX_TURNS
+
+# Byte alignment of each array within a batch buffer.
+_ALIGNMENT = 64
+
+
+def batch_specs(num_envs: int) -> list[tuple[str, tuple, np.dtype]]:
+    """
+    Describes every array a batch of `num_envs` environments reads and writes, as
+    `(name, shape, dtype)`: one observation array per `OBSERVATION_SHAPES` key, plus
+    `action_mask`, `action`, `reward`, `terminated` and `truncated`.
+    """
+    specs = [
+        (key, (num_envs,) + shape, np.dtype(np.float32))
+        for key, shape in OBSERVATION_SHAPES.items()
+    ]
+    specs += [
+        ("action_mask", (num_envs, ACTION_SPACE_SIZE), np.dtype(bool)),
+        ("action", (num_envs,), np.dtype(np.int64)),
+        ("reward", (num_envs,), np.dtype(np.float32)),
+        ("terminated", (num_envs,), np.dtype(bool)),
+        ("truncated", (num_envs,), np.dtype(bool)),
+    ]
+    return specs
+
+
+def _layout(specs) -> tuple[list[int], int]:
+    """Returns the aligned byte offset of each spec and the total size in bytes."""
+    offsets, size = [], 0
+    for _, shape, dtype in specs:
+        offsets.append(size)
+        nbytes = int(np.prod(shape)) * dtype.itemsize
+        size += -(-nbytes // _ALIGNMENT) * _ALIGNMENT
+    return offsets, size
+
+
+def batch_nbytes(num_envs: int) -> int:
+    """Returns the size in bytes of the buffer that holds a batch of `num_envs`."""
+    return _layout(batch_specs(num_envs))[1]
+
+
+def map_batch(buffer, num_envs: int) -> dict[str, np.ndarray]:
+    """
+    Lays the batch arrays over a single writable buffer (a `bytearray` or the `buf` of a
+    `SharedMemory` block) of at least `batch_nbytes(num_envs)` bytes.
+
+    Returns:
+        Array name -> NumPy array backed by `buffer`.
+    """
+    specs = batch_specs(num_envs)
+    offsets, _ = _layout(specs)
+    return {
+        name: np.ndarray(shape, dtype=dtype, buffer=buffer, offset=offset)
+        for (name, shape, dtype), offset in zip(specs, offsets)
+    }
+
+
+class SyncVectorEnv:
+    """
+    Steps K independent `BlackstarEnv` games in lockstep within one process.
+
+    Every environment writes straight into its row of the batch arrays, so `step()`
+    returns stacked observations, rewards, done flags and action masks without copying.
+    The returned arrays are overwritten by the next call; copy them to keep them.
+
+    Finished games reset automatically: the `reward`, `terminated` and `truncated` of
+    that step describe the finished episode, while its observation and action mask
+    already belong to the next one. Episode seeds are derived from the row, but shuffles
+    and coin flips still draw from the process-wide `random` module, so the games of one
+    process share its stream: a batch replays exactly only with the same row split.
+    """
+
+    def __init__(
+        self,
+        player_deck: list,
+        opponent_deck: list,
+        num_envs: int,
+        card_repo: CardRepository | None = None,
+        opponent_policy=None,
+        max_turns: int = DEFAULT_MAX_TURNS,
+        buffers: dict | None = None,
+        rows: range | None = None,
+    ) -> None:
+        """
+        Args:
+            player_deck: Card titles for each agent's deck.
+            opponent_deck: Card titles for each opponent's deck.
+            num_envs: The number of games in the batch.
+            card_repo: Optional repository to load cards from.
+            opponent_policy: The opponents' policy; see `BlackstarEnv`.
+            max_turns: The turn after which an episode is truncated.
+            buffers: Optional batch arrays from `map_batch()` to write into.
+            rows: The rows of the batch this instance drives. Defaults to all of them.
+        """
+        self.num_envs = num_envs
+        self.buffers = buffers if buffers is not None else map_batch(
+            bytearray(batch_nbytes(num_envs)), num_envs
+        )
+        self.rows = rows if rows is not None else range(num_envs)
+        # Only a repository opened here is closed by `close()`.
+        self._owns_repo = card_repo is None
+        card_repo = card_repo or CardRepository()
+
+        observation_keys = list(OBSERVATION_SHAPES)
+        # All games of the batch share one set of card templates.
+        template_cache = {}
+        self.envs = [
+            BlackstarEnv(
+                player_deck,
+                opponent_deck,
+                card_repo=card_repo,
+                opponent_policy=opponent_policy,
+                max_turns=max_turns,
+                observation={key: self.buffers[key][row] for key in observation_keys},
+                action_mask=self.buffers["action_mask"][row],
+                template_cache=template_cache,
+            )
+            for row in self.rows
+        ]
+        self._next_seeds: list[int | None] = [None] * len(self.envs)
+
+    @property
+    def observation(self) -> dict[str, np.ndarray]:
+        """The stacked observation arrays."""
+        return {key: self.buffers[key] for key in OBSERVATION_SHAPES}
+
+    def reset(self, seed: int | None = None) -> tuple[dict, dict]:
+        """
+        Resets every game. Row `i` is seeded with `seed + i`, and each of its later
+        episodes with `num_envs` more than the one before.
+
+        Returns:
+            `(observations, info)`, where `info["action_mask"]` holds the stacked masks.
+        """
+        self._reset_rows(seed)
+        return self.observation, {"action_mask": self.buffers["action_mask"]}
+
+    def step(self, actions) -> tuple[dict, np.ndarray, np.ndarray, np.ndarray, dict]:
+        """
+        Plays one action in every game.
+
+        Args:
+            actions: One action index per game.
+
+        Returns:
+            `(observations, rewards, terminated, truncated, info)`.
+        """
+        self.buffers["action"][:] = actions
+        self._step_rows()
+        buffers = self.buffers
+        return (
+            self.observation,
+            buffers["reward"],
+            buffers["terminated"],
+            buffers["truncated"],
+            {"action_mask": buffers["action_mask"]},
+        )
+
+    def close(self) -> None:
+        """Releases the card database connection, if this instance opened it."""
+        if self.envs and self._owns_repo:
+            self.envs[0].card_repo.conn.close()
+        self.envs = []
+
+    def _reset_rows(self, seed: int | None) -> None:
+        """Resets the games of this instance's rows."""
+        for i, (row, env) in enumerate(zip(self.rows, self.envs)):
+            row_seed = None if seed is None else seed + row
+            env.reset(seed=row_seed)
+            self._next_seeds[i] = None if row_seed is None else row_seed + self.num_envs
+
+    def _step_rows(self) -> None:
+        """Steps the games of this instance's rows with the actions in the batch buffer."""
+        buffers = self.buffers
+        actions, rewards = buffers["action"], buffers["reward"]
+        terminated, truncated = buffers["terminated"], buffers["truncated"]
+        for i, (row, env) in enumerate(zip(self.rows, self.envs)):
+            _, reward, done, cut_short, _ = env.step(actions[row])
+            rewards[row] = reward
+            terminated[row] = done
+            truncated[row] = cut_short
+            if done or cut_short:
+                env.reset(seed=self._next_seeds[i])
+                if self._next_seeds[i] is not None:
+                    self._next_seeds[i] += self.num_envs
+
+
+def _worker(conn, shm_name: str, num_envs: int, rows: range, env_kwargs: dict) -> None:
+    """
+    Runs a `SyncVectorEnv` over some rows of a shared batch, driven by `SubprocVectorEnv`.
+    Each message is a `(command, argument)` pair; every command is answered with
+    `None`, or with an error string if it failed.
+    """
+    shm = SharedMemory(name=shm_name)
+    env_kwargs = dict(env_kwargs)
+    card_repo = vec_env = None
+    try:
+        # The worker opens the repository, so it closes it too.
+        card_repo = CardRepository(env_kwargs.pop("db_path"))
+        vec_env = SyncVectorEnv(
+            num_envs=num_envs,
+            card_repo=card_repo,
+            buffers=map_batch(shm.buf, num_envs),
+            rows=rows,
+            **env_kwargs,
+        )
+        conn.send(None)
+        while True:
+            command, argument = conn.recv()
+            if command == "close":
+                break
+            try:
+                if command == "reset":
+                    vec_env._reset_rows(argument)
+                elif command == "step":
+                    vec_env._step_rows()
+                conn.send(None)
+            except Exception:
+                conn.send(traceback.format_exc())
+    except Exception:
+        conn.send(traceback.format_exc())
+    finally:
+        if vec_env is not None:
+            vec_env.close()
+            # The arrays view the shared block; drop them before detaching from it.
+            vec_env.buffers = None
+        del vec_env
+        if card_repo is not None:
+            card_repo.conn.close()
+        shm.close()
+        conn.close()
+
+
+class SubprocVectorEnv:
+    """
+    A batch of K games split across worker processes that share one memory block.
+
+    The batch arrays (see `batch_specs`) live in a `SharedMemory` block mapped by the
+    parent and every worker. A step writes the actions into the block, wakes all
+    workers, and waits for them to write their rows in place. Observations never travel
+    through pipes. Rows are seeded as in `SyncVectorEnv`.
+
+    Use as a context manager, or call `close()`, to stop the workers and free the block.
+    """
+
+    def __init__(
+        self,
+        player_deck: list,
+        opponent_deck: list,
+        num_envs: int,
+        num_workers: int | None = None,
+        db_path: str | None = None,
+        opponent_policy=None,
+        max_turns: int = DEFAULT_MAX_TURNS,
+        start_method: str | None = None,
+    ) -> None:
+        """
+        Args:
+            player_deck: Card titles for each agent's deck.
+            opponent_deck: Card titles for each opponent's deck.
+            num_envs: The number of games in the batch.
+            num_workers: Worker processes to spread the games over. Defaults to the CPU count.
+            db_path: Optional path to the card database each worker opens.
+            opponent_policy: The opponents' policy; must be picklable under `spawn`.
+            max_turns: The turn after which an episode is truncated.
+            start_method: The multiprocessing start method. Defaults to the platform's.
+        """
+        self.num_envs = num_envs
+        num_workers = max(1, min(num_workers or multiprocessing.cpu_count(), num_envs))
+        self._shm = SharedMemory(create=True, size=batch_nbytes(num_envs))
+        self.buffers = map_batch(self._shm.buf, num_envs)
+        self._connections = []
+        self._processes = []
+
+        env_kwargs = {
+            "player_deck": player_deck,
+            "opponent_deck": opponent_deck,
+            "db_path": db_path,
+            "opponent_policy": opponent_policy,
+            "max_turns": max_turns,
+        }
+        context = multiprocessing.get_context(start_method)
+        bounds = np.linspace(0, num_envs, num_workers + 1).astype(int)
+        try:
+            for start, stop in zip(bounds[:-1], bounds[1:]):
+                parent_conn, child_conn = context.Pipe()
+                process = context.Process(
+                    target=_worker,
+                    args=(child_conn, self._shm.name, num_envs, range(start, stop), env_kwargs),
+                    daemon=True,
+                )
+                process.start()
+                child_conn.close()
+                self._connections.append(parent_conn)
+                self._processes.append(process)
+            self._gather()
+        except BaseException:
+            # Nobody can call `close()` on an environment that failed to start.
+            self.close()
+            raise
+
+    @property
+    def observation(self) -> dict[str, np.ndarray]:
+        """The stacked observation arrays."""
+        return {key: self.buffers[key] for key in OBSERVATION_SHAPES}
+
+    def reset(self, seed: int | None = None) -> tuple[dict, dict]:
+        """Resets every game; see `SyncVectorEnv.reset`."""
+        self._broadcast("reset", seed)
+        return self.observation, {"action_mask": self.buffers["action_mask"]}
+
+    def step(self, actions) -> tuple[dict, np.ndarray, np.ndarray, np.ndarray, dict]:
+        """Plays one action in every game; see `SyncVectorEnv.step`."""
+        self.buffers["action"][:] = actions
+        self._broadcast("step", None)
+        buffers = self.buffers
+        return (
+            self.observation,
+            buffers["reward"],
+            buffers["terminated"],
+            buffers["truncated"],
+            {"action_mask": buffers["action_mask"]},
+        )
+
+    def close(self) -> None:
+        """Stops the workers and frees the shared memory block."""
+        if self._shm is None:
+            return
+        for conn in self._connections:
+            try:
+                conn.send(("close", None))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        for conn in self._connections:
+            conn.close()
+        self.buffers = None
+        try:
+            self._shm.close()
+        except BufferError:
+            # Arrays returned to the caller still view the block; it is unmapped once
+            # they are garbage collected.
+            pass
+        self._shm.unlink()
+        self._shm = None
+
+    def __enter__(self) -> "SubprocVectorEnv":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _broadcast(self, command: str, argument) -> None:
+        """Sends a command to every worker and waits for all of them to finish it."""
+        for conn in self._connections:
+            conn.send((command, argument))
+        self._gather()
+
+    def _gather(self) -> None:
+        """Waits for one reply per worker, raising if any worker reported an error."""
+        errors = [error for error in (conn.recv() for conn in self._connections) if error]
+        if errors:
+            raise RuntimeError(f"Vector environment worker failed:\n{errors[0]}")
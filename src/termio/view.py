@@ -3,6 +3,16 @@ from core.enums import StageType
 from enum import Enum
 import colorful as cf
 import os
+import re
+import signal
+import sys
+
+# Matches the SGR and cursor escapes colorful and the renderer emit, for measuring width.
+ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;?]*[A-Za-z]")
+# Cached fragments are dropped wholesale past this many; a game never comes close.
+FRAGMENT_CACHE_SIZE = 4096
+# Used when the output is not a terminal or its size cannot be read.
+FALLBACK_TERMINAL_SIZE = os.terminal_size((80, 24))
 
 
 class ManaColor(Enum):
@@ -22,8 +32,47 @@ class ManaColor(Enum):
 class TerminalView:
     """
     Handles rendering game state to the terminal.
+
+    On an interactive terminal the board is drawn as a fixed frame at the top of the
+    screen, and prompts and log output scroll in the region below it. Each redraw
+    composes the whole frame as a list of lines, compares it with the frame on screen
+    and rewrites only the lines that changed, all in a single write; nothing is cleared
+    between frames, so the board does not flicker. Formatted fragments (a benched
+    monster, an active monster with its attacks, a hand card) are cached under the state
+    they are drawn from, so an unchanged card is not formatted again.
+
+    When the output is not a terminal (a pipe or a log file), every frame is written
+    out in full, as one write.
     """
 
+    def __init__(self, stream=None) -> None:
+        """
+        Args:
+            stream: The text stream to render to. Defaults to `sys.stdout`.
+        """
+        self.stream = stream or sys.stdout
+        try:
+            is_terminal = self.stream.isatty()
+        except (AttributeError, ValueError):
+            is_terminal = False
+        self.interactive = is_terminal and os.environ.get("TERM") != "dumb"
+        self._fragments: dict[tuple, object] = {}
+        self._terminal_size_cache: os.terminal_size | None = None
+        # The lines on screen and the screen row each starts at; None forces a full repaint.
+        self._frame: list[str] | None = None
+        self._frame_rows: list[int] = []
+        self._frame_height = 0
+        self._watching_resize = False
+        self._previous_winch_handler = None
+        if self.interactive and hasattr(signal, "SIGWINCH"):
+            try:
+                self._previous_winch_handler = signal.signal(signal.SIGWINCH, self._on_resize)
+                self._watching_resize = True
+            except ValueError:
+                # Signal handlers can only be installed from the main thread; without one
+                # the size is read once per frame instead.
+                pass
+
     def _format_legal_actions(self, legal_actions: list) -> str:
         """
         Formats the list of legal actions into a human-readable string.
@@ -37,11 +86,11 @@ class TerminalView:
 
         for action in legal_actions:
             # We only care about the type of action, not the specific targets.
-            action_type = action["type"].lower()
+            action_type = action.type.name.lower()
             summarized_actions.add(action_type)
 
-        # Sort for consistent ordering and add the universal exit command
-        sorted_actions = sorted(list(summarized_actions)) + ['exit']
+        # Sort for consistent ordering and add the universal undo and exit commands
+        sorted_actions = sorted(list(summarized_actions)) + ['undo', 'exit']
         return " | ".join(sorted_actions)
 
     @staticmethod
@@ -94,44 +143,53 @@ class TerminalView:
         if not player.bench:
             return "\t(Bench is empty)"
 
-        # First, create the string for each individual monster
-        monster_strings = []
-        for monster in player.bench.values():
-            padded_id = f"{monster.id:03d}"
-            title = f"{monster.title:<12}"
-            health = f"{monster.health:3d}/{monster.card.health:3d}"
-            
-            status_string = ""
-            if monster.special_conditions:
-                status_string = f" {cf.bold_red}({','.join(monster.special_conditions.keys())}){cf.reset}"
+        monster_strings = [
+            TerminalView.format_bench_monster(monster) for monster in player.bench.values()
+        ]
+        return "\n".join(TerminalView._group_bench(monster_strings))
 
-            mana_pool = TerminalView.get_mana_pool_string(monster)
+    @staticmethod
+    def format_bench_monster(monster) -> str:
+        """Returns the one-line summary of a benched monster."""
+        padded_id = f"{monster.id:03d}"
+        title = f"{monster.title:<12}"
+        health = f"{monster.health:3d}/{monster.card.health:3d}"
 
-            monster_str = f"[{cf.darkSlateGray}{padded_id}{cf.reset}] {ManaColor[monster.card.mana_type.name].value}{title}{cf.reset} HP:{health}{status_string} {mana_pool}"
-            monster_strings.append(monster_str)
+        status_string = ""
+        if monster.special_conditions:
+            status_string = f" {cf.bold_red}({','.join(monster.special_conditions.keys())}){cf.reset}"
+
+        mana_pool = TerminalView.get_mana_pool_string(monster)
+
+        return f"[{cf.darkSlateGray}{padded_id}{cf.reset}] {ManaColor[monster.card.mana_type.name].value}{title}{cf.reset} HP:{health}{status_string} {mana_pool}"
 
-        # Now, group these strings into lines, with up to 3 monsters per line.
+    @staticmethod
+    def _group_bench(monster_strings: list[str]) -> list[str]:
+        """Groups benched monster summaries into lines, with up to 3 monsters per line."""
         lines = []
         for i in range(0, len(monster_strings), 3):
             # Get a chunk of up to 3 monster strings
             line_chunk = monster_strings[i : i + 3]
             # Join them with a tab separator and add indentation
             lines.append("\t  " + " \t ".join(line_chunk))
-
-        return "\n".join(lines)
+        return lines
 
     @staticmethod
     def print_active_monster(player, Bold=False) -> str:
         if not player.active_monster:
             return "\t(No active monster)"
+        return TerminalView.format_active_monster(player.active_monster, Bold)
 
+    @staticmethod
+    def format_active_monster(active_monster, Bold=False) -> str:
+        """Returns the summary line of an active monster followed by its attack list."""
         # The player's active monster type, always two characters.
         active_mon_mana_type = (
-            player.active_monster.card.mana_type.value[:1].upper()
-            + player.active_monster.card.mana_type.value[1:2].lower()
+            active_monster.card.mana_type.value[:1].upper()
+            + active_monster.card.mana_type.value[1:2].lower()
         )
         # The player's active monster stage, always one character.
-        match player.active_monster.card.stage:
+        match active_monster.card.stage:
             case StageType.BASIC:
                 active_mon_stage = "B"
             case StageType.STAGEONE:
@@ -139,30 +197,30 @@ class TerminalView:
             case StageType.STAGETWO:
                 active_mon_stage = "2"
         # The player's active monster id, padded for space.
-        padded_id = f"{player.active_monster.id:03d}"
+        padded_id = f"{active_monster.id:03d}"
         # The player's active monster title, padded for space.
-        active_mon_title = f"{player.active_monster.card.title:<12}"
+        active_mon_title = f"{active_monster.card.title:<12}"
         # The player's active monster health and max health.
-        active_mon_health = f"{player.active_monster.health:3d}"
-        active_mon_max_health = f"{player.active_monster.card.health:3d}"
+        active_mon_health = f"{active_monster.health:3d}"
+        active_mon_max_health = f"{active_monster.card.health:3d}"
         
         status_string = ""
-        if player.active_monster.special_conditions:
-            statuses = list(player.active_monster.special_conditions.keys())
+        if active_monster.special_conditions:
+            statuses = list(active_monster.special_conditions.keys())
             status_string = f" {cf.bold_red}({','.join(statuses)}){cf.reset}"
 
         parts = [
             "\t",
-            f"{ManaColor[player.active_monster.card.mana_type.name].value}{active_mon_mana_type}{cf.reset}",
+            f"{ManaColor[active_monster.card.mana_type.name].value}{active_mon_mana_type}{cf.reset}",
             f"{active_mon_stage} [{cf.darkSlateGray}{padded_id}{cf.reset}]",
-            f"{ManaColor[player.active_monster.card.mana_type.name].value}{cf.bold if Bold else ''}{active_mon_title}{cf.reset}",
+            f"{ManaColor[active_monster.card.mana_type.name].value}{cf.bold if Bold else ''}{active_mon_title}{cf.reset}",
             f"{active_mon_health}/{active_mon_max_health}{status_string}",
-            f"{TerminalView.get_mana_pool_string(player.active_monster)}",
+            f"{TerminalView.get_mana_pool_string(active_monster)}",
         ]
         main_line = " ".join(parts)
 
         # Get the attack list string and append it
-        attack_list = TerminalView.get_attack_list_string(player.active_monster)
+        attack_list = TerminalView.get_attack_list_string(active_monster)
 
         if attack_list:
             return f"{main_line}\n{attack_list}"
@@ -170,35 +228,48 @@ class TerminalView:
             return main_line
 
     @staticmethod
-    def print_hand(player) -> str:
+    def print_hand(player, max_width: int | None = None) -> str:
         if not player.hand:
             return "Your hand is empty."
 
-        try:
-            max_width = os.get_terminal_size().columns
-        except OSError:
-            max_width = (
-                80  # Fallback for environments where terminal size can't be determined
-            )
+        if max_width is None:
+            try:
+                max_width = os.get_terminal_size().columns
+            except OSError:
+                max_width = (
+                    80  # Fallback for environments where terminal size can't be determined
+                )
+
+        fragments = [
+            TerminalView.format_hand_card(card_id, hand_card)
+            for card_id, hand_card in player.hand.items()
+        ]
+        return "\n".join(TerminalView._wrap_hand(fragments, max_width))
+
+    @staticmethod
+    def format_hand_card(card_id, hand_card) -> tuple[str, str]:
+        """Returns a hand card's label, as its visible text and its colored text."""
+        # Default color is white for utility cards or other types.
+        color = cf.white
+        # If the card has a mana_type attribute (like Monsters and Mana cards), use it to set the color.
+        # This uses getattr() to safely check for the attribute without causing an error if it's missing.
+        mana_type_attr = getattr(hand_card.card, 'mana_type', None)
+        if mana_type_attr:
+            color = ManaColor[mana_type_attr.name].value
+
+        # Format the card string
+        card_str_visible = f"[{card_id}] {hand_card.card.title}"
+        return card_str_visible, f"{color}{card_str_visible}{cf.reset}"
 
+    @staticmethod
+    def _wrap_hand(fragments: list[tuple[str, str]], max_width: int) -> list[str]:
+        """Packs hand card labels into lines of at most `max_width` visible characters."""
         lines = []
         current_line = []
         current_length = 0
         separator = " | "
 
-        for card_id, hand_card in player.hand.items():
-            # Default color is white for utility cards or other types.
-            color = cf.white
-            # If the card has a mana_type attribute (like Monsters and Mana cards), use it to set the color.
-            # This uses getattr() to safely check for the attribute without causing an error if it's missing.
-            mana_type_attr = getattr(hand_card.card, 'mana_type', None)
-            if mana_type_attr:
-                color = ManaColor[mana_type_attr.name].value
-
-            # Format the card string
-            card_str_visible = f"[{card_id}] {hand_card.card.title}"
-            card_str_formatted = f"{color}{card_str_visible}{cf.reset}"
-
+        for card_str_visible, card_str_formatted in fragments:
             # Check if adding the new card exceeds the line width
             if (
                 current_line
@@ -216,7 +287,7 @@ class TerminalView:
         if current_line:
             lines.append(separator.join(current_line))
 
-        return "\n".join(lines)
+        return lines
 
     @staticmethod
     def get_attack_list_string(monster) -> str:
@@ -228,6 +299,7 @@ class TerminalView:
             return ""
 
         attack_strings = []
+        affordable_mask = monster.get_affordable_mask()
         for i, attack in enumerate(monster.card.attacks):
             # Format the mana cost for this specific attack
             cost_parts = [
@@ -238,7 +310,7 @@ class TerminalView:
             cost_string = " ".join(cost_parts) if cost_parts else ""
 
             # Check if the monster can afford this attack to adjust the color
-            can_afford = monster.has_mana(attack.cost)
+            can_afford = affordable_mask >> i & 1
             attack_title_color = cf.bold if can_afford else cf.darkGray
 
             attack_strings.append(
@@ -294,18 +366,173 @@ class TerminalView:
                 print("Invalid input. Please enter a number.")
 
     def redraw_screen(self, game_state) -> None:
-        # os.system("cls" if os.name == "nt" else "clear")
+        """Draws the board for `game_state`, rewriting only what changed since the last frame."""
+        frame = self.compose_frame(game_state)
+        if not self.interactive:
+            self.stream.write("\n" + "\n".join(frame) + "\n")
+            self.stream.flush()
+            return
+        output = self._diff_frame(frame)
+        if output:
+            self.stream.write(output)
+            self.stream.flush()
+
+    def compose_frame(self, game_state) -> list[str]:
+        """Returns the board for `game_state` as a list of screen lines."""
+        columns = self._terminal_size().columns
+        waiting, active = game_state.waiting_player, game_state.active_player
+
+        title = f"== {cf.bold} Turn [{game_state.turn_count}] {cf.reset} "
+        rule = "=" * max(2, columns - len(ANSI_ESCAPE.sub("", title)))
+        frame = [title + rule, self._player_data(waiting, opposite=True)]
+        frame += self._bench_lines(waiting)
+        frame += self._active_lines(waiting, Bold=False)
+        frame += self._active_lines(active, Bold=True)
+        frame += self._bench_lines(active)
+        frame.append(self._player_data(active, opposite=False))
+        frame += self._hand_lines(active, columns)
+        return frame
+
+    def invalidate(self) -> None:
+        """Forgets the frame on screen, so the next redraw repaints the board in full."""
+        self._frame = None
+
+    def close(self) -> None:
+        """Gives the whole screen back to scrolling output and restores the resize handler."""
+        if self.interactive and self._frame is not None:
+            self.stream.write(f"\x1b[r\x1b[{self._terminal_size().lines};1H\n")
+            self.stream.flush()
+        self._frame = None
+        if self._watching_resize:
+            signal.signal(signal.SIGWINCH, self._previous_winch_handler or signal.SIG_DFL)
+            self._watching_resize = False
+
+    #! FRAME COMPOSITION
+
+    def _fragment(self, key: tuple, build, *args):
+        """Returns the fragment cached under `key`, building it with `build(*args)` if needed."""
+        fragment = self._fragments.get(key)
+        if fragment is None:
+            if len(self._fragments) >= FRAGMENT_CACHE_SIZE:
+                self._fragments.clear()
+            fragment = self._fragments[key] = build(*args)
+        return fragment
+
+    def _player_data(self, player, opposite: bool) -> str:
+        key = (
+            "player", player.title, len(player.deck), len(player.hand),
+            len(player.discard), len(player.prize), opposite,
+        )
+        return self._fragment(key, TerminalView.print_player_data, player, opposite)
+
+    def _bench_lines(self, player) -> list[str]:
+        if not player.bench:
+            return ["\t(Bench is empty)"]
+        monster_strings = [
+            self._fragment(
+                ("bench",) + self._monster_key(monster),
+                TerminalView.format_bench_monster,
+                monster,
+            )
+            for monster in player.bench.values()
+        ]
+        return TerminalView._group_bench(monster_strings)
 
-        print(
-            f"\n== {cf.bold} Turn [{game_state.turn_count}] {cf.reset} ======================================================================"
+    def _active_lines(self, player, Bold: bool) -> list[str]:
+        monster = player.active_monster
+        if not monster:
+            return ["\t(No active monster)"]
+        key = ("active", Bold, monster.get_affordable_mask()) + self._monster_key(monster)
+        return self._fragment(key, TerminalView.format_active_monster, monster, Bold).split("\n")
+
+    def _hand_lines(self, player, columns: int) -> list[str]:
+        if not player.hand:
+            return ["Your hand is empty."]
+        fragments = [
+            self._fragment(("hand", card_id, hand_card.card), TerminalView.format_hand_card, card_id, hand_card)
+            for card_id, hand_card in player.hand.items()
+        ]
+        return TerminalView._wrap_hand(fragments, columns)
+
+    @staticmethod
+    def _monster_key(monster) -> tuple:
+        """The state a monster's summary is drawn from; the template covers title, type and attacks."""
+        return (
+            monster.id,
+            monster.card,
+            monster.health,
+            tuple(monster.special_conditions),
+            tuple(monster.total_mana.items()),
         )
-        print(TerminalView.print_player_data(game_state.waiting_player, opposite=True))
-        print(TerminalView.print_bench(game_state.waiting_player))
-        print(TerminalView.print_active_monster(game_state.waiting_player))
-        print(TerminalView.print_active_monster(game_state.active_player, Bold=True))
-        print(TerminalView.print_bench(game_state.active_player))
-        print(TerminalView.print_player_data(game_state.active_player))
-        print(TerminalView.print_hand(game_state.active_player))
+
+    #! SCREEN OUTPUT
+
+    def _terminal_size(self) -> os.terminal_size:
+        """Returns the terminal size, read once and kept until the terminal is resized."""
+        size = self._terminal_size_cache
+        if size is None:
+            try:
+                size = os.get_terminal_size(self.stream.fileno())
+            except (AttributeError, OSError, ValueError):
+                size = FALLBACK_TERMINAL_SIZE
+            # Without SIGWINCH there is no resize notification, so read it every frame.
+            if self._watching_resize:
+                self._terminal_size_cache = size
+        return size
+
+    def _on_resize(self, signum, frame) -> None:
+        self._terminal_size_cache = None
+        self._frame = None
+        if callable(self._previous_winch_handler):
+            self._previous_winch_handler(signum, frame)
+
+    def _diff_frame(self, frame: list[str]) -> str:
+        """
+        Returns the escape sequence that turns the frame on screen into `frame`. Lines are
+        addressed by screen row, so a line wider than the terminal counts for every row it
+        wraps onto; a line is rewritten when its text or its row has changed.
+        """
+        columns, lines = self._terminal_size()
+        rows, height = [], 0
+        for line in frame:
+            rows.append(height + 1)
+            width = len(ANSI_ESCAPE.sub("", line).expandtabs())
+            height += max(1, -(-width // columns))
+
+        if height >= lines:
+            # No room for a scrolling region below the board: print it like a plain stream.
+            self._frame = None
+            return "\x1b[r\n" + "\n".join(frame) + "\n"
+
+        parts = []
+        previous, previous_rows = self._frame, self._frame_rows
+        repaint = previous is None or height != self._frame_height
+        if previous is None:
+            parts.append("\x1b[r\x1b[2J")
+        elif not repaint:
+            # Save the cursor, so that the prompt and output below the board stay put.
+            parts.append("\x1b7")
+        for index, line in enumerate(frame):
+            if (
+                repaint
+                or index >= len(previous)
+                or line != previous[index]
+                or rows[index] != previous_rows[index]
+            ):
+                parts.append(f"\x1b[{rows[index]};1H{line}\x1b[K")
+        if repaint:
+            # Blank the rows a taller previous board used, then let everything below the
+            # board scroll on its own and put the cursor at the bottom of that region.
+            for row in range(height + 1, self._frame_height + 1):
+                parts.append(f"\x1b[{row};1H\x1b[K")
+            parts.append(f"\x1b[{height + 1};{lines}r\x1b[{lines};1H")
+        elif len(parts) == 1:
+            parts.clear()
+        else:
+            parts.append("\x1b8")
+
+        self._frame, self._frame_rows, self._frame_height = frame, rows, height
+        return "".join(parts)
 
     def get_command(self, game_state):
         """
@@ -0,0 +1,111 @@
+import os
+import random
+import sys
+
+import pytest
+
+# The engine is imported as top-level packages from `src`, as `main.py` does.
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+# The fixture card database is shared with the benchmark suite.
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "benchmarks"))
+# The command-line tools under test, e.g. `card_import`.
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+from fixtures import build_fixture_db  # noqa: E402
+
+from core.card_factory import CardFactory  # noqa: E402
+from core.carddata import BS_FIRE_ENERGY_98  # noqa: E402
+from core.enums import ManaType  # noqa: E402
+from core.game import GameState  # noqa: E402
+from database.card_repository import CardRepository  # noqa: E402
+from models.mana import ManaCard, ManaTemplate  # noqa: E402
+from models.monster import MonsterCard  # noqa: E402
+from models.player import PlayerUnit  # noqa: E402
+from simulation.headless import prepare_player  # noqa: E402
+
+
+#! SHARED TEMPLATES
+# Templates built in code, for tests that need no card database.
+def monster_template(title, stage, health, attacks, mana_type="FIRE", evolve_from=None, retreat_val=1):
+    """
+    Builds a monster template. `attacks` holds
+    `(title, damage, cost)` tuples, or `(title, damage, cost, effects)` for attacks
+    with effects.
+    """
+    return CardFactory.create_monster_template(
+        type="MONSTER", title=title, stage=stage, health=health, retreat_val=retreat_val,
+        mana_type=mana_type, evolve_from=evolve_from,
+        attacks=[
+            {"title": name, "damage": damage, "cost": cost, "description": "", "effects": (effects or [[]])[0]}
+            for name, damage, cost, *effects in attacks
+        ],
+    )
+
+
+CHARMANDER = monster_template("Charmander", "BASIC", 50, [
+    ("Scratch", "10", {}), ("Ember", "30", {ManaType.FIRE: 1, ManaType.COLORLESS: 1}),
+])
+CHARMELEON = monster_template("Charmeleon", "STAGEONE", 80, [("Slash", "30", {})], evolve_from="Charmander")
+FIRE_ENERGY = ManaTemplate(**BS_FIRE_ENERGY_98)
+PIKACHU = monster_template("Pikachu", "BASIC", 40, [("Gnaw", "10", {})], mana_type="LIGHTNING")
+
+
+#! GAME BUILDERS
+def build_fire_game(seed: int) -> GameState:
+    """
+    A game on its first turn between two shuffled decks of 14 Charmander, 6 Charmeleon
+    and 10 Fire Energy, seeded through the global RNG.
+    """
+    random.seed(seed)
+    players = []
+    for title in ("Player", "Opponent"):
+        player = PlayerUnit(title)
+        for template in [CHARMANDER] * 14 + [CHARMELEON] * 6:
+            player.add_to_field(MonsterCard(template))
+        for _ in range(10):
+            player.add_to_field(ManaCard(FIRE_ENERGY))
+        prepare_player(player)
+        players.append(player)
+    game_state = GameState(*players)
+    game_state._start_new_turn_for_player()
+    return game_state
+
+
+def build_pikachu_game(seed=None) -> GameState:
+    """Two players with three Pikachu in hand each (IDs 0-2 and 3-5) and empty decks."""
+    player, opponent = PlayerUnit("Player"), PlayerUnit("Opponent")
+    for owner in (player, opponent):
+        for _ in range(3):
+            card = MonsterCard(PIKACHU)
+            owner.hand[card.id] = card
+    return GameState(player, opponent)
+
+
+def build_evolution_game(seed=None) -> GameState:
+    """
+    Two players who each hold two Charmander, two Charmeleon and a Fire Energy (IDs 0-4
+    and 5-9) and have empty decks. An evolution creates a new card, numbered from 10.
+    """
+    players = []
+    for title in ("Player", "Opponent"):
+        player = PlayerUnit(title)
+        for card in (
+            MonsterCard(CHARMANDER), MonsterCard(CHARMANDER),
+            MonsterCard(CHARMELEON), MonsterCard(CHARMELEON), ManaCard(FIRE_ENERGY),
+        ):
+            player.hand[card.id] = card
+        players.append(player)
+    return GameState(*players)
+
+
+#! FIXTURES
+@pytest.fixture(scope="session")
+def fixture_db_path(tmp_path_factory) -> str:
+    """The path of the benchmark fixture database, built once per test run."""
+    return build_fixture_db(str(tmp_path_factory.mktemp("db") / "cards.db"))
+
+
+@pytest.fixture(scope="session")
+def card_repo(fixture_db_path) -> CardRepository:
+    """A repository over the fixture database."""
+    return CardRepository(fixture_db_path)
@@ -0,0 +1,43 @@
+"""
+Actions and commands: every action type builds its command and is recovered from it,
+so `Action.from_command(command) in legal_actions` is a sound legality check.
+"""
+import pytest
+
+from controller.command_parser import CommandParser
+from core.actions import ACTION_COMMANDS, Action
+from core.enums import ActionType
+
+# An example action of each type, with the command string a player would type for it.
+EXAMPLES = {
+    ActionType.PASS: (Action(ActionType.PASS), "pass"),
+    ActionType.ATTACK: (Action(ActionType.ATTACK, 1), "attack 1"),
+    ActionType.ACTIVATE: (Action(ActionType.ACTIVATE, 4), "activate 4"),
+    ActionType.ATTACH: (Action(ActionType.ATTACH, 7, 2), "attach 7 2"),
+    ActionType.BENCH: (Action(ActionType.BENCH, 5), "bench 5"),
+    ActionType.EVOLVE: (Action(ActionType.EVOLVE, 12, 3), "evolve 12 3"),
+    ActionType.RETREAT: (Action(ActionType.RETREAT, 9), "retreat 9"),
+    ActionType.USE: (Action(ActionType.USE, 6), "use 6"),
+}
+
+
+def test_every_action_type_has_an_example():
+    assert set(EXAMPLES) == set(ActionType) == set(ACTION_COMMANDS)
+
+
+@pytest.mark.parametrize("action_type", list(ActionType), ids=lambda action_type: action_type.name)
+def test_actions_round_trip_through_commands(action_type):
+    action, command_string = EXAMPLES[action_type]
+    command = action.to_command()
+    assert type(command) is ACTION_COMMANDS[action_type][0]
+    assert Action.from_command(command) == action
+    # A typed command describes the same action.
+    assert Action.from_command(CommandParser().parse(command_string)) == action
+    assert len(action.args) == len(ACTION_COMMANDS[action_type][1])
+
+
+@pytest.mark.parametrize("command_string", ["inspect 3", "mana fire 2", "mana 4 water 1"])
+def test_meta_commands_are_not_actions(command_string):
+    command = CommandParser().parse(command_string)
+    assert command is not None
+    assert Action.from_command(command) is None
@@ -0,0 +1,133 @@
+"""
+The bulk card importer: located validation errors, all-or-nothing loads that restore
+the connection's pragmas, and imported cards that load back through the repository.
+"""
+import json
+import sqlite3
+
+import pytest
+
+import card_import
+from core.card_factory import CardFactory
+from database.card_repository import CardRepository
+from tests.conftest import build_fixture_db
+
+SQUIRTLE = {
+    "title": "Squirtle", "card_type": "MONSTER", "set_code": "TS", "stage": "BASIC", "health": 40,
+    "retreat_cost": 1, "types": ["WATER"], "weaknesses": [{"mana_type": "LIGHTNING", "modifier": "x2"}],
+    "attacks": [
+        {"title": "Bubble", "damage": "10", "costs": {"WATER": 1}, "effects": [{
+            "effect_name": "APPLY_STATUS", "target": "DEFENDING_MONSTER", "value": "PARALYZED",
+            "condition": "ON_COIN_FLIP_HEADS",
+        }]},
+        {"title": "Withdraw", "costs": {"WATER": 1, "COLORLESS": 1}},
+    ],
+}
+WARTORTLE = {
+    "title": "Wartortle", "card_type": "MONSTER", "set_code": "TS", "stage": "STAGEONE", "health": 70,
+    "types": ["WATER"], "evolves_from": ["Squirtle"], "attacks": [{"title": "Bite", "damage": "40"}],
+}
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = sqlite3.connect(build_fixture_db(str(tmp_path / "cards.db")))
+    yield conn
+    conn.close()
+
+
+def write_jsonl(path, records) -> str:
+    with open(path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write((record if isinstance(record, str) else json.dumps(record)) + "\n")
+    return str(path)
+
+
+def load(conn, path, batch_size=card_import.DEFAULT_BATCH_SIZE):
+    errors = []
+    counts = card_import.import_cards(conn, card_import.validate_file(path, conn.cursor(), errors), errors, batch_size)
+    return counts, errors
+
+
+def card_count(conn) -> int:
+    return conn.execute("SELECT COUNT(*) FROM cards").fetchone()[0]
+
+
+def pragmas(conn) -> dict:
+    return {name: conn.execute(f"PRAGMA {name}").fetchone()[0] for name in card_import.LOAD_PRAGMAS}
+
+
+def test_imported_cards_load_through_the_repository(conn, tmp_path):
+    path = write_jsonl(tmp_path / "cards.jsonl", [SQUIRTLE, WARTORTLE])
+    counts, errors = load(conn, path, batch_size=1)
+    assert errors == []
+    assert counts["cards"] == 2 and counts["attacks"] == 3 and counts["attack_costs"] == 3
+
+    repo = CardRepository(str(tmp_path / "cards.db"))
+    try:
+        squirtle = CardFactory.create_card_from_db(repo, "Squirtle", "TS")
+        wartortle = CardFactory.create_card_from_db(repo, "Wartortle", "TS")
+    finally:
+        repo.conn.close()
+    assert (squirtle.health, squirtle.retreat_val) == (40, 1)
+    assert [attack.title for attack in squirtle.attacks] == ["Bubble", "Withdraw"]
+    (effect,) = squirtle.attacks[0].effects
+    assert (effect.effect_name, effect.value, effect.condition) == ("APPLY_STATUS", "PARALYZED", "ON_COIN_FLIP_HEADS")
+    assert wartortle.evolve_from == "Squirtle"
+
+
+def test_validation_errors_are_located_and_nothing_is_written(conn, tmp_path):
+    records = [
+        SQUIRTLE,
+        "{not json",
+        dict(SQUIRTLE, title="Psyduck", health=0, types=["PLASMA"]),
+        dict(WARTORTLE, evolves_from=[]),
+        dict(SQUIRTLE, attacks=[{"title": "Splash", "effects": [{"effect_name": "NOPE", "target": "SELF"}]}]),
+        {"title": "Charmander", "card_type": "MONSTER", "set_code": "BS", "stage": "BASIC", "health": 50},
+    ]
+    before = card_count(conn)
+    counts, errors = load(conn, write_jsonl(tmp_path / "cards.jsonl", records), batch_size=1)
+    assert card_count(conn) == before
+    assert not any(counts.values())
+    assert [message.split(":")[0] for message in errors] == [
+        "line 2",
+        "line 3 (Psyduck)", "line 3 (Psyduck)",
+        "line 4 (Wartortle)",
+        "line 5 (Squirtle)", "line 5 (Squirtle)",
+        "line 6 (Charmander)",
+    ]
+    assert "unknown mana type 'PLASMA'" in errors[2]
+    assert "unknown effect 'NOPE'" in errors[4]
+    assert "duplicate of Squirtle (TS) from line 1" in errors[5]
+    assert "from the database" in errors[6]
+
+
+def test_a_failed_write_rolls_back_and_restores_pragmas(conn, tmp_path):
+    before, settings = card_count(conn), pragmas(conn)
+
+    def cards():
+        yield from card_import.validate_file(write_jsonl(tmp_path / "cards.jsonl", [SQUIRTLE]), conn.cursor(), [])
+        raise RuntimeError("interrupted")
+
+    with pytest.raises(RuntimeError):
+        card_import.import_cards(conn, cards(), [], batch_size=1)
+    assert card_count(conn) == before
+    assert pragmas(conn) == settings
+
+    load(conn, write_jsonl(tmp_path / "more.jsonl", [SQUIRTLE]))
+    assert card_count(conn) == before + 1
+    assert pragmas(conn) == settings
+
+
+def test_csv_columns_are_parsed(conn, tmp_path):
+    path = tmp_path / "cards.csv"
+    path.write_text(
+        "title,card_type,set_code,stage,health,types,evolves_from,attacks\n"
+        'Wartortle,MONSTER,TS,STAGEONE,70,WATER,Squirtle,"[{""title"": ""Bite"", ""damage"": ""40""}]"\n',
+        encoding="utf-8",
+    )
+    errors = []
+    (card,) = card_import.validate_file(str(path), conn.cursor(), errors)
+    assert errors == []
+    assert (card["health"], card["types"], card["evolves_from"]) == (70, ["WATER"], ["Squirtle"])
+    assert card["attacks"][0][:2] == ("Bite", "40")
@@ -0,0 +1,108 @@
+"""
+Exact chance resolution: coin-flip outcomes carry the right probabilities, agree with
+sampled play, and positions that differ anywhere are never merged or cached together.
+"""
+import logging
+import random
+
+import pytest
+
+from core.game import GameState
+from models.monster import MonsterCard
+from models.player import PlayerUnit
+from simulation.chance import ChanceEvaluator, position_key
+from tests.conftest import CHARMANDER, CHARMELEON, monster_template
+
+logging.disable(logging.CRITICAL)
+
+BEEDRILL = monster_template("Beedrill", "BASIC", 80, [
+    ("Poison Sting", "10", {}, [{
+        "effect_name": "APPLY_STATUS", "target": "DEFENDING_MONSTER", "value": "POISONED",
+        "condition": "ON_COIN_FLIP_HEADS",
+    }]),
+], mana_type="GRASS")
+
+
+def build_game(defender_health: int = 50) -> GameState:
+    """Beedrill to attack a Charmander, each side with a Charmander on the bench."""
+    player, opponent = PlayerUnit("Player"), PlayerUnit("Opponent")
+    player.active_monster = MonsterCard(BEEDRILL)
+    opponent.active_monster = MonsterCard(CHARMANDER)
+    opponent.active_monster.health = defender_health
+    for owner in (player, opponent):
+        benched = MonsterCard(CHARMANDER)
+        owner.bench[benched.id] = benched
+        owner.prize = {slot: MonsterCard(CHARMANDER) for slot in (1, 2)}
+        owner.deck.extend([MonsterCard(CHARMANDER), MonsterCard(CHARMELEON)])
+    return GameState(player, opponent)
+
+
+def test_attack_then_poison_probabilities():
+    evaluator = ChanceEvaluator()
+    game_state = build_game(defender_health=20)
+    outcomes = evaluator.attack_outcomes(game_state, 0)
+    assert sorted((outcome.flips, outcome.probability) for outcome in outcomes) == [
+        ((False,), 0.5), ((True,), 0.5),
+    ]
+
+    # Heads poisons: 10 now and 10 when the defender's turn starts knocks out its 20 health.
+    analysis = evaluator.analyze_turn(game_state, attack_index=0)
+    assert analysis.expected_damage == pytest.approx(15)
+    assert analysis.knockout_probability == pytest.approx(0.5)
+    assert sum(outcome.probability for outcome in analysis.outcomes) == pytest.approx(1)
+    assert game_state.waiting_player.active_monster.health == 20
+
+
+def test_status_ticks_enumerate_every_flip():
+    game_state = build_game()
+    defender = game_state.waiting_player.active_monster
+    defender.special_conditions.update({"BURNED": True, "ASLEEP": True})
+    outcomes = ChanceEvaluator().turn_start_outcomes(game_state)
+    # Burn and sleep each recover on heads: four distinct positions.
+    assert sorted(outcome.probability for outcome in outcomes) == [0.25] * 4
+    analysis = ChanceEvaluator().analyze_turn(game_state)
+    assert analysis.expected_damage == pytest.approx(20)
+    assert analysis.knockout_probability == 0
+
+
+def test_exact_figures_match_sampled_play():
+    game_state = build_game(defender_health=20)
+    analysis = ChanceEvaluator().analyze_turn(game_state, attack_index=0)
+    knockouts = damage = 0
+    samples = 2000
+    for seed in range(samples):
+        random.seed(seed)
+        state = game_state.clone()
+        defender = state.waiting_player.active_monster
+        state.current_player.active_monster.use_attack(0, state, state.current_player, state.waiting_player, None)
+        state.check_knockouts()
+        ChanceEvaluator._end_turn(state)
+        damage += 20 - defender.health
+        knockouts += defender.health <= 0
+    assert knockouts / samples == pytest.approx(analysis.knockout_probability, abs=0.03)
+    assert damage / samples == pytest.approx(analysis.expected_damage, abs=0.3)
+
+
+def test_positions_with_equal_zone_sizes_are_not_confused():
+    evaluator = ChanceEvaluator()
+    first = build_game()
+    for card in (MonsterCard(CHARMANDER), MonsterCard(CHARMANDER)):
+        first.player2.hand[card.id] = card
+    # Same zone sizes, but the hand holds other cards and the deck is in another order.
+    second = first.clone()
+    hand = second.player2.hand
+    hand.pop(next(iter(hand)))
+    evolution = MonsterCard(CHARMELEON)
+    hand[evolution.id] = evolution
+    deck = second.player2.deck
+    cards = deck.values()
+    deck.clear()
+    deck.extend(reversed(cards))
+    assert position_key(first) != position_key(second)
+
+    # The second expansion must not be served the first one's cached state.
+    for game_state in (first, second):
+        (outcome,) = evaluator.turn_start_outcomes(game_state)
+        assert outcome.probability == 1
+        assert list(outcome.state.player2.hand) == list(game_state.player2.hand)
+        assert list(outcome.state.player2.deck) == list(game_state.player2.deck)
@@ -0,0 +1,68 @@
+"""
+`CommandParser`: the command grammar, batch parsing and the parse cache.
+"""
+import logging
+
+import pytest
+
+from controller.command_parser import CommandParser
+from controller.commands.attach_command import AttachCommand
+from controller.commands.mana_command import ManaCommand
+from controller.commands.pass_command import PassCommand
+
+logging.disable(logging.CRITICAL)
+
+
+def arguments(command) -> dict:
+    """A command's arguments, without the undo state it records when executed."""
+    return {name: value for name, value in vars(command).items() if not name.startswith("_")}
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("pass", ("PassCommand", {})),
+        ("PASS now", ("PassCommand", {})),
+        ("  attack   1 ", ("AttackCommand", {"attack_index": 1})),
+        ("retreat 4", ("RetreatCommand", {"promoted_card_id": 4})),
+        ("attach 3 4", ("AttachCommand", {"mana_card_id": 3, "target_id": 4})),
+        ("evolve 1 2", ("EvolveCommand", {"evo_card_id": 1, "base_card_id": 2})),
+        ("mana Fire 3", ("ManaCommand", {"target_id": None, "mana_type": "fire", "quantity": 3})),
+        ("mana 4 fire 3", ("ManaCommand", {"target_id": 4, "mana_type": "fire", "quantity": 3})),
+        ("", None),
+        ("jump 1", None),
+        ("activate", None),
+        ("attach 3", None),
+        ("activate x", None),
+        ("mana 1 fire x", None),
+    ],
+)
+def test_grammar(text, expected):
+    command = CommandParser().parse(text)
+    if expected is None:
+        assert command is None
+    else:
+        assert (type(command).__name__, arguments(command)) == expected
+
+
+def test_cached_parses_build_fresh_commands():
+    parser = CommandParser()
+    first, second = parser.parse("attach 3 4"), parser.parse("attach 3 4")
+    assert isinstance(second, AttachCommand) and first is not second
+    assert arguments(first) == arguments(second)
+
+
+def test_cache_evicts_least_recently_used():
+    parser = CommandParser(cache_size=2)
+    parser.parse("attack 0")
+    parser.parse("attack 1")
+    parser.parse("attack 0")
+    parser.parse("attack 2")
+    assert list(parser._cache) == ["attack 0", "attack 2"]
+
+
+def test_parse_many_keeps_order_and_failures():
+    commands = CommandParser().parse_many(["pass", "nonsense", "mana water 2"])
+    assert isinstance(commands[0], PassCommand)
+    assert commands[1] is None
+    assert isinstance(commands[2], ManaCommand)
@@ -0,0 +1,91 @@
+"""
+The deck zone: draw order, positional lookups through the lazy index, seeded shuffles,
+and copies that never share their ordering with the original.
+"""
+import copy
+import random
+
+from models.deck import DeckZone
+from models.mana import ManaCard
+from models.monster import MonsterCard
+from tests.conftest import CHARMANDER, FIRE_ENERGY
+
+
+def build_deck(size: int = 10) -> tuple[DeckZone, list]:
+    """A deck of alternating Charmander and Fire Energy, with the cards from bottom to top."""
+    cards = [MonsterCard(CHARMANDER) if i % 2 else ManaCard(FIRE_ENERGY) for i in range(size)]
+    return DeckZone(cards), cards
+
+
+def assert_positions(deck: DeckZone, top_first: list) -> None:
+    assert [deck.position(card.id) for card in top_first] == list(range(len(top_first)))
+
+
+def test_push_pop_and_pop_many_order():
+    deck, cards = build_deck()
+    assert list(deck) == [card.id for card in cards]
+    assert deck.pop() is cards[-1]
+    assert deck.pop_many(3) == [cards[-2], cards[-3], cards[-4]]
+    deck.push(cards[-1])
+    assert deck.peek(2) == [cards[-1], cards[5]]
+    assert deck.pop_many(100) == [cards[-1], *reversed(cards[:6])]
+    assert deck.pop() is None and deck.pop_many(1) == [] and not deck
+
+
+def test_remove_keeps_the_lazy_index_in_step():
+    deck, cards = build_deck()
+    # The index is only built on the first positional lookup.
+    assert deck._index is None
+    assert deck.position(cards[0].id) == 9
+    assert deck._index is not None
+
+    assert deck.remove(cards[4].id) is cards[4]
+    assert deck.remove(cards[4].id) is None
+    remaining = [card for card in cards if card is not cards[4]]
+    assert_positions(deck, remaining[::-1])
+    # Pushes, pops and replacements keep the built index current.
+    extra = ManaCard(FIRE_ENERGY)
+    deck.push(extra)
+    deck.pop_many(2)
+    deck[cards[0].id] = cards[0]
+    assert_positions(deck, remaining[-2::-1])
+    assert deck._index == {card_id: i for i, card_id in enumerate(deck)}
+    assert deck.position(extra.id) is None
+
+
+def test_peek_and_search_leave_the_deck_alone():
+    deck, cards = build_deck()
+    order = list(deck)
+    assert deck.peek(3) == cards[:-4:-1]
+    assert deck.peek(0) == []
+    monsters = deck.search(lambda card: isinstance(card, MonsterCard))
+    assert monsters == [card for card in reversed(cards) if isinstance(card, MonsterCard)]
+    assert list(deck) == order
+
+
+def test_shuffle_is_reproducible_under_a_seed():
+    deck, cards = build_deck(30)
+    same, _ = build_deck(0)
+    same.extend(cards)
+    deck.position(cards[0].id)
+    deck.shuffle(random.Random(7))
+    same.shuffle(random.Random(7))
+    assert list(deck) == list(same)
+    assert list(deck) != [card.id for card in cards]
+    # Shuffling drops the index; the next lookup rebuilds it for the new order.
+    assert deck._index is None
+    assert_positions(deck, [deck[card_id] for card_id in reversed(list(deck))])
+
+
+def test_copies_are_independent():
+    deck, cards = build_deck()
+    shallow = deck.copy()
+    deep = copy.deepcopy(deck)
+    deck.pop()
+    deck.shuffle(random.Random(1))
+    assert list(shallow) == list(deep) == [card.id for card in cards]
+    # A shallow copy shares the card objects; a deep copy does not.
+    assert shallow[cards[0].id] is cards[0]
+    assert deep[cards[0].id] is not cards[0] and deep[cards[0].id].id == cards[0].id
+    shallow.pop_many(5)
+    assert len(deep) == 10 and len(deck) == 9
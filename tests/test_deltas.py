@@ -0,0 +1,65 @@
+"""
+Delta-encoded state updates: a `DeltaView` that follows a `DeltaTracker`'s deltas must
+always hold the same state as one built from a fresh keyframe.
+"""
+import json
+import logging
+import random
+
+import pytest
+
+from core.deltas import DeltaTracker, DeltaView
+from simulation.headless import HeadlessController
+from tests.conftest import build_fire_game
+
+logging.disable(logging.CRITICAL)
+
+
+def view_of(view: DeltaView) -> tuple:
+    return (view.turn, view.current, view.winner, view.zones, view.counts, view.monsters, view.titles)
+
+
+def test_deltas_track_random_games():
+    for seed in range(4):
+        game_state = build_fire_game(seed)
+        controller = HeadlessController(game_state, rng=random.Random(seed))
+        tracker = DeltaTracker(game_state, keyframe_interval=10)
+        view = DeltaView()
+        view.apply(tracker.keyframe())
+        for _ in range(150):
+            if game_state.winner:
+                break
+            controller.step()
+            delta = tracker.update()
+            if delta is None:
+                continue
+            # Deltas travel as JSON.
+            view.apply(json.loads(json.dumps(delta.to_dict())))
+            reference = DeltaView()
+            reference.apply(DeltaTracker(game_state).keyframe())
+            assert view_of(view) == view_of(reference), f"seed {seed}, version {delta.version}"
+            assert view.version == tracker.version
+
+
+def test_versions_and_keyframes():
+    game_state = build_fire_game(0)
+    controller = HeadlessController(game_state, rng=random.Random(0))
+    tracker = DeltaTracker(game_state, keyframe_interval=3)
+    assert tracker.update() is None
+
+    deltas = []
+    while len(deltas) < 6:
+        controller.step()
+        delta = tracker.update()
+        if delta is not None:
+            deltas.append(delta)
+    assert [delta.version for delta in deltas] == [1, 2, 3, 4, 5, 6]
+    assert [delta.keyframe for delta in deltas] == [False, False, True, False, False, True]
+
+    # A view that misses a delta refuses the next one, and recovers from a keyframe.
+    view = DeltaView()
+    view.apply(deltas[2])
+    with pytest.raises(ValueError):
+        view.apply(deltas[4])
+    view.apply(deltas[5])
+    assert view.version == 6
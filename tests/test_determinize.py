@@ -0,0 +1,92 @@
+"""
+Determinizations: sampled worlds keep everything the observer can see and every zone
+size, only re-deal hidden cards, and are reproducible under a seeded RNG.
+"""
+import logging
+import random
+
+import pytest
+
+from models.player import PlayerUnit
+from simulation.determinize import Determinizer
+from simulation.headless import HeadlessController
+from tests.conftest import build_fire_game
+
+logging.disable(logging.CRITICAL)
+
+
+def build_midgame():
+    game_state = build_fire_game(4)
+    controller = HeadlessController(game_state, rng=random.Random(4))
+    for _ in range(12):
+        controller.step()
+    assert not game_state.winner
+    return game_state
+
+
+def visible(player: PlayerUnit) -> tuple:
+    """What anyone can see of a player: the field and discard pile, and every zone's size."""
+    field = [player.active_monster] + list(player.bench.values())
+    return (
+        [(monster.id, monster.health, sorted(monster.attached_mana)) for monster in field if monster],
+        list(player.discard),
+        len(player.hand), len(player.deck), sorted(slot for slot, card in player.prize.items() if card),
+    )
+
+
+def hidden(player: PlayerUnit, hand_hidden: bool) -> list:
+    """The IDs of a player's unseen cards, as one pool."""
+    prizes = [card.id for card in player.prize.values() if card]
+    return sorted(prizes + list(player.deck) + (list(player.hand) if hand_hidden else []))
+
+
+def zones(world) -> list:
+    return [
+        (list(player.hand), list(player.deck), {slot: card and card.id for slot, card in player.prize.items()})
+        for player in (world.player1, world.player2)
+    ]
+
+
+def test_samples_keep_what_the_observer_sees():
+    game_state = build_midgame()
+    observer, opponent = game_state.player1, game_state.player2
+    before = zones(game_state)
+    determinizer = Determinizer(game_state, observer, random.Random(0))
+
+    opponent_hands = set()
+    for world in determinizer.sample_batch(20):
+        assert visible(world.player1) == visible(observer)
+        assert visible(world.player2) == visible(opponent)
+        # The observer's own hand is known card for card.
+        assert list(world.player1.hand) == list(observer.hand)
+        # Hidden cards only move between the hidden zones of their owner.
+        assert hidden(world.player1, hand_hidden=False) == hidden(observer, hand_hidden=False)
+        assert hidden(world.player2, hand_hidden=True) == hidden(opponent, hand_hidden=True)
+        opponent_hands.add(tuple(sorted(world.player2.hand)))
+    assert len(opponent_hands) > 1
+    assert zones(game_state) == before
+
+
+def test_sampling_is_reproducible_under_a_seed():
+    game_state = build_midgame()
+    first = Determinizer(game_state, game_state.player2, random.Random(9)).sample_batch(5)
+    second = Determinizer(game_state, game_state.player2, random.Random(9)).sample_batch(5)
+    assert [zones(world) for world in first] == [zones(world) for world in second]
+    assert len({str(zones(world)) for world in first}) > 1
+
+    # Re-dealing a scratch world in place is just as reproducible.
+    redealt = []
+    for _ in range(2):
+        determinizer = Determinizer(game_state, game_state.player2, random.Random(9))
+        scratch = game_state.clone()
+        redealt.append([])
+        for _ in range(5):
+            determinizer.redeal(scratch)
+            redealt[-1].append(zones(scratch))
+    assert redealt[0] == redealt[1]
+    assert zones(game_state.clone()) != redealt[0][0]
+
+
+def test_rejects_a_foreign_observer():
+    with pytest.raises(ValueError):
+        Determinizer(build_fire_game(0), PlayerUnit("Stranger"))
@@ -0,0 +1,120 @@
+"""
+The training environment: the fixed action space, the legal-action mask and the
+observation layout, checked at every step of random episodes.
+"""
+import logging
+import random
+
+import numpy as np
+
+from core.enums import ActionType
+from simulation.env import (
+    ACTION_OFFSETS,
+    ACTION_SPACE_SIZE,
+    F_CARD,
+    F_HEALTH,
+    F_PRESENT,
+    H_CARD,
+    H_PRESENT,
+    HAND_SLOTS,
+    MAX_ATTACKS,
+    OBSERVATION_SHAPES,
+    Z_BENCH,
+    Z_DECK,
+    Z_DISCARD,
+    Z_HAND,
+    Z_PRIZES,
+    BlackstarEnv,
+)
+
+logging.disable(logging.CRITICAL)
+
+PLAYER_DECK = ["Charmander"] * 20 + ["Charmeleon"] * 10 + ["Pikachu"] * 30
+OPPONENT_DECK = ["Bulbasaur"] * 25 + ["Ivysaur"] * 15 + ["Clefairy"] * 20
+
+
+def addressable(env: BlackstarEnv, action) -> bool:
+    """Whether an action fits the fixed action space (its hand card and attack have slots)."""
+    if action.type == ActionType.ATTACK:
+        return action.subject < MAX_ATTACKS
+    if action.type in (ActionType.PASS, ActionType.RETREAT):
+        return True
+    return list(env.agent.hand).index(action.subject) < HAND_SLOTS
+
+
+def random_steps(env: BlackstarEnv, seed: int, steps: int):
+    """Yields after `reset()` and after every step of random legal actions."""
+    rng = random.Random(seed)
+    _, info = env.reset(seed=seed)
+    yield
+    for _ in range(steps):
+        legal = info["action_mask"].nonzero()[0]
+        _, _, terminated, truncated, info = env.step(legal[rng.randrange(len(legal))])
+        if terminated or truncated:
+            return
+        yield
+
+
+def test_action_space_blocks():
+    sizes = [
+        (ActionType.PASS, 1), (ActionType.ATTACK, 4), (ActionType.ACTIVATE, 16), (ActionType.BENCH, 16),
+        (ActionType.USE, 16), (ActionType.ATTACH, 96), (ActionType.EVOLVE, 96), (ActionType.RETREAT, 5),
+    ]
+    assert [ACTION_OFFSETS[action_type] for action_type, _ in sizes] == list(
+        np.cumsum([0] + [size for _, size in sizes[:-1]])
+    )
+    assert ACTION_SPACE_SIZE == 250
+
+
+def test_legal_actions_round_trip_through_the_mask(card_repo):
+    block_ends = sorted(ACTION_OFFSETS.values())[1:] + [ACTION_SPACE_SIZE]
+    block_of = dict(zip(sorted(ACTION_OFFSETS.values()), block_ends))
+    seen_types = set()
+    for seed in range(3):
+        env = BlackstarEnv(PLAYER_DECK, OPPONENT_DECK, card_repo=card_repo, max_turns=40)
+        for _ in random_steps(env, seed, 200):
+            legal = [action for action in env.game_state.get_legal_actions(env.agent) if addressable(env, action)]
+            indices = env.action_mask.nonzero()[0]
+            # One mask entry per addressable legal action, and nothing else.
+            assert len(indices) == len(legal) == len(set(legal))
+            assert {env.legal_action(index) for index in indices} == set(legal)
+            for index in indices:
+                action = env.legal_action(index)
+                offset = ACTION_OFFSETS[action.type]
+                assert offset <= index < block_of[offset]
+                seen_types.add(action.type)
+            assert env.legal_action(ACTION_SPACE_SIZE) is None
+    # The fixture decks hold no mana cards, so there is nothing to attach.
+    assert {ActionType.PASS, ActionType.ATTACK, ActionType.BENCH, ActionType.EVOLVE} <= seen_types
+
+
+def test_observation_layout(card_repo):
+    env = BlackstarEnv(PLAYER_DECK, OPPONENT_DECK, card_repo=card_repo, max_turns=40)
+    codes = env.encoder.card_codes
+    for _ in random_steps(env, 5, 60):
+        observation = env.observation
+        assert {key: array.shape for key, array in observation.items()} == OBSERVATION_SHAPES
+        assert all(array.dtype == np.float32 for array in observation.values())
+
+        opponent = env.game_state.player2
+        for side, owner in enumerate((env.agent, opponent)):
+            zones = observation["zones"][side]
+            assert zones[[Z_HAND, Z_DECK, Z_PRIZES, Z_DISCARD, Z_BENCH]].tolist() == [
+                len(owner.hand), len(owner.deck), len(owner.prize), len(owner.discard), len(owner.bench),
+            ]
+            field = observation["field"][side]
+            monsters = ([owner.active_monster] if owner.active_monster else [None]) + list(owner.bench.values())
+            for slot, monster in enumerate(monsters):
+                if monster is None:
+                    assert not field[slot].any()
+                    continue
+                assert field[slot, F_PRESENT] == 1
+                assert field[slot, F_CARD] == codes[monster.title]
+                assert field[slot, F_HEALTH] == monster.health
+            assert not field[len(monsters):].any()
+
+        hand = observation["hand"]
+        cards = list(env.agent.hand.values())[:HAND_SLOTS]
+        assert hand[:, H_PRESENT].sum() == len(cards)
+        assert hand[:len(cards), H_CARD].tolist() == [codes[card.title] for card in cards]
+        assert observation["turn"][0] == env.game_state.turn_count
@@ -0,0 +1,79 @@
+"""
+The game's event bus: subscribers see combat, knockout and start-of-turn events in the
+order the engine resolves them, with the damage actually dealt.
+"""
+import logging
+
+from core.coins import coin_source
+from core.events import AttackResolved, DamageApplied, Knockout, PrizeTaken, StatusTick
+from core.game import GameState
+from models.monster import MonsterCard
+from models.player import PlayerUnit
+from tests.conftest import CHARMANDER
+
+logging.disable(logging.CRITICAL)
+
+
+def build_game() -> GameState:
+    """Two active Charmander, the opponent's on 10 health with one on the bench."""
+    player, opponent = PlayerUnit("Player"), PlayerUnit("Opponent")
+    for owner in (player, opponent):
+        owner.active_monster = MonsterCard(CHARMANDER)
+        owner.prize = {slot: MonsterCard(CHARMANDER) for slot in (1, 2)}
+    benched = MonsterCard(CHARMANDER)
+    opponent.bench[benched.id] = benched
+    opponent.active_monster.health = 10
+    return GameState(player, opponent)
+
+
+def test_attack_and_knockout_events_in_order():
+    game_state = build_game()
+    player, opponent = game_state.player1, game_state.player2
+    attacker, defender = player.active_monster, opponent.active_monster
+    events = []
+    game_state.events.subscribe(events.append)
+
+    attacker.use_attack(0, game_state, player, opponent, controller=None)
+    game_state.check_knockouts()
+
+    assert [type(event) for event in events] == [DamageApplied, AttackResolved, Knockout, PrizeTaken]
+    damage, attack, knockout, prize = events
+    assert (damage.target, damage.amount, damage.source) == (defender, 10, "Scratch")
+    assert (attack.player, attack.attacker, attack.defender) == (player, attacker, defender)
+    assert (attack.attack_title, attack.damage, attack.damage_was_dealt) == ("Scratch", 10, True)
+    assert (knockout.player, knockout.monster) == (opponent, defender)
+    assert (prize.player, prize.prize_slot, prize.prizes_left) == (player, 1, 1)
+
+
+def test_status_ticks_report_the_damage_dealt():
+    game_state = build_game()
+    monster = game_state.player1.active_monster
+    monster.special_conditions.update({"POISONED": True, "BURNED": True})
+    # Immunity absorbs the first hit only: the poison.
+    monster.is_immune = True
+    events = []
+    game_state.events.subscribe(events.append, StatusTick, DamageApplied)
+
+    with coin_source(lambda: False):
+        game_state._start_new_turn_for_player()
+
+    assert [type(event) for event in events] == [StatusTick, DamageApplied, StatusTick]
+    poison, burn_damage, burn = events
+    assert (poison.status, poison.damage, poison.recovered) == ("POISONED", 0, False)
+    assert (burn_damage.amount, burn_damage.source) == (20, "BURNED")
+    assert (burn.status, burn.damage, burn.recovered) == ("BURNED", 20, False)
+    assert monster.health == 30
+
+
+def test_unsubscribed_types_are_not_built():
+    game_state = build_game()
+    knockouts = []
+    game_state.events.subscribe(knockouts.append, Knockout)
+    assert Knockout in game_state.events and AttackResolved not in game_state.events
+
+    game_state.events.unsubscribe(knockouts.append)
+    assert not game_state.events
+    player, opponent = game_state.player1, game_state.player2
+    player.active_monster.use_attack(0, game_state, player, opponent, controller=None)
+    game_state.check_knockouts()
+    assert knockouts == []
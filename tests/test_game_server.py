@@ -0,0 +1,146 @@
+"""
+The newline-delimited JSON game server, driven over a Unix socket.
+"""
+import asyncio
+import json
+import logging
+
+from netio.server import GameServer
+from tests.conftest import build_evolution_game, build_pikachu_game
+
+logging.disable(logging.CRITICAL)
+
+
+class Client:
+    def __init__(self, reader, writer):
+        self.reader, self.writer = reader, writer
+
+    @classmethod
+    async def connect(cls, path):
+        return cls(*await asyncio.open_unix_connection(path))
+
+    async def send(self, **request) -> dict:
+        self.writer.write(json.dumps(request).encode() + b"\n")
+        await self.writer.drain()
+        line = await self.reader.readline()
+        return json.loads(line) if line else None
+
+    def close(self):
+        self.writer.close()
+
+
+def run_with_server(tmp_path, scenario, game_factory=build_pikachu_game, **server_options):
+    async def main():
+        server = GameServer(game_factory, **server_options)
+        path = await server.start_unix(str(tmp_path / "games.sock"))
+        try:
+            await scenario(server, path)
+        finally:
+            await server.close()
+
+    asyncio.run(main())
+
+
+def test_plays_a_game_over_the_socket(tmp_path):
+    async def scenario(server, path):
+        client = await Client.connect(path)
+        created = await client.send(op="new", seed=1, id=7)
+        assert created["ok"] and created["id"] == 7
+        assert created["state"]["players"][0]["hand"] == [[0, "Pikachu"], [1, "Pikachu"], [2, "Pikachu"]]
+        assert created["state"]["players"][1]["hand"] == 3
+
+        played = await client.send(op="command", text=["activate 0", "bench 1", "attack 9", "fly"])
+        assert [result["ok"] for result in played["results"]] == [True, True, False, False]
+        assert len(played["state"]["players"][0]["bench"]) == 1
+
+        assert (await client.send(op="undo"))["state"]["players"][0]["bench"] == []
+        assert ["pass"] in (await client.send(op="legal"))["actions"]
+        assert (await client.send(op="command", text="pass"))["state"]["current"] == "Opponent"
+        assert not (await client.send(op="command", text="mana fire 3"))["ok"]
+        assert (await client.send(op="warp"))["error"] == "unknown op 'warp'"
+        client.close()
+
+    run_with_server(tmp_path, scenario)
+
+
+def test_delta_sessions_get_versioned_updates(tmp_path):
+    async def scenario(server, path):
+        client = await Client.connect(path)
+        created = await client.send(op="new", deltas=True)
+        assert "state" not in created and created["delta"]["key"]
+
+        played = await client.send(op="command", text="activate 0")
+        assert played["delta"]["v"] == 1 and not played["delta"]["key"]
+        assert ["move", 0, "p1.active"] in played["delta"]["ops"]
+        assert "delta" not in await client.send(op="command", text="activate 9")
+        assert (await client.send(op="state"))["delta"]["key"]
+        client.close()
+
+    run_with_server(tmp_path, scenario)
+
+
+def test_sessions_survive_reconnects_until_closed(tmp_path):
+    async def scenario(server, path):
+        first = await Client.connect(path)
+        session = (await first.send(op="new"))["session"]
+        await first.send(op="command", text="activate 0")
+        first.close()
+
+        second = await Client.connect(path)
+        assert not (await second.send(op="state"))["ok"]
+        attached = await second.send(op="attach", session=session)
+        assert attached["state"]["players"][0]["active"]["id"] == 0
+        assert (await second.send(op="close"))["ok"]
+        assert session not in server.sessions
+        assert not (await second.send(op="attach", session=session))["ok"]
+        second.close()
+
+    run_with_server(tmp_path, scenario)
+
+
+def test_idle_sessions_are_evicted_and_disconnected(tmp_path):
+    async def scenario(server, path):
+        client = await Client.connect(path)
+        await client.send(op="new", timeout=0.1)
+        kept = await Client.connect(path)
+        await kept.send(op="new")
+        assert len(server.sessions) == 2
+
+        await asyncio.sleep(0.4)
+        assert len(server.sessions) == 1
+        assert await client.reader.readline() == b""
+        client.close()
+        kept.close()
+
+    run_with_server(tmp_path, scenario, idle_timeout=5.0)
+
+
+def test_rejects_bad_requests_and_full_servers(tmp_path):
+    async def scenario(server, path):
+        client = await Client.connect(path)
+        client.writer.write(b"{not json\n")
+        assert not json.loads(await client.reader.readline())["ok"]
+        assert (await client.send(op="new"))["ok"]
+        assert (await client.send(op="new"))["error"] == "the server is full"
+        client.close()
+
+    run_with_server(tmp_path, scenario, max_sessions=1)
+
+
+def test_interleaved_sessions_number_new_cards_apart(tmp_path):
+    async def scenario(server, path):
+        first, second = await Client.connect(path), await Client.connect(path)
+        await first.send(op="new")
+        played = await first.send(op="command", text=["activate 0", "bench 1", "pass", "pass", "evolve 2 0"])
+        assert played["ok"]
+        assert (await second.send(op="new"))["state"]["players"][0]["hand"][0] == [0, "Charmander"]
+        assert (await first.send(op="command", text="evolve 3 1"))["ok"]
+
+        player = server.sessions["1"].game_state.player1
+        field = [player.active_monster.id, *player.bench]
+        assert field == [10, 11]
+        assert (await first.send(op="command", text="attach 4 11"))["ok"]
+        first.close()
+        second.close()
+
+    run_with_server(tmp_path, scenario, game_factory=build_evolution_game)
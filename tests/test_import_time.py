@@ -0,0 +1,62 @@
+"""
+Import-time budget for the engine, measured with `python -X importtime`.
+
+Simulation workers are short-lived and pay the import cost on every spawn, so the
+engine must stay cheap to import and must never pull in the terminal UI.
+"""
+import os
+import re
+import subprocess
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+
+# Modules a headless worker imports, and the UI modules they must not drag along.
+ENGINE_MODULES = ["core.game", "core.rules", "simulation.headless", "main"]
+UI_MODULES = ["colorful", "colorlog", "termio.view"]
+
+# Cumulative import time allowed per module, in microseconds. Measured at roughly
+# 55 ms for `main` (the heaviest) on a development machine; the budget leaves headroom
+# for slower CI hosts while still catching a heavy dependency creeping in.
+IMPORT_BUDGET_US = 120_000
+RUNS = 3
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \|\s+(\S+)\s*$")
+
+
+def _cumulative_import_us(module: str) -> int:
+    """Runs a fresh interpreter and returns the cumulative import time of `module`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SRC_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in reversed(result.stderr.splitlines()):
+        match = _IMPORTTIME_LINE.match(line)
+        if match and match.group(2) == module:
+            return int(match.group(1))
+    raise AssertionError(f"No importtime entry found for '{module}'.")
+
+
+def test_engine_imports_within_budget():
+    for module in ENGINE_MODULES:
+        # Take the best of a few runs to keep scheduler noise out of the measurement.
+        best = min(_cumulative_import_us(module) for _ in range(RUNS))
+        assert best < IMPORT_BUDGET_US, (
+            f"Importing '{module}' took {best / 1000:.1f} ms "
+            f"(budget {IMPORT_BUDGET_US / 1000:.0f} ms)."
+        )
+
+
+def test_engine_imports_without_ui_modules():
+    code = (
+        "import sys\n"
+        f"import {', '.join(ENGINE_MODULES)}\n"
+        f"print(','.join(m for m in {UI_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=SRC_DIR, capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "", f"UI modules imported: {result.stdout.strip()}"
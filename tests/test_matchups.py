@@ -0,0 +1,59 @@
+"""
+The matchup matrix: every pair is played on the pool and matches in-process play, a
+second run is served from the cache, and changing one deck replays only its pairs.
+"""
+from simulation.headless import play_game
+from simulation.matchups import compute_matrix, load_deck, matchup_key
+from simulation.pool import WarmPool
+from simulation.results import ResultStore
+
+DECKS = {
+    "fire": ["Charmander"] * 20 + ["Charmeleon"] * 10 + ["Pikachu"] * 30,
+    "grass": ["Bulbasaur"] * 25 + ["Ivysaur"] * 15 + ["Clefairy"] * 20,
+    "mixed": ["Charmander"] * 20 + ["Bulbasaur"] * 20 + ["Clefairy"] * 20,
+}
+
+
+def test_matrix_is_cached_and_updated_incrementally(card_repo, tmp_path):
+    options = {"games": 4, "seed": 3, "max_turns": 30, "chunk_size": 2}
+    with WarmPool(2, card_repo=card_repo, start_method="fork") as pool, \
+            ResultStore(str(tmp_path / "results.db")) as store:
+        first = compute_matrix(DECKS, store, pool=pool, **options)
+        assert len(first.computed) == 9
+        assert store.count() == 9 * 4
+
+        second = compute_matrix(DECKS, store, pool=pool, **options)
+        assert not second.computed
+        assert second.summaries.keys() == first.summaries.keys()
+        for pair, summary in first.summaries.items():
+            cached = second.summaries[pair]
+            assert (cached.games, cached.wins, cached.losses, cached.draws) == \
+                (summary.games, summary.wins, summary.losses, summary.draws)
+
+        changed = dict(DECKS, mixed=DECKS["mixed"][:-1] + ["Pikachu"])
+        third = compute_matrix(changed, store, pool=pool, **options)
+        mixed = list(changed).index("mixed")
+        assert third.computed == {pair for pair in third.summaries if mixed in pair}
+        assert len(third.computed) == 2 * 3 - 1
+
+    # Pool games are the same games played in-process.
+    results = [
+        play_game(DECKS["fire"], DECKS["grass"], card_repo=card_repo, seed=seed, max_turns=30) for seed in range(3, 7)
+    ]
+    summary = first.summaries[(0, 1)]
+    assert summary.wins == sum(result.winner == "Player" for result in results)
+    assert summary.losses == sum(result.winner == "Opponent" for result in results)
+    assert "9 pairs: 0 played, 9 cached" in second.format_table()
+
+
+def test_matchup_key_covers_decks_and_parameters():
+    key = matchup_key(DECKS["fire"], DECKS["grass"], 100, 0, 200)
+    assert key == matchup_key(list(reversed(DECKS["fire"])), DECKS["grass"], 100, 0, 200)
+    assert key != matchup_key(DECKS["grass"], DECKS["fire"], 100, 0, 200)
+    assert key != matchup_key(DECKS["fire"], DECKS["grass"], 100, 1, 200)
+
+
+def test_load_deck(tmp_path):
+    path = tmp_path / "fire.txt"
+    path.write_text("# Starter\n4 Charmander\n\nPikachu  # one copy\n2 Fire Energy\n")
+    assert load_deck(str(path)) == ["Charmander"] * 4 + ["Pikachu"] + ["Fire Energy"] * 2
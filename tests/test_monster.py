@@ -0,0 +1,40 @@
+"""
+Affordability lookups on monsters: the memoized masks must agree with `can_pay` on the
+mana actually available, including colorless costs and counts beyond the cap.
+"""
+import itertools
+
+from core.carddata import BS_FIRE_ENERGY_98, BS_WATER_ENERGY_102
+from core.enums import ManaType
+from models.mana import ManaCard, ManaTemplate
+from models.monster import MonsterCard, can_pay
+from tests.conftest import monster_template
+
+FIRE_ENERGY = ManaTemplate(**BS_FIRE_ENERGY_98)
+WATER_ENERGY = ManaTemplate(**BS_WATER_ENERGY_102)
+CHARIZARD = monster_template("Charizard", "STAGETWO", 120, [
+    ("Tail Smash", "20", {ManaType.COLORLESS: 3}),
+    ("Fire Spin", "100", {ManaType.FIRE: 4}),
+    ("Flamethrower", "50", {ManaType.FIRE: 1, ManaType.COLORLESS: 2}),
+], evolve_from="Charmeleon", retreat_val=2)
+
+
+def test_affordability_matches_can_pay():
+    monster = MonsterCard(CHARIZARD)
+    # Up to seven of each energy goes past the cap of 4 (Fire Spin's total cost).
+    for fire, water, pooled_water in itertools.product(range(8), range(8), range(3)):
+        monster.attached_mana = {}
+        for template, count in ((FIRE_ENERGY, fire), (WATER_ENERGY, water)):
+            for _ in range(count):
+                card = ManaCard(template)
+                monster.attached_mana[card.id] = card
+        monster.mana_pool[ManaType.WATER] = pooled_water
+
+        available = monster.total_mana
+        for i, attack in enumerate(CHARIZARD.attacks):
+            assert monster.can_afford_attack(i) == can_pay(available, attack.cost), (fire, water, i)
+        assert monster.can_afford_retreat() == can_pay(available, {ManaType.COLORLESS: 2})
+        assert monster.has_mana(CHARIZARD.attacks[2].cost) == monster.can_afford_attack(2)
+
+    # Capping keeps the memo to the signatures below the cap: at most 5 fire x 5 water.
+    assert len(CHARIZARD._affordability) <= 25
@@ -0,0 +1,87 @@
+"""
+Perft reference counts for the rules engine.
+
+Each test walks every legal action sequence of one turn from a fixed position and
+compares the number of leaves with a checked-in count. A change to move generation or
+to a command that alters what is legal afterwards shows up as a mismatch; use
+`Perft.divide` to find the root action whose subtree changed.
+"""
+import logging
+
+from core.enums import ManaType
+from core.game import GameState
+from models.mana import ManaCard
+from models.monster import MonsterCard
+from models.player import PlayerUnit
+from simulation.chance import position_key
+from simulation.perft import Perft, perft
+from tests.conftest import CHARMANDER, CHARMELEON, FIRE_ENERGY, monster_template
+
+logging.disable(logging.CRITICAL)
+
+# Leaf counts by depth for `build_position()`.
+REFERENCE_COUNTS = {1: 9, 2: 48, 3: 184, 4: 496}
+
+# Unlike the shared Pikachu, this one's attack can hurt itself on a coin flip.
+PIKACHU = monster_template("Pikachu", "BASIC", 40, [
+    ("Thunder Jolt", "30", {ManaType.COLORLESS: 1}, [{
+        "effect_name": "DAMAGE_SELF", "target": "SELF", "value": "10",
+        "condition": "ON_COIN_FLIP_TAILS",
+    }]),
+], mana_type="LIGHTNING")
+
+
+def build_position() -> GameState:
+    """
+    Player one to move on turn 3: an active Charmander with one Fire Energy and a
+    benched Pikachu, holding a Charmeleon, a Pikachu and two Fire Energy.
+    """
+    player, opponent = PlayerUnit("Player"), PlayerUnit("Opponent")
+    player.active_monster = MonsterCard(CHARMANDER)
+    attached = ManaCard(FIRE_ENERGY)
+    player.active_monster.attached_mana[attached.id] = attached
+    benched = MonsterCard(PIKACHU)
+    player.bench[benched.id] = benched
+    hand = [MonsterCard(CHARMELEON), MonsterCard(PIKACHU), ManaCard(FIRE_ENERGY), ManaCard(FIRE_ENERGY)]
+    for card in hand:
+        player.hand[card.id] = card
+    player.deck.extend([MonsterCard(CHARMANDER), ManaCard(FIRE_ENERGY)])
+    opponent.active_monster = MonsterCard(PIKACHU)
+    opponent.deck.push(MonsterCard(PIKACHU))
+
+    game_state = GameState(player, opponent)
+    game_state.turn_count = 3
+    return game_state
+
+
+def test_perft_reference_counts():
+    for depth, expected in REFERENCE_COUNTS.items():
+        assert perft(build_position(), depth) == expected, f"depth {depth}"
+
+
+def test_divide_sums_to_perft_and_leaves_root_untouched():
+    game_state = build_position()
+    before = position_key(game_state)
+    counts = Perft().divide(game_state, 3)
+    assert sum(counts.values()) == REFERENCE_COUNTS[3]
+    assert len(counts) == REFERENCE_COUNTS[1]
+    assert position_key(game_state) == before
+
+
+def test_run_matches_count_and_counts_every_node():
+    result = Perft(seed=1).run(build_position(), 3)
+    assert result.leaves == Perft(seed=1).count(build_position(), 3) == REFERENCE_COUNTS[3]
+    assert result.nodes > result.leaves
+
+
+def test_in_place_walk_matches_and_restores_the_position():
+    # Executing and undoing commands must visit exactly the positions cloning does.
+    game_state = build_position()
+    before = position_key(game_state)
+    hand_order = list(game_state.player1.hand)
+    bench_order = list(game_state.player1.bench)
+    for depth, expected in REFERENCE_COUNTS.items():
+        assert perft(game_state, depth, in_place=True) == expected, f"depth {depth}"
+    assert position_key(game_state) == before
+    assert list(game_state.player1.hand) == hand_order
+    assert list(game_state.player1.bench) == bench_order
@@ -0,0 +1,36 @@
+"""
+The warm worker pool: batches of games played on pool workers match the same games
+played in-process, and job failures come back as exceptions on the futures.
+"""
+import pytest
+
+from simulation.headless import play_game
+from simulation.pool import WarmPool
+
+PLAYER_DECK = ["Charmander"] * 20 + ["Charmeleon"] * 10 + ["Pikachu"] * 30
+OPPONENT_DECK = ["Bulbasaur"] * 25 + ["Ivysaur"] * 15 + ["Clefairy"] * 20
+
+
+def outcome(result) -> tuple:
+    return (result.winner, result.turns, result.prizes_left)
+
+
+@pytest.mark.parametrize("start_method", ["fork", "forkserver"])
+def test_pool_games_match_in_process_games(card_repo, start_method):
+    with WarmPool(2, card_repo=card_repo, warm_decks=[PLAYER_DECK], start_method=start_method) as pool:
+        results = pool.play(PLAYER_DECK, OPPONENT_DECK, games=6, seed=10, max_turns=30, chunk_size=2)
+    expected = [
+        play_game(PLAYER_DECK, OPPONENT_DECK, card_repo=card_repo, seed=seed, max_turns=30)
+        for seed in range(10, 16)
+    ]
+    assert [outcome(result) for result in results] == [outcome(result) for result in expected]
+
+
+def test_job_errors_and_close(card_repo):
+    pool = WarmPool(1, card_repo=card_repo, start_method="fork")
+    assert pool.submit(sorted, [3, 1, 2]).result(timeout=5) == [1, 2, 3]
+    with pytest.raises(RuntimeError, match="ZeroDivisionError"):
+        pool.submit(divmod, 1, 0).result(timeout=5)
+    pool.close()
+    with pytest.raises(RuntimeError, match="closed"):
+        pool.submit(sorted, [])
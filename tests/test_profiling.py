@@ -0,0 +1,83 @@
+"""
+The opt-in profiler: with it enabled, a scripted game records database loads, legal
+action generation, commands, utility card effects and knockouts; with it
+disabled, nothing is recorded.
+"""
+import logging
+
+import pytest
+from fixtures import FIXTURE_SET_CODE
+
+from controller.script_runner import Script, ScriptRunner
+from core.card_factory import CardFactory
+from core.game import GameState
+from core.profiling import PROFILER
+from models.monster import MonsterCard
+from models.player import PlayerUnit
+from models.utility import UtilityCard, UtilityTemplate
+
+logging.disable(logging.CRITICAL)
+
+BILL = UtilityTemplate(
+    title="Bill", description="Draw 2 cards.",
+    effects=[{"effect_name": "draw_from_deck", "target": "SELF", "value": 2}],
+)
+
+SCRIPT = """
+activate 0
+use 1
+expect current.hand 2
+pass
+pass
+attack 0
+expect winner player
+"""
+
+
+@pytest.fixture
+def profiler():
+    PROFILER.reset()
+    yield PROFILER
+    PROFILER.disable()
+    PROFILER.reset()
+
+
+def game_factory(card_repo):
+    def build(seed=None) -> GameState:
+        """The player holds a Pikachu and Bill; the opponent's lone Pikachu has 10 HP left."""
+        pikachu = CardFactory.create_card_from_db(card_repo, "Pikachu", FIXTURE_SET_CODE)
+        player, opponent = PlayerUnit("Player"), PlayerUnit("Opponent")
+        for card in (MonsterCard(pikachu), UtilityCard(BILL)):
+            player.hand[card.id] = card
+        player.deck.extend([MonsterCard(pikachu), MonsterCard(pikachu)])
+        opponent.active_monster = MonsterCard(pikachu)
+        opponent.active_monster.health = 10
+        return GameState(player, opponent)
+
+    return build
+
+
+def test_records_every_phase_while_enabled(profiler, card_repo):
+    profiler.enable()
+    result = ScriptRunner(game_factory(card_repo)).run(Script.from_lines(SCRIPT.splitlines()))
+    assert result.ok, result.format_summary()
+
+    calls = {key: stats["calls"] for key, stats in profiler.snapshot().items()}
+    assert calls["db.load_card"] == calls["db.build_template"] == 1
+    assert calls["command.ActivateCommand"] == calls["command.UseCommand"] == 1
+    assert calls["command.PassCommand"] == 2 and calls["command.AttackCommand"] == 1
+    assert calls["effect.draw_from_deck"] == 1
+    assert calls["knockout"] == 1
+    # Every command is checked against the legal actions, one generator call each.
+    assert {key for key in calls if key.startswith("legal_actions.")} == {
+        "legal_actions.ATTACK", "legal_actions.ACTIVATE", "legal_actions.ATTACH", "legal_actions.BENCH",
+        "legal_actions.EVOLVE", "legal_actions.RETREAT", "legal_actions.USE",
+    }
+    assert calls["legal_actions.USE"] == 5
+    assert all(stats["total_ms"] >= 0 for stats in profiler.snapshot().values())
+
+
+def test_records_nothing_while_disabled(profiler, card_repo):
+    result = ScriptRunner(game_factory(card_repo)).run(Script.from_lines(SCRIPT.splitlines()))
+    assert result.ok, result.format_summary()
+    assert profiler.snapshot() == {}
@@ -0,0 +1,102 @@
+"""
+The simulation result store: records added from any thread are written in batches,
+survive reopening the database, and are summarized per matchup and per card.
+"""
+import random
+import sqlite3
+import threading
+
+import pytest
+
+from core.game import GameState
+from models.mana import ManaCard
+from models.monster import MonsterCard
+from models.player import PlayerUnit
+from simulation.headless import HeadlessController, prepare_player
+from simulation.results import (
+    OPPONENT_WINS,
+    PLAYER_WINS,
+    CardStatsRecorder,
+    GameRecord,
+    ResultStore,
+    deck_hash,
+)
+from tests.conftest import CHARMANDER, FIRE_ENERGY
+
+FIRE_DECK = ["Charmander"] * 30 + ["Fire Energy"] * 30
+WATER_DECK = ["Squirtle"] * 30 + ["Water Energy"] * 30
+
+
+def record(seed: int, winner: int, turns: int, stats=None) -> GameRecord:
+    return GameRecord(FIRE_DECK, WATER_DECK, seed, winner, turns, (6 - winner, winner), stats)
+
+
+def test_batched_writes_and_matchup_queries(tmp_path):
+    db_path = str(tmp_path / "results.db")
+    with ResultStore(db_path, batch_size=100, flush_interval=0.05) as store:
+        # Producers on several threads share one store.
+        batches = [
+            [record(seed, seed % 3, 10 + seed % 7) for seed in range(start, start + 250)]
+            for start in range(0, 1000, 250)
+        ]
+        threads = [threading.Thread(target=store.add_many, args=(batch,)) for batch in batches]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        store.add(record(1000, PLAYER_WINS, 5, {(PLAYER_WINS, "Charmander"): [4, 80, 1]}))
+        store.flush()
+        assert store.count() == 1001
+        assert 11 <= store.batches_written < 1001
+
+        summary = store.matchup(FIRE_DECK, WATER_DECK)
+        assert (summary.games, summary.wins, summary.losses, summary.draws) == (1001, 334, 333, 334)
+        assert store.matchup(WATER_DECK, FIRE_DECK).games == 0
+        assert store.card_summary("Charmander") == {"games": 1, "attacks": 4, "damage": 80, "knocked_out": 1}
+
+    # Committed results survive reopening, and new games get fresh IDs.
+    with ResultStore(db_path) as store:
+        store.add(record(2000, OPPONENT_WINS, 9))
+        store.flush()
+        assert store.count() == 1002
+    conn = sqlite3.connect(db_path)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("SELECT cards FROM decks WHERE hash = ?", (deck_hash(FIRE_DECK),)).fetchone()
+    conn.close()
+
+
+def test_deck_hash_ignores_card_order():
+    assert deck_hash(FIRE_DECK) == deck_hash(list(reversed(FIRE_DECK)))
+    assert deck_hash(FIRE_DECK) != deck_hash(WATER_DECK)
+
+
+def test_writer_errors_surface(tmp_path):
+    store = ResultStore(str(tmp_path / "results.db"), flush_interval=0.01)
+    store.add(GameRecord(FIRE_DECK, WATER_DECK, 0, PLAYER_WINS, 5, None))  # no prize counts
+    with pytest.raises(RuntimeError, match="writer failed"):
+        store.flush()
+    with pytest.raises(RuntimeError):
+        store.close()
+
+
+def test_card_stats_recorder_counts_attacks_and_knockouts():
+    random.seed(0)
+    players = []
+    for title in ("Player", "Opponent"):
+        player = PlayerUnit(title)
+        for template in [CHARMANDER] * 20:
+            player.add_to_field(MonsterCard(template))
+        for _ in range(10):
+            player.add_to_field(ManaCard(FIRE_ENERGY))
+        prepare_player(player)
+        players.append(player)
+    game_state = GameState(*players)
+    game_state._start_new_turn_for_player()
+    recorder = CardStatsRecorder(game_state)
+    HeadlessController(game_state, rng=random.Random(0)).play(max_turns=60)
+
+    assert recorder.stats
+    knockouts = sum(counts[2] for counts in recorder.stats.values())
+    prizes_taken = 12 - len(game_state.player1.prize) - len(game_state.player2.prize)
+    assert knockouts == prizes_taken
+    assert all(side in (PLAYER_WINS, OPPONENT_WINS) for side, _ in recorder.stats)
@@ -0,0 +1,41 @@
+"""
+Legal action generation checked against the rules' own validators, over positions
+reached in random games.
+"""
+import logging
+import random
+
+from core.actions import Action
+from core.enums import ActionType
+from core.rules import RulesEngine
+from simulation.headless import HeadlessController
+from tests.conftest import build_fire_game
+
+logging.disable(logging.CRITICAL)
+
+
+def nested_evolve_actions(game_state, player) -> list:
+    """Every hand card against every monster in play, as `_validate_evolve_action` judges them."""
+    monsters = ([player.active_monster] if player.active_monster else []) + list(player.bench.values())
+    return [
+        Action(ActionType.EVOLVE, evo_card.id, base_monster.id)
+        for evo_card in player.hand.values()
+        for base_monster in monsters
+        if RulesEngine._validate_evolve_action(game_state, player, evo_card.id, base_monster.id)[0]
+    ]
+
+
+def test_evolve_actions_match_the_nested_loop():
+    evolutions = 0
+    for seed in range(6):
+        game_state = build_fire_game(seed)
+        controller = HeadlessController(game_state, rng=random.Random(seed))
+        for _ in range(120):
+            if game_state.winner:
+                break
+            for player in (game_state.player1, game_state.player2):
+                expected = nested_evolve_actions(game_state, player)
+                assert RulesEngine._get_evolve_actions(game_state, player) == expected
+                evolutions += len(expected)
+            controller.step()
+    assert evolutions
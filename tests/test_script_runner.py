@@ -0,0 +1,71 @@
+"""
+Command scripts played by `ScriptRunner`: commands as typed in the terminal, `undo`,
+and `expect` checkpoints, against a fixed two-player position.
+"""
+import logging
+
+import pytest
+
+from controller.script_runner import Script, ScriptError, ScriptRunner
+from tests.conftest import build_evolution_game, build_pikachu_game
+
+logging.disable(logging.CRITICAL)
+
+SCRIPT = """
+seed 3
+expect turn 1
+activate 0        # Player's Pikachu
+bench 1
+expect current.bench 1
+undo
+expect current.bench 0
+pass
+expect current opponent
+activate 3
+attack 0
+expect player1.health 30
+expect waiting.active pikachu
+"""
+
+# The evolved Charmeleon is a new card, numbered after the ten dealt ones.
+EVOLVE_SCRIPT = """
+activate 0
+evolve 2 0
+attach 4 10
+expect current.active charmeleon
+"""
+
+
+def test_script_plays_commands_and_checkpoints():
+    result = ScriptRunner(build_pikachu_game).run(Script.from_lines(SCRIPT.splitlines()))
+    assert result.ok, result.format_summary()
+    assert (result.games, result.commands, result.checkpoints) == (1, 6, 6)
+
+
+def test_replays_start_from_the_same_opening():
+    result = ScriptRunner(build_pikachu_game).run(Script.from_lines(SCRIPT.splitlines()), games=50)
+    assert result.ok, result.format_summary()
+    assert (result.games, result.commands, result.checkpoints) == (50, 300, 300)
+
+
+def test_replays_number_cards_created_during_play_alike():
+    result = ScriptRunner(build_evolution_game).run(Script.from_lines(EVOLVE_SCRIPT.splitlines()), games=3)
+    assert result.ok, result.format_summary()
+    assert (result.games, result.commands, result.checkpoints) == (3, 9, 3)
+
+
+def test_rejected_commands_and_failed_checkpoints_are_reported_by_line():
+    script = Script.from_lines(["activate 9", "jump", "activate 0", "expect current.hand 3"])
+    result = ScriptRunner(build_pikachu_game).run(script)
+    assert not result.ok
+    assert [failure.split(":")[0] for failure in result.failures] == ["line 1", "line 2", "line 4"]
+    assert result.commands == 1
+
+    strict = ScriptRunner(build_pikachu_game, strict=True).run(script)
+    assert len(strict.failures) == 1 and strict.commands == 0
+
+
+@pytest.mark.parametrize("lines", [["expect hand 3"], ["expect turn"], ["pass", "seed 1"]])
+def test_malformed_directives_raise(lines):
+    with pytest.raises(ScriptError):
+        Script.from_lines(lines)
@@ -0,0 +1,46 @@
+"""
+The shared card catalog: it serves the same card data as the database it was loaded
+from, and worker processes read it by attaching to the segment by name.
+"""
+import multiprocessing
+
+import pytest
+
+from fixtures import FIXTURE_SET_CODE, FIXTURE_TITLES
+
+from core.card_factory import CardFactory
+from database.shared_catalog import SharedCatalog
+
+
+def _worker_template(name: str, title: str, results) -> None:
+    with SharedCatalog.attach(name) as catalog:
+        template = CardFactory.create_card_from_db(catalog, title, FIXTURE_SET_CODE)
+        results.put((len(catalog), template.title, template.health, [attack.title for attack in template.attacks]))
+
+
+def test_catalog_matches_repository(card_repo):
+    with SharedCatalog.create(card_repo) as catalog:
+        assert len(catalog) == len(FIXTURE_TITLES)
+        assert catalog.list_cards() == card_repo.list_cards()
+        assert catalog.get_card_data_as_kwargs("Missingno", FIXTURE_SET_CODE) is None
+        for title in FIXTURE_TITLES:
+            expected = card_repo.get_card_data_as_kwargs(title, FIXTURE_SET_CODE)
+            actual = catalog.get_card_data_as_kwargs(title, FIXTURE_SET_CODE)
+            expected["attacks"] = [dict(attack) for attack in expected["attacks"]]
+            assert actual == expected, title
+
+
+def test_workers_attach_by_name(card_repo):
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    with SharedCatalog.create(card_repo) as catalog:
+        worker = context.Process(target=_worker_template, args=(catalog.name, "Charizard", results))
+        worker.start()
+        worker.join(10)
+        assert worker.exitcode == 0
+        assert results.get(timeout=1) == (len(FIXTURE_TITLES), "Charizard", 120, ["Fire Spin"])
+        # The worker closing its view leaves the segment to its owner.
+        assert catalog.get_card_data_as_kwargs("Charizard", FIXTURE_SET_CODE)["health"] == 120
+        name = catalog.name
+    with pytest.raises(FileNotFoundError):
+        SharedCatalog.attach(name)
@@ -0,0 +1,78 @@
+"""
+Vectorized environments: games stepped in one process and games stepped by workers
+over shared memory produce the same batches, episode resets included.
+"""
+import logging
+import multiprocessing
+import random
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pytest
+
+from simulation import vec_env as vec_env_module
+from simulation.vec_env import SubprocVectorEnv, SyncVectorEnv
+
+logging.disable(logging.CRITICAL)
+
+PLAYER_DECK = ["Charmander"] * 20 + ["Charmeleon"] * 10 + ["Pikachu"] * 30
+OPPONENT_DECK = ["Bulbasaur"] * 25 + ["Ivysaur"] * 15 + ["Clefairy"] * 20
+NUM_ENVS = 3
+
+
+def rollout(vec_env, steps: int) -> list:
+    """Plays random legal actions, returning copies of every batch."""
+    rng = random.Random(0)
+    observation, info = vec_env.reset(seed=11)
+    batches = [({key: array.copy() for key, array in observation.items()}, info["action_mask"].copy())]
+    for _ in range(steps):
+        actions = [rng.choice(mask.nonzero()[0]) for mask in info["action_mask"]]
+        observation, reward, terminated, truncated, info = vec_env.step(actions)
+        batches.append((
+            {key: array.copy() for key, array in observation.items()},
+            info["action_mask"].copy(), reward.copy(), terminated.copy(), truncated.copy(),
+        ))
+    return batches
+
+
+def test_sync_and_subprocess_batches_match(card_repo, fixture_db_path):
+    # Truncating after a few turns makes every row reset several times.
+    options = {"num_envs": NUM_ENVS, "max_turns": 4}
+    sync_env = SyncVectorEnv(PLAYER_DECK, OPPONENT_DECK, card_repo=card_repo, **options)
+    expected = rollout(sync_env, 40)
+    sync_env.close()
+    # A repository passed in belongs to the caller and stays open.
+    assert card_repo.list_cards()
+
+    # One worker keeps the row split, and so the shared random stream, of the in-process run.
+    with SubprocVectorEnv(
+        PLAYER_DECK, OPPONENT_DECK, num_workers=1, db_path=fixture_db_path, start_method="fork", **options
+    ) as subproc_env:
+        actual = rollout(subproc_env, 40)
+
+    resets = sum(int(batch[3].sum() + batch[4].sum()) for batch in expected[1:])
+    assert resets >= NUM_ENVS
+    for step, (want, got) in enumerate(zip(expected, actual)):
+        for key in want[0]:
+            np.testing.assert_array_equal(want[0][key], got[0][key], err_msg=f"step {step}, {key}")
+        for want_array, got_array in zip(want[1:], got[1:]):
+            np.testing.assert_array_equal(want_array, got_array, err_msg=f"step {step}")
+
+
+def test_a_failed_start_frees_the_workers_and_shared_memory(monkeypatch, tmp_path):
+    blocks = []
+
+    class RecordedSharedMemory(SharedMemory):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            blocks.append(self.name)
+
+    monkeypatch.setattr(vec_env_module, "SharedMemory", RecordedSharedMemory)
+    with pytest.raises(RuntimeError, match="worker failed"):
+        SubprocVectorEnv(
+            PLAYER_DECK, OPPONENT_DECK, num_envs=2, num_workers=2,
+            db_path=str(tmp_path / "missing.db"), start_method="fork",
+        )
+    assert not multiprocessing.active_children()
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=blocks[0])
@@ -0,0 +1,111 @@
+"""
+Terminal rendering: on a terminal only the lines that changed are rewritten, in one
+write per frame; other streams get every frame in full.
+"""
+import io
+import logging
+import os
+import signal
+
+import pytest
+
+from models.monster import MonsterCard
+from termio.view import TerminalView
+from tests.conftest import CHARMANDER, build_fire_game
+
+logging.disable(logging.CRITICAL)
+
+TERMINAL_SIZE = os.terminal_size((100, 40))
+
+
+class RecordingStream(io.StringIO):
+    """A text stream that keeps every write separately."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes = []
+
+    def write(self, text: str) -> int:
+        self.writes.append(text)
+        return super().write(text)
+
+
+class FakeTerminal(RecordingStream):
+    """A recording stream that claims to be a terminal (of `TERMINAL_SIZE`, see `terminal`)."""
+
+    def isatty(self) -> bool:
+        return True
+
+    def fileno(self) -> int:
+        return 1
+
+
+@pytest.fixture
+def terminal(monkeypatch):
+    monkeypatch.setenv("TERM", "xterm")
+    monkeypatch.setattr("termio.view.os.get_terminal_size", lambda fd=None: TERMINAL_SIZE)
+    handler = signal.getsignal(signal.SIGWINCH)
+    view = TerminalView(FakeTerminal())
+    yield view
+    view.close()
+    assert signal.getsignal(signal.SIGWINCH) == handler
+
+
+def build_board():
+    """A first-turn game with an active Charmander on each side."""
+    game_state = build_fire_game(2)
+    for player in (game_state.player1, game_state.player2):
+        player.active_monster = MonsterCard(CHARMANDER)
+    return game_state
+
+
+def test_an_unchanged_board_writes_nothing(terminal):
+    game_state = build_board()
+    terminal.redraw_screen(game_state)
+    assert len(terminal.stream.writes) == 1
+    assert terminal.stream.writes[0].startswith("\x1b[r\x1b[2J")
+    terminal.redraw_screen(game_state)
+    assert len(terminal.stream.writes) == 1
+
+
+def test_a_health_change_rewrites_only_its_row(terminal):
+    game_state = build_board()
+    terminal.redraw_screen(game_state)
+    before, rows = terminal._frame, terminal._frame_rows
+
+    game_state.waiting_player.active_monster.health -= 20
+    after = terminal.compose_frame(game_state)
+    (changed,) = [index for index, (old, new) in enumerate(zip(before, after)) if old != new]
+    assert "30/ 50" in after[changed]
+
+    terminal.redraw_screen(game_state)
+    assert terminal.stream.writes[1:] == [f"\x1b7\x1b[{rows[changed]};1H{after[changed]}\x1b[K\x1b8"]
+
+
+def test_a_resize_repaints_the_board(terminal):
+    game_state = build_board()
+    terminal.redraw_screen(game_state)
+    terminal._on_resize(signal.SIGWINCH, None)
+    terminal.redraw_screen(game_state)
+    assert len(terminal.stream.writes) == 2
+    assert terminal.stream.writes[1].startswith("\x1b[r\x1b[2J")
+
+
+def test_other_streams_get_the_full_frame_in_one_write():
+    game_state = build_board()
+    view = TerminalView(RecordingStream())
+    assert not view.interactive
+    for _ in range(2):
+        view.redraw_screen(game_state)
+    frame = "\n" + "\n".join(view.compose_frame(game_state)) + "\n"
+    assert view.stream.writes == [frame, frame]
+
+
+def test_close_resets_the_scroll_region(terminal):
+    terminal.redraw_screen(build_board())
+    terminal.close()
+    assert terminal.stream.writes[-1] == f"\x1b[r\x1b[{TERMINAL_SIZE.lines};1H\n"
+    # Closing again writes nothing more.
+    terminal.close()
+    assert terminal.stream.writes[-1] == f"\x1b[r\x1b[{TERMINAL_SIZE.lines};1H\n"
+    assert len(terminal.stream.writes) == 2